@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Batch result aggregation memory benchmark.
+
+Feeds a synthetic OpenAI batch output file (--lines result lines) to
+BatchResults in 64 KiB chunks, the way a streamed download arrives, and
+compares its peak allocation with reading the whole file and parsing every
+line into a list. The streaming path keeps one partial line and per-model
+token sums, so its peak must stay within a fixed budget at any file size;
+that is checked at --lines and at a tenth of it.
+
+Run: python src/benchmarks/batch_results.py [--lines 50000]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from ward.instrumentation.batch import BatchResults
+
+CHUNK_SIZE = 64 * 1024
+# Peak bytes the streaming path may allocate, independent of file size
+# (the chunk itself plus the partial line carried between chunks).
+PEAK_BUDGET_BYTES = 4 * CHUNK_SIZE
+MODELS = ("gpt-4o-mini", "gpt-4o")
+
+
+def build_file(lines):
+    text = "The quarterly report shows steady growth across every region. " * 8
+    rows = []
+    for i in range(lines):
+        body = {
+            "id": f"chatcmpl-{i}", "object": "chat.completion", "model": MODELS[i % 2],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 200, "completion_tokens": 120, "total_tokens": 320},
+        }
+        rows.append(json.dumps({"id": f"batch_req_{i}", "custom_id": f"request-{i}", "error": None,
+                                "response": {"status_code": 200, "request_id": f"req_{i}", "body": body}}))
+    return ("\n".join(rows) + "\n").encode()
+
+
+def measure(fn):
+    """Return (peak bytes allocated, seconds, result) for one call of fn."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - base, elapsed, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=50000)
+    args = parser.parse_args(argv)
+
+    rows, violations = [], []
+    for lines in (max(1, args.lines // 10), args.lines):
+        content = build_file(lines)
+        chunks = [content[i:i + CHUNK_SIZE] for i in range(0, len(content), CHUNK_SIZE)]
+
+        def whole_file():
+            parsed = [json.loads(line) for line in bytes(content).decode().splitlines()]
+            return sum(item["response"]["body"]["usage"]["completion_tokens"] for item in parsed)
+
+        def streamed():
+            results = BatchResults("openai")
+            for chunk in chunks:
+                results.feed(chunk)
+            results.flush()
+            return sum(output_tokens for _, output_tokens in results._models.values())
+
+        for name, fn in [("read + parse all", whole_file), ("BatchResults.feed", streamed)]:
+            peak, elapsed, output_tokens = measure(fn)
+            rows.append({"name": name, "lines": lines, "mb": len(content) / (1024 * 1024),
+                         "peak": peak, "elapsed": elapsed})
+            if output_tokens != lines * 120:
+                violations.append(f"{name} ({lines} lines): counted {output_tokens} output tokens")
+        if rows[-1]["peak"] > PEAK_BUDGET_BYTES:
+            violations.append(
+                f"{lines} lines: streaming path allocated {rows[-1]['peak']} bytes (budget {PEAK_BUDGET_BYTES})"
+            )
+
+    print_table(rows, [
+        ("path", lambda r: r["name"], 20),
+        ("lines", lambda r: str(r["lines"]), 8),
+        ("file MB", lambda r: f"{r['mb']:.1f}", 9),
+        ("peak alloc MB", lambda r: f"{r['peak'] / (1024 * 1024):.3f}", 15),
+        ("time ms", lambda r: f"{r['elapsed'] * 1000:.0f}", 9),
+    ])
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
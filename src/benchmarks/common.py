@@ -0,0 +1,98 @@
+"""
+Shared helpers for Ward SDK benchmarks.
+
+Benchmarks are standalone scripts (``python src/benchmarks/<name>.py``). Each
+one prints a results table and exits non-zero when a budget is exceeded, so
+they can gate CI the same way the unit tests do.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+
+class FakeChatResponse:
+    """Minimal stand-in for a ChatCompletion, cheap enough not to skew timings."""
+
+    def model_dump(self):
+        return {
+            "id": "chatcmpl-bench",
+            "model": "gpt-4o",
+            "choices": [
+                {"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+        }
+
+
+class FakeInstance:
+    """Resource instance whose client points at the OpenAI API."""
+
+    class _Client:
+        base_url = "https://api.openai.com/v1"
+
+    _client = _Client()
+
+
+def make_config(tracer, **overrides):
+    """Instrumentor config dict as built by openaiInstrumentor."""
+    config = {
+        "tracer": tracer,
+        "pricing_info": {},
+        "environment": "bench",
+        "application_name": "ward-bench",
+        "metrics": None,
+        "capture_message_content": True,
+        "disable_metrics": False,
+        "version": "bench",
+    }
+    config.update(overrides)
+    return config
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def time_calls(fn, n):
+    """Call ``fn`` n times and return per-call latencies in seconds."""
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def check_budgets(rows, budgets):
+    """
+    Compare result rows against budgets.
+
+    ``budgets`` maps a row key to ``{metric: max_value}``. Returns a list of
+    human-readable violations (empty when everything is within budget).
+    """
+    violations = []
+    for row in rows:
+        for metric, limit in budgets.get(row["key"], {}).items():
+            value = row.get(metric)
+            if value is not None and value > limit:
+                violations.append(f"{row['name']}: {metric}={value:.3f} exceeds budget {limit:.3f}")
+    return violations
+
+
+def print_table(rows, columns):
+    """Print rows as a fixed-width table."""
+    header = "".join(f"{title:>{width}}" for title, _, width in columns)
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print("".join(f"{fmt(row):>{width}}" for _, fmt, width in columns))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Conversation content encoding benchmark.
+
+Records a long chat conversation (--messages turns of --chars characters) on
+a span in each content format and reports, per span:
+
+  - encode cost: time spent in _set_request_attributes
+  - attribute count
+  - exported bytes (OTLP protobuf encoding of the finished span)
+
+"attributes" is the per-message layout (gen_ai.user.message.N ...); "json"
+is the single-attribute layout, measured with orjson and with the stdlib
+fallback. The per-message layout only records system and user messages, so
+the conversation is made of those; both layouts then carry the same text.
+The JSON layout must stay within a byte budget relative to the per-message
+layout, and orjson must not be slower than the stdlib encoder.
+
+Run: python src/benchmarks/conversation_json.py [--messages 200] [--chars 400]
+"""
+
+import argparse
+import sys
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.sdk.trace import SpanLimits, TracerProvider
+
+from ward.instrumentation.openai import utils
+from ward.instrumentation.openai.openai import _set_request_attributes
+from ward.policy import Policy
+
+# JSON layout may cost at most this much more on the wire than per-message attributes.
+MAX_JSON_BYTES_RATIO = 1.10
+
+
+def build_messages(count, chars):
+    text = ("lorem ipsum dolor sit amet " * (chars // 27 + 1))[:chars]
+    return [{"role": "system", "content": text}] + [
+        {"role": "user", "content": text} for _ in range(count - 1)
+    ]
+
+
+def measure(tracer, messages, policy, repeat):
+    """Return (best encode seconds, attribute count, exported bytes)."""
+    best = float("inf")
+    span = None
+    for _ in range(repeat):
+        span = tracer.start_span("chat gpt-4o")
+        start = time.perf_counter()
+        _set_request_attributes(span, {"messages": messages}, True, policy)
+        best = min(best, time.perf_counter() - start)
+        span.end()
+    return best, len(span.attributes), encode_spans([span]).ByteSize()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--chars", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    # No attribute cap, so the per-message layout is measured in full
+    limits = SpanLimits(max_span_attributes=100000, max_attributes=100000)
+    tracer = TracerProvider(span_limits=limits, shutdown_on_exit=False).get_tracer("ward-bench")
+    messages = build_messages(args.messages, args.chars)
+
+    fast_json = utils.orjson
+    cases = [("attributes", Policy(), fast_json), ("json (stdlib)", Policy(content_format="json"), None)]
+    if fast_json is not None:
+        cases.append(("json (orjson)", Policy(content_format="json"), fast_json))
+
+    rows = []
+    try:
+        for name, policy, json_module in cases:
+            utils.orjson = json_module
+            seconds, attribute_count, size = measure(tracer, messages, policy, args.repeat)
+            rows.append({"name": name, "us": seconds * 1e6, "attributes": attribute_count, "bytes": size})
+    finally:
+        utils.orjson = fast_json
+
+    print(f"{args.messages} messages x {args.chars} chars")
+    print_table(rows, [
+        ("layout", lambda r: r["name"], 16),
+        ("encode us", lambda r: f"{r['us']:.1f}", 12),
+        ("attributes", lambda r: str(r["attributes"]), 12),
+        ("bytes/span", lambda r: str(r["bytes"]), 12),
+    ])
+
+    by_name = {row["name"]: row for row in rows}
+    violations = []
+    per_message = by_name["attributes"]
+    for row in rows[1:]:
+        if row["bytes"] > per_message["bytes"] * MAX_JSON_BYTES_RATIO:
+            violations.append(f"{row['name']}: {row['bytes']} bytes vs {per_message['bytes']} per-message")
+    if "json (orjson)" in by_name and by_name["json (orjson)"]["us"] > by_name["json (stdlib)"]["us"]:
+        violations.append("orjson encode slower than stdlib json")
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Deferred enrichment benchmark.
+
+Times non-streaming chat calls through the instrumented wrapper on the
+caller's thread, with response processing inline and deferred to the export
+thread (ward.init(defer_enrichment=True)). The response is dumped into a
+fresh dict on every model_dump(), like a pydantic model, and carries
+--kb kilobytes of content over several choices with tool calls.
+
+Ended spans are queued and run through EnrichingSpanExporter between timed
+batches, as a BatchSpanProcessor worker would; the export-side cost is
+reported but not budgeted. The deferred path must take at most
+MAX_DEFERRED_RATIO of the inline path's caller-thread time, and exported
+spans must carry the same attributes as inline ones.
+
+Run: python src/benchmarks/deferred_enrichment.py [--calls 5000] [--kb 16]
+"""
+
+import argparse
+import copy
+import sys
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import FakeInstance, make_config, percentile, print_table, time_calls
+
+from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from ward.instrumentation.openai.openai import chat_completions
+from ward.otel.enrichment import EnrichingSpanExporter, set_enrichment_enabled
+
+MAX_DEFERRED_RATIO = 0.6
+
+# Attributes whose values legitimately differ between two calls
+VOLATILE = ("gen_ai.client.operation.duration",)
+
+
+class DumpingResponse:
+    """ChatCompletion stand-in whose model_dump() builds a new dict each call."""
+
+    def __init__(self, kb, choices=4):
+        text = ("The quarterly report shows steady growth across regions. " * (kb * 1024 // 57 // choices + 1))
+        self._dump = {
+            "id": "chatcmpl-bench",
+            "model": "gpt-4o",
+            "system_fingerprint": "fp_bench",
+            "choices": [
+                {
+                    "index": i,
+                    "message": {
+                        "role": "assistant",
+                        "content": text[: kb * 1024 // choices],
+                        "tool_calls": [
+                            {"id": f"call_{i}", "type": "function",
+                             "function": {"name": "lookup", "arguments": '{"city": "Paris", "days": 3}'}},
+                        ],
+                    },
+                    "finish_reason": "stop",
+                }
+                for i in range(choices)
+            ],
+            "usage": {"prompt_tokens": 1200, "completion_tokens": kb * 256, "total_tokens": 1200 + kb * 256},
+        }
+
+    def model_dump(self):
+        return copy.deepcopy(self._dump)
+
+
+class QueueingProcessor(SpanProcessor):
+    """Keeps ended spans until drain(), like the BatchSpanProcessor queue."""
+
+    def __init__(self, exporter):
+        self.exporter = exporter
+        self.queue = []
+
+    def on_end(self, span):
+        self.queue.append(span)
+
+    def drain(self):
+        spans, self.queue = self.queue, []
+        start = time.perf_counter()
+        self.exporter.export(spans)
+        return time.perf_counter() - start, len(spans)
+
+
+class KeepLast(SpanExporter):
+    def __init__(self):
+        self.last = None
+
+    def export(self, spans):
+        if spans:
+            self.last = spans[-1]
+        return SpanExportResult.SUCCESS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--kb", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    exported = KeepLast()
+    processor = QueueingProcessor(EnrichingSpanExporter(exported))
+    provider = TracerProvider(shutdown_on_exit=False)
+    provider.add_span_processor(processor)
+    wrapper_fn = chat_completions(make_config(provider.get_tracer("ward-bench")))
+    instance = FakeInstance()
+    response = DumpingResponse(args.kb)
+    kwargs = {"model": "gpt-4o", "messages": [{"role": "user", "content": "Summarise the report"}]}
+
+    def provider_call(**kwargs):
+        return response
+
+    def call():
+        wrapper_fn(provider_call, instance, (), kwargs)
+
+    attributes = {}
+    samples = {"inline": [], "deferred": []}
+    export_seconds = {"inline": 0.0, "deferred": 0.0}
+    batch = max(1, args.calls // 10)
+    # Interleave the two modes so drift (thermal, GC) affects both equally
+    for _ in range(10):
+        for mode in ("inline", "deferred"):
+            set_enrichment_enabled(mode == "deferred")
+            samples[mode] += time_calls(call, batch)
+            seconds, _ = processor.drain()
+            export_seconds[mode] += seconds
+            attributes[mode] = {
+                key: value for key, value in exported.last.attributes.items() if key not in VOLATILE
+            }
+    set_enrichment_enabled(False)
+
+    rows = [
+        {
+            "name": mode,
+            "p50_us": percentile(samples[mode], 50) * 1e6,
+            "p99_us": percentile(samples[mode], 99) * 1e6,
+            "export_us": export_seconds[mode] / len(samples[mode]) * 1e6,
+        }
+        for mode in ("inline", "deferred")
+    ]
+    print(f"{args.kb} KB response, {len(samples['inline'])} calls per mode")
+    print_table(rows, [
+        ("mode", lambda r: r["name"], 10),
+        ("caller p50 us", lambda r: f"{r['p50_us']:.1f}", 15),
+        ("caller p99 us", lambda r: f"{r['p99_us']:.1f}", 15),
+        ("export us/span", lambda r: f"{r['export_us']:.1f}", 16),
+    ])
+
+    violations = []
+    if attributes["inline"] != attributes["deferred"]:
+        differing = sorted(set(attributes["inline"].items()) ^ set(attributes["deferred"].items()))
+        violations.append(f"deferred span attributes differ from inline: {differing[:3]}")
+    ratio = rows[1]["p50_us"] / rows[0]["p50_us"]
+    if ratio > MAX_DEFERRED_RATIO:
+        violations.append(f"deferred p50 is {ratio:.2f}x inline, budget {MAX_DEFERRED_RATIO:.2f}x")
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
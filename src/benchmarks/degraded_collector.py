@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Degraded-collector benchmark: application latency when the exporter is slow or down.
+
+Runs instrumented chat calls against a fake OTLP/HTTP collector that is slow,
+hangs, resets connections, or answers 429/503, and measures what the
+application pays for it:
+
+  - per-call latency of the instrumented wrapper (p50 / p99 / max)
+  - Python heap growth while the collector is degraded (tracemalloc)
+  - TracerProvider.shutdown() time
+
+Every scenario is run on each span processor path: "batch" (the default),
+"immediate" (what disable_batch=True selects) and "simple"
+(SimpleSpanProcessor, the synchronous reference). Each path has explicit
+budgets; the script exits 1 when any of them is exceeded.
+
+Run: python src/benchmarks/degraded_collector.py [--calls 200] [--modes slow,hang]
+"""
+
+import argparse
+import logging
+import socket
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from common import (
+    FakeChatResponse,
+    FakeInstance,
+    check_budgets,
+    make_config,
+    percentile,
+    print_table,
+    time_calls,
+)
+
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+from ward.instrumentation.openai.openai import chat_completions
+from ward.otel.exporters import create_span_processor
+
+MODES = ["ok", "slow", "hang", "reset", "429", "503"]
+
+# Seconds the exporter may spend on one export before giving up.
+EXPORT_TIMEOUT = 1.0
+# Per-request delay in "slow" mode (below EXPORT_TIMEOUT, so exports succeed late).
+SLOW_DELAY = 0.5
+
+# Budgets per processor path. The batch and immediate paths must keep the
+# collector entirely off the application thread; the simple path exports
+# inline, so the best it can promise is that a dead collector costs no more
+# than one export timeout.
+BUDGETS = {
+    "batch": {
+        "p99_ms": 5.0,
+        "max_ms": 50.0,
+        "mem_growth_mb": 8.0,
+        "shutdown_s": 2 * EXPORT_TIMEOUT + 1.0,
+    },
+    "immediate": {
+        "p99_ms": 5.0,
+        "max_ms": 50.0,
+        "mem_growth_mb": 8.0,
+        "shutdown_s": 2 * EXPORT_TIMEOUT + 1.0,
+    },
+    "simple": {
+        "p99_ms": (EXPORT_TIMEOUT + 0.5) * 1000,
+        "mem_growth_mb": 8.0,
+        "shutdown_s": EXPORT_TIMEOUT + 1.0,
+    },
+}
+
+
+class FakeCollector:
+    """OTLP/HTTP endpoint on localhost that misbehaves in a chosen way."""
+
+    def __init__(self, mode):
+        self.mode = mode
+        self._stopped = threading.Event()
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                if collector.mode == "slow":
+                    time.sleep(SLOW_DELAY)
+                elif collector.mode == "hang":
+                    collector._stopped.wait()
+                    return
+                elif collector.mode == "reset":
+                    # SO_LINGER with a zero timeout turns close() into a TCP RST
+                    self.connection.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                    )
+                    self.connection.close()
+                    return
+                elif collector.mode in ("429", "503"):
+                    self.send_response(int(collector.mode))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-protobuf")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1/traces"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def build_provider(processor_kind, endpoint):
+    """TracerProvider wired the way ward.init wires it for the given path."""
+    exporter = OTLPSpanExporter(endpoint=endpoint, timeout=EXPORT_TIMEOUT)
+    provider = TracerProvider(shutdown_on_exit=False)
+    if processor_kind == "simple":
+        processor = SimpleSpanProcessor(exporter)
+    else:
+        processor = create_span_processor(exporter, use_batch=processor_kind == "batch")
+    provider.add_span_processor(processor)
+    return provider
+
+
+def run_scenario(mode, processor_kind, calls):
+    """Run one (collector mode, processor path) pair and return a result row."""
+    with FakeCollector(mode) as collector:
+        provider = build_provider(processor_kind, collector.endpoint)
+        wrapper = chat_completions(make_config(provider.get_tracer("ward-bench")))
+        instance = FakeInstance()
+        kwargs = {"model": "gpt-4o", "messages": [{"role": "user", "content": "ping"}]}
+
+        def call():
+            wrapper(lambda *a, **k: FakeChatResponse(), instance, (), kwargs)
+
+        latencies = time_calls(call, calls)
+
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(calls):
+            call()
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        shutdown_start = time.perf_counter()
+        provider.shutdown()
+        shutdown_s = time.perf_counter() - shutdown_start
+
+    return {
+        "key": processor_kind,
+        "name": f"{processor_kind}/{mode}",
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "mem_growth_mb": (after - before) / (1024 * 1024),
+        "shutdown_s": shutdown_s,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200, help="instrumented calls per scenario")
+    parser.add_argument(
+        "--simple-calls", type=int, default=5,
+        help="calls per simple-processor scenario (each may block for a full export timeout)",
+    )
+    parser.add_argument("--modes", default=",".join(MODES), help="comma-separated collector modes")
+    parser.add_argument("--processors", default=",".join(BUDGETS), help="comma-separated processor paths")
+    args = parser.parse_args(argv)
+
+    # Export failures are the point of this benchmark; keep the exporter quiet.
+    logging.getLogger("opentelemetry").setLevel(logging.CRITICAL)
+
+    rows = []
+    for processor_kind in args.processors.split(","):
+        calls = args.simple_calls if processor_kind == "simple" else args.calls
+        for mode in args.modes.split(","):
+            rows.append(run_scenario(mode, processor_kind, calls))
+
+    print_table(rows, [
+        ("scenario", lambda r: r["name"], 16),
+        ("p50 ms", lambda r: f"{r['p50_ms']:.3f}", 12),
+        ("p99 ms", lambda r: f"{r['p99_ms']:.3f}", 12),
+        ("max ms", lambda r: f"{r['max_ms']:.3f}", 12),
+        ("mem MB", lambda r: f"{r['mem_growth_mb']:.2f}", 10),
+        ("shutdown s", lambda r: f"{r['shutdown_s']:.2f}", 12),
+    ])
+
+    violations = check_budgets(rows, BUDGETS)
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
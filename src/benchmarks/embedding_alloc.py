@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Embedding instrumentation allocation benchmark.
+
+Compares the memory the embedding response processor allocates for a large
+batch (2048 inputs x 1536 dims by default) against the old approach of
+dumping the whole response to a dict, and checks the new path stays within
+a fixed allocation budget regardless of batch size.
+
+Run: python src/benchmarks/embedding_alloc.py [--inputs 2048] [--dims 1536]
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
+from opentelemetry.sdk.trace import TracerProvider
+
+from ward.instrumentation.openai.openai import process_embedding_response
+from ward.instrumentation.openai.utils import response_to_dict
+
+# Peak bytes the instrumented path may allocate per call, independent of batch size.
+PEAK_BUDGET_BYTES = 64 * 1024
+
+
+def build_response(inputs, dims):
+    vector = [random.random() for _ in range(dims)]
+    return CreateEmbeddingResponse.model_construct(
+        data=[
+            Embedding.model_construct(embedding=list(vector), index=i, object="embedding")
+            for i in range(inputs)
+        ],
+        model="text-embedding-3-small",
+        object="list",
+        usage=Usage.model_construct(prompt_tokens=inputs * 8, total_tokens=inputs * 8),
+    )
+
+
+def measure(fn):
+    """Return (peak bytes allocated, seconds) for one call of fn."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - base, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--inputs", type=int, default=2048)
+    parser.add_argument("--dims", type=int, default=1536)
+    args = parser.parse_args(argv)
+
+    response = build_response(args.inputs, args.dims)
+    tracer = TracerProvider(shutdown_on_exit=False).get_tracer("ward-bench")
+    request_kwargs = {"model": "text-embedding-3-small", "input": ["text"] * args.inputs}
+
+    def dump_path():
+        response_to_dict(response)
+
+    def instrumented_path():
+        span = tracer.start_span("embeddings text-embedding-3-small")
+        process_embedding_response(
+            response=response, request_model="text-embedding-3-small", pricing_info={},
+            server_port=443, server_address="api.openai.com", environment=None,
+            application_name=None, metrics=None, start_time=time.time(), span=span,
+            capture_message_content=False, disable_metrics=False, version="bench",
+            **request_kwargs,
+        )
+        span.end()
+
+    # Warm up lazy imports and span machinery so only per-call cost is measured
+    instrumented_path()
+
+    rows = []
+    for name, fn in [("model_dump (old)", dump_path), ("attribute access", instrumented_path)]:
+        peak, elapsed = measure(fn)
+        rows.append({"name": name, "peak": peak, "elapsed": elapsed})
+
+    print(f"{args.inputs} inputs x {args.dims} dims")
+    print_table(rows, [
+        ("path", lambda r: r["name"], 20),
+        ("peak alloc MB", lambda r: f"{r['peak'] / (1024 * 1024):.3f}", 16),
+        ("time ms", lambda r: f"{r['elapsed'] * 1000:.2f}", 12),
+    ])
+
+    peak = rows[-1]["peak"]
+    if peak > PEAK_BUDGET_BYTES:
+        print(f"BUDGET EXCEEDED: instrumented path allocated {peak} bytes (budget {PEAK_BUDGET_BYTES})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Transport-level instrumentation overhead benchmark.
+
+Runs chat calls through a real OpenAI client over an in-memory httpx
+transport, three ways: uninstrumented, with the SDK-level wrapper
+(instrumentations=["openai"]) and with WardTransport
+(instrumentations=["http"]). Streamed responses have --chunks chunks; the
+non-streamed one is a single completion. Spans are recorded and dropped by
+a no-op exporter.
+
+The transport reads usage, finish reasons and content from the response
+bytes (one JSON decode per event) instead of dumping each SDK chunk model,
+so on streams its overhead must stay below the wrapper's. A single
+completion costs one JSON decode either way, so there it only has to stay
+in the same range. Both modes must record the same token counts.
+
+Run: python src/benchmarks/http_transport.py [--calls 300] [--chunks 50]
+"""
+
+import argparse
+import json
+import sys
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import make_config, percentile, print_table, time_calls
+
+import openai
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExporter, SpanExportResult
+
+from ward.instrumentation.http import WardTransport
+from ward.instrumentation.openai.openai import chat_completions
+
+# The transport's overhead, as a fraction of the wrapper's
+MAX_STREAM_RATIO = 1.0
+MAX_COMPLETION_RATIO = 1.5
+
+httpx = sys.modules[openai.DefaultHttpxClient.__mro__[1].__module__.partition(".")[0]]
+
+
+class LastSpan(SpanExporter):
+    def __init__(self):
+        self.attributes = None
+
+    def export(self, spans):
+        self.attributes = dict(spans[-1].attributes)
+        return SpanExportResult.SUCCESS
+
+
+def build_bodies(chunks):
+    words = "the quarterly report shows steady growth across every region ".split()
+    events = [
+        {"id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": 0, "model": "gpt-4o",
+         "choices": [{"index": 0, "delta": {"content": words[i % len(words)] + " "}, "finish_reason": None}]}
+        for i in range(chunks)
+    ]
+    events[-1]["choices"][0]["finish_reason"] = "stop"
+    events.append({"id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": 0, "model": "gpt-4o",
+                   "choices": [], "usage": {"prompt_tokens": 40, "completion_tokens": chunks, "total_tokens": 40 + chunks}})
+    stream = b"".join(f"data: {json.dumps(event)}\n\n".encode() for event in events) + b"data: [DONE]\n\n"
+    completion = json.dumps({
+        "id": "chatcmpl-bench", "object": "chat.completion", "created": 0, "model": "gpt-4o",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": " ".join(words * 40)}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 40, "completion_tokens": 400, "total_tokens": 440},
+    }).encode()
+    return stream, completion
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--chunks", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    stream_body, completion_body = build_bodies(args.chunks)
+
+    def handler(request):
+        if b'"stream":true' in request.content.replace(b" ", b""):
+            pieces = [stream_body[i:i + 512] for i in range(0, len(stream_body), 512)]
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=iter(pieces))
+        return httpx.Response(200, headers={"content-type": "application/json"}, content=iter([completion_body]))
+
+    exporter = LastSpan()
+    provider = TracerProvider(shutdown_on_exit=False)
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    config = make_config(provider.get_tracer("ward-bench"))
+
+    def client_for(transport):
+        return openai.OpenAI(
+            api_key="bench", base_url="http://llm.local/v1", max_retries=0,
+            http_client=openai.DefaultHttpxClient(transport=transport),
+        )
+
+    plain = client_for(httpx.MockTransport(handler))
+    wired = client_for(WardTransport(httpx.MockTransport(handler), config))
+    create = type(plain.chat.completions).__dict__["create"]
+    create = getattr(create, "__wrapped__", create)
+    wrapper_fn = chat_completions(config)
+    messages = [{"role": "user", "content": "Summarise the report"}]
+
+    def consume(result, stream):
+        if stream:
+            for _ in result:
+                pass
+
+    def runner(mode, stream):
+        kwargs = {"model": "gpt-4o", "messages": messages, "stream": stream}
+        if stream:
+            kwargs["stream_options"] = {"include_usage": True}
+        if mode == "raw":
+            return lambda: consume(create(plain.chat.completions, **kwargs), stream)
+        if mode == "wrapper":
+            completions = plain.chat.completions
+            return lambda: consume(
+                wrapper_fn(create.__get__(completions), completions, (), dict(kwargs)), stream,
+            )
+        return lambda: consume(create(wired.chat.completions, **kwargs), stream)
+
+    rows, violations = [], []
+    for stream in (False, True):
+        name = f"stream x{args.chunks}" if stream else "completion"
+        samples = {"raw": [], "wrapper": [], "transport": []}
+        tokens = {}
+        # Interleave the modes so drift (thermal, GC) affects all equally
+        for _ in range(10):
+            for mode in samples:
+                samples[mode] += time_calls(runner(mode, stream), max(1, args.calls // 10))
+                if mode != "raw":
+                    tokens[mode] = exporter.attributes.get("gen_ai.usage.output_tokens")
+        # Low percentile: the added cost is small next to SDK parsing, and the
+        # fastest calls are the least disturbed by scheduling noise
+        p10 = {mode: percentile(values, 10) * 1e6 for mode, values in samples.items()}
+        row = {
+            "name": name,
+            "raw_us": p10["raw"],
+            "wrapper_us": p10["wrapper"] - p10["raw"],
+            "transport_us": p10["transport"] - p10["raw"],
+        }
+        rows.append(row)
+        if tokens["wrapper"] != tokens["transport"]:
+            violations.append(f"{name}: output tokens differ ({tokens['wrapper']} vs {tokens['transport']})")
+        ratio = MAX_STREAM_RATIO if stream else MAX_COMPLETION_RATIO
+        if row["transport_us"] > ratio * row["wrapper_us"]:
+            violations.append(
+                f"{name}: transport overhead {row['transport_us']:.0f} us exceeds "
+                f"{ratio:.1f}x wrapper overhead {row['wrapper_us']:.0f} us"
+            )
+
+    print_table(rows, [
+        ("call", lambda r: r["name"], 14),
+        ("raw p10 us", lambda r: f"{r['raw_us']:.0f}", 13),
+        ("wrapper +us", lambda r: f"{r['wrapper_us']:.0f}", 13),
+        ("transport +us", lambda r: f"{r['transport_us']:.0f}", 15),
+    ])
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
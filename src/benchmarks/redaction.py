@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Redaction throughput benchmark.
+
+Redacts --kb kilobytes of text with every built-in rule enabled and reports
+throughput in MB/s for three corpora:
+
+  - prose: plain text with nothing to redact
+  - pii:   prose with an email, phone number, API key or card number
+           roughly every 200 characters
+  - json:  the pii corpus encoded as a JSON conversation (content_format=json)
+
+Redactor.redact runs the combined built-in matcher only in windows around
+cheap anchors (see ward.redaction). It is compared with running the same
+matcher over the whole text, and with one full scan per rule. It must reach
+a minimum throughput, must beat both alternatives, and must produce the same
+output as the whole-text scan.
+
+Run: python src/benchmarks/redaction.py [--kb 1024] [--repeat 5]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from ward.redaction import Redactor
+
+# Minimum MB/s for the combined matcher, per corpus.
+MIN_MB_PER_SECOND = {"prose": 50.0, "pii": 20.0, "json": 20.0}
+
+WORDS = (
+    "the model returned a summary of the quarterly report with three action items "
+    "for the platform team and a follow up on latency regressions in the eu region "
+).split()
+PII = (
+    "jane.doe@example.com",
+    "+1 415 555 0100",
+    "sk-proj-AbCdEfGhIjKlMnOpQrStUv12",
+    "4111 1111 1111 1111",
+)
+
+
+def build_corpora(size):
+    prose, pii, index = [], [], 0
+    length = 0
+    while length < size:
+        word = WORDS[index % len(WORDS)]
+        prose.append(word)
+        pii.append(word)
+        if index % 30 == 29:
+            pii.append(PII[(index // 30) % len(PII)])
+        length += len(word) + 1
+        index += 1
+    prose_text, pii_text = " ".join(prose)[:size], " ".join(pii)[:size]
+    chunk = 2000
+    conversation = [
+        {"role": "user" if i % 2 else "system", "content": pii_text[start:start + chunk]}
+        for i, start in enumerate(range(0, len(pii_text), chunk))
+    ]
+    return {"prose": prose_text, "pii": pii_text, "json": json.dumps(conversation)}
+
+
+def per_rule(redactor):
+    """The naive alternative: one compiled pattern and one full scan per rule."""
+    scans = [(re.compile(rule.pattern), rule) for rule in redactor.rules]
+
+    def redact(text):
+        for pattern, rule in scans:
+            def replace(match, rule=rule):
+                if rule.validate is not None and not rule.validate(match.group()):
+                    return match.group()
+                return rule.replacement
+            text = pattern.sub(replace, text)
+        return text
+
+    return redact
+
+
+def throughput(redact, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        redact(text)
+        best = min(best, time.perf_counter() - start)
+    return len(text.encode()) / best / 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--kb", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    redactor = Redactor()
+    matcher = redactor._builtin
+
+    def whole_text(text):
+        return matcher.pattern.sub(matcher.replace, text)
+
+    sequential = per_rule(redactor)
+    rows = []
+    mismatches = []
+    for name, text in build_corpora(args.kb * 1024).items():
+        redacted = redactor.redact(text)
+        if redacted != whole_text(text):
+            mismatches.append(f"{name}: anchored output differs from the whole-text scan")
+        rows.append({
+            "name": name,
+            "anchored": throughput(redactor.redact, text, args.repeat),
+            "whole_text": throughput(whole_text, text, args.repeat),
+            "per_rule": throughput(sequential, text, args.repeat),
+            "matches": redacted.count("[REDACTED:"),
+        })
+
+    print(f"{args.kb} KB per corpus, {len(redactor.rules)} rules")
+    print_table(rows, [
+        ("corpus", lambda r: r["name"], 10),
+        ("anchored MB/s", lambda r: f"{r['anchored']:.1f}", 15),
+        ("whole-text MB/s", lambda r: f"{r['whole_text']:.1f}", 17),
+        ("per-rule MB/s", lambda r: f"{r['per_rule']:.1f}", 15),
+        ("matches", lambda r: str(r["matches"]), 10),
+    ])
+
+    violations = mismatches
+    for row in rows:
+        minimum = MIN_MB_PER_SECOND[row["name"]]
+        if row["anchored"] < minimum:
+            violations.append(f"{row['name']}: {row['anchored']:.1f} MB/s below {minimum:.1f} MB/s")
+        if row["anchored"] < max(row["whole_text"], row["per_rule"]):
+            violations.append(f"{row['name']}: anchored matching slower than a full scan")
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
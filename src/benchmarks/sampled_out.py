@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Sampled-out overhead benchmark.
+
+Runs chat calls (plain and streamed) through the instrumented wrapper with a
+tracer whose sampler drops every span, and compares them with calling the
+provider method directly. A dropped call should cost one sampling decision
+and nothing else: no request attributes, no stream_options injection, no
+StreamWrapper around the chunks. The cost of the sampling decision itself
+(tracer.start_span with a dropping sampler) is measured separately; the
+budget applies to what the wrapper adds on top of it. The identity of the
+returned object is checked as well.
+
+The same calls are then made over a RateLimitingSampler cap, where spans are
+kept RECORD_ONLY so ErrorAdmittingSpanProcessor can still export failures.
+Those calls get the same budget: beyond the (costlier) recording span, they
+should cost no more than dropped ones.
+
+Run: python src/benchmarks/sampled_out.py [--calls 20000] [--chunks 100]
+"""
+
+import argparse
+import sys
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import FakeChatResponse, FakeInstance, check_budgets, make_config, percentile, print_table, time_calls
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+from opentelemetry.trace import SpanKind
+
+from ward.instrumentation.openai.openai import chat_completions
+from ward.otel.processors import ErrorAdmittingSpanProcessor
+from ward.otel.sampling import RateLimitingSampler
+
+# Median microseconds a dropped call may cost beyond the raw call and the
+# sampler's own start_span.
+BUDGETS = {
+    "chat": {"wrapper_us": 2.0},
+    "stream": {"wrapper_us": 2.0},
+    "chat over cap": {"wrapper_us": 2.0},
+    "stream over cap": {"wrapper_us": 2.0},
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--chunks", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    dropping = TracerProvider(sampler=ALWAYS_OFF, shutdown_on_exit=False)
+    # Admit one span per thousand seconds: every call after the first is over the cap
+    capped = TracerProvider(sampler=RateLimitingSampler(spans_per_second=0.001), shutdown_on_exit=False)
+    exporter = InMemorySpanExporter()
+    capped.add_span_processor(ErrorAdmittingSpanProcessor(SimpleSpanProcessor(exporter)))
+
+    instance = FakeInstance()
+    response = FakeChatResponse()
+    chunks = [object()] * args.chunks
+    messages = [{"role": "user", "content": "Hi"}]
+
+    def call_chat(**kwargs):
+        return response
+
+    def call_stream(**kwargs):
+        return iter(chunks)
+
+    def consume_stream(stream):
+        for _ in stream:
+            pass
+
+    cases = [
+        ("chat", call_chat, {"model": "gpt-4o", "messages": messages}, lambda result: None),
+        ("stream", call_stream, {"model": "gpt-4o", "messages": messages, "stream": True}, consume_stream),
+    ]
+
+    rows = []
+    passthrough_errors = []
+    for provider, suffix in [(dropping, ""), (capped, " over cap")]:
+        tracer = provider.get_tracer("ward-bench")
+        wrapper_fn = chat_completions(make_config(tracer))
+        # Use up the cap's single admission
+        wrapper_fn(call_chat, instance, (), {"model": "gpt-4o", "messages": messages})
+
+        def sampling_decision():
+            tracer.start_span(
+                "chat gpt-4o",
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "gen_ai.system": "openai", "gen_ai.operation.type": "chat", "gen_ai.request.model": "gpt-4o",
+                },
+            ).end()
+
+        for key, provider_call, kwargs, consume in cases:
+            key += suffix
+            result = wrapper_fn(provider_call, instance, (), kwargs)
+            if key.startswith("chat") and result is not response:
+                passthrough_errors.append(f"{key}: response was wrapped")
+            if key.startswith("stream") and type(result) is not type(iter(chunks)):
+                passthrough_errors.append(f"{key}: got {type(result).__name__} instead of the raw iterator")
+
+            def raw():
+                consume(provider_call(**kwargs))
+
+            def instrumented():
+                consume(wrapper_fn(provider_call, instance, (), kwargs))
+
+            # Interleave the three so drift (thermal, GC) affects all equally, and
+            # take the wrapper's cost per round so drift between rounds cancels out
+            raw_samples, instrumented_samples, sampler_samples, wrapper_costs = [], [], [], []
+            for _ in range(10):
+                round_samples = [
+                    time_calls(fn, args.calls // 10) for fn in (raw, instrumented, sampling_decision)
+                ]
+                raw_round, instrumented_round, sampler_round = (percentile(x, 50) for x in round_samples)
+                wrapper_costs.append(instrumented_round - raw_round - sampler_round)
+                raw_samples += round_samples[0]
+                instrumented_samples += round_samples[1]
+                sampler_samples += round_samples[2]
+            raw_p50 = percentile(raw_samples, 50)
+            instrumented_p50 = percentile(instrumented_samples, 50)
+            sampler_us = percentile(sampler_samples, 50) * 1e6
+            rows.append({
+                "key": key,
+                "name": key,
+                "raw_us": raw_p50 * 1e6,
+                "instrumented_us": instrumented_p50 * 1e6,
+                "overhead_us": (instrumented_p50 - raw_p50) * 1e6,
+                "sampler_us": sampler_us,
+                "wrapper_us": percentile(wrapper_costs, 50) * 1e6,
+            })
+    if len(exporter.get_finished_spans()) != 1:
+        passthrough_errors.append(f"over cap: {len(exporter.get_finished_spans())} spans exported, expected 1")
+
+    print_table(rows, [
+        ("call", lambda r: r["name"], 18),
+        ("raw p50 us", lambda r: f"{r['raw_us']:.2f}", 14),
+        ("unsampled p50 us", lambda r: f"{r['instrumented_us']:.2f}", 18),
+        ("start_span us", lambda r: f"{r['sampler_us']:.2f}", 14),
+        ("overhead us", lambda r: f"{r['overhead_us']:.2f}", 14),
+        ("wrapper us", lambda r: f"{r['wrapper_us']:.2f}", 12),
+    ])
+
+    violations = passthrough_errors + check_budgets(rows, BUDGETS)
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
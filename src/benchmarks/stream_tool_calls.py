@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Streaming tool-call accumulation benchmark.
+
+Streams chat completion chunks that carry one tool-argument fragment each
+(1000+ deltas, split across parallel tool calls) through StreamWrapper and
+measures the per-delta cost of accumulation. Argument fragments are kept in
+lists and joined once, so the per-delta cost must stay flat as the stream
+grows; a quadratic accumulator would show up as a growing ratio.
+
+Run: python src/benchmarks/stream_tool_calls.py [--deltas 1000 4000 16000] [--tool-calls 4]
+"""
+
+import argparse
+import sys
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import FakeInstance, check_budgets, make_config, print_table
+
+from openai.types.chat import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import (
+    Choice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+from opentelemetry.sdk.trace import TracerProvider
+
+from ward.instrumentation.openai.openai import chat_completions
+
+FRAGMENT = '"value", '
+
+# Per-delta instrumentation overhead, and how much it may grow from the
+# smallest to the largest stream (1.0 means perfectly linear).
+BUDGETS = {
+    "stream": {"overhead_us": 50.0, "growth": 2.0},
+}
+
+
+def build_chunks(deltas, tool_calls):
+    chunks = []
+    for i in range(deltas):
+        call_index = i % tool_calls
+        first = i < tool_calls
+        call = ChoiceDeltaToolCall.model_construct(
+            index=call_index,
+            id=f"call_{call_index}" if first else None,
+            type="function" if first else None,
+            function=ChoiceDeltaToolCallFunction.model_construct(
+                name=f"tool_{call_index}" if first else None,
+                arguments=FRAGMENT,
+            ),
+        )
+        chunks.append(ChatCompletionChunk.model_construct(
+            id="chatcmpl-bench",
+            model="gpt-4o",
+            object="chat.completion.chunk",
+            created=0,
+            choices=[Choice.model_construct(
+                index=0, delta=ChoiceDelta.model_construct(tool_calls=[call]), finish_reason=None,
+            )],
+        ))
+    chunks.append(ChatCompletionChunk.model_construct(
+        id="chatcmpl-bench",
+        model="gpt-4o",
+        object="chat.completion.chunk",
+        created=0,
+        choices=[Choice.model_construct(index=0, delta=ChoiceDelta.model_construct(), finish_reason="tool_calls")],
+    ))
+    return chunks
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deltas", type=int, nargs="+", default=[1000, 4000, 16000])
+    parser.add_argument("--tool-calls", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    tracer = TracerProvider(shutdown_on_exit=False).get_tracer("ward-bench")
+    wrapper_fn = chat_completions(make_config(tracer))
+    instance = FakeInstance()
+
+    rows = []
+    for deltas in args.deltas:
+        chunks = build_chunks(deltas, args.tool_calls)
+
+        def raw():
+            for _ in iter(chunks):
+                pass
+
+        def instrumented():
+            stream = wrapper_fn(
+                lambda *a, **kw: iter(chunks), instance, (),
+                {"model": "gpt-4o", "messages": [], "stream": True},
+            )
+            for _ in stream:
+                pass
+
+        overhead = best_of(instrumented) - best_of(raw)
+        rows.append({"name": f"{deltas} deltas", "deltas": deltas, "overhead_us": overhead / deltas * 1e6})
+
+    baseline = rows[0]["overhead_us"]
+    for row in rows:
+        row["key"] = "stream"
+        row["growth"] = row["overhead_us"] / baseline if baseline > 0 else 1.0
+
+    print_table(rows, [
+        ("stream", lambda r: r["name"], 16),
+        ("us/delta", lambda r: f"{r['overhead_us']:.2f}", 12),
+        ("vs smallest", lambda r: f"{r['growth']:.2f}x", 14),
+    ])
+
+    violations = check_budgets(rows, BUDGETS)
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""
+Unit tests for Batch API instrumentation (ward.instrumentation.batch).
+
+Real OpenAI/Anthropic clients talk to an httpx MockTransport, so the SDKs'
+own request building and response parsing run unchanged.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from opentelemetry.trace import StatusCode
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+openai = pytest.importorskip("openai")
+
+from ward.instrumentation import batch as batch_module
+from ward.instrumentation.batch import (
+    BatchResults,
+    TRACEPARENT_KEY,
+    anthropic_batch_create,
+    anthropic_batch_results,
+    async_anthropic_batch_results,
+    openai_batch_create,
+    openai_batch_retrieve,
+    openai_file_content,
+)
+from ward.pricing import calculate_cost
+
+# The httpx package the OpenAI SDK is built on (httpx, or its httpx2 fork)
+httpx = sys.modules[openai.DefaultHttpxClient.__mro__[1].__module__.partition(".")[0]]
+
+
+def _result_line(custom_id, model="gpt-4o-mini", prompt_tokens=100, completion_tokens=20, status_code=200):
+    body = {
+        "id": f"chatcmpl-{custom_id}", "object": "chat.completion", "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                  "total_tokens": prompt_tokens + completion_tokens},
+    }
+    if status_code != 200:
+        body = {"error": {"message": "bad request"}}
+    return {"id": f"batch_req_{custom_id}", "custom_id": custom_id, "error": None,
+            "response": {"status_code": status_code, "request_id": "req", "body": body}}
+
+
+RESULT_FILE = (
+    "\n".join(json.dumps(_result_line(str(i))) for i in range(3))
+    + "\n" + json.dumps(_result_line("bad", status_code=400))
+    + "\n" + json.dumps(_result_line("big", model="gpt-4o", prompt_tokens=1000, completion_tokens=500))
+    + "\n"
+).encode()
+
+
+def _batch(status="completed", **overrides):
+    batch = {
+        "id": "batch_abc", "object": "batch", "endpoint": "/v1/chat/completions", "input_file_id": "file-in",
+        "completion_window": "24h", "status": status, "created_at": 0, "output_file_id": "file-out",
+        "error_file_id": None, "metadata": None,
+        "request_counts": {"total": 5, "completed": 4, "failed": 1},
+    }
+    batch.update(overrides)
+    return batch
+
+
+def _original(resource, name):
+    """Unwrapped bound method (other tests may leave the class instrumented)."""
+    method = type(resource).__dict__[name]
+    return getattr(method, "__wrapped__", method).__get__(resource)
+
+
+def _call(factory, tracer, resource, name, *args, **kwargs):
+    wrapper_fn = factory({"tracer": tracer})
+    return wrapper_fn(_original(resource, name), resource, args, kwargs)
+
+
+def _openai_client(handler):
+    return openai.OpenAI(
+        api_key="test", base_url="http://llm.local/v1", max_retries=0,
+        http_client=openai.DefaultHttpxClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _forget_batches():
+    yield
+    batch_module._SUBMITTED.clear()
+    batch_module._RESULT_FILES.clear()
+
+
+class TestBatchResults:
+    def test_chunks_split_anywhere(self):
+        expected = None
+        for size in (1, 2, 7, 64, len(RESULT_FILE)):
+            results = BatchResults("openai")
+            for i in range(0, len(RESULT_FILE), size):
+                results.feed(RESULT_FILE[i:i + size])
+            results.flush()
+            totals = (results.count, results.succeeded, results.failed, sorted(results._models.items()))
+            assert expected is None or totals == expected, size
+            expected = totals
+        assert expected == (5, 4, 1, [("gpt-4o", [1000, 500]), ("gpt-4o-mini", [300, 60])])
+
+    def test_unterminated_and_malformed_lines(self):
+        results = BatchResults("openai")
+        results.feed(b"not json\n\n" + json.dumps(_result_line("x")).encode())
+        assert results.count == 1
+        results.flush()
+        assert (results.count, results.succeeded, results.failed) == (2, 1, 1)
+
+    def test_batch_discount(self):
+        assert calculate_cost("gpt-4o", 1000, 500, batch=True) == calculate_cost("gpt-4o", 1000, 500) / 2
+        assert calculate_cost("claude-3-haiku-20240307", 1000, 500, provider="anthropic", batch=True) == 0.000438
+
+
+class TestOpenAIBatches:
+    def test_create_retrieve_and_download(self, tracer, span_exporter):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.method == "POST":
+                return httpx.Response(200, json=_batch(status="validating", output_file_id=None))
+            if request.url.path.endswith("/content"):
+                return httpx.Response(200, content=RESULT_FILE)
+            return httpx.Response(200, json=_batch(
+                model="gpt-4o-mini",
+                usage={"input_tokens": 1300, "input_tokens_details": {"cached_tokens": 0},
+                       "output_tokens": 560, "output_tokens_details": {"reasoning_tokens": 0},
+                       "total_tokens": 1860},
+            ))
+
+        client = _openai_client(handler)
+        created = _call(openai_batch_create, tracer, client.batches, "create",
+                        input_file_id="file-in", endpoint="/v1/chat/completions", completion_window="24h")
+        _call(openai_batch_retrieve, tracer, client.batches, "retrieve", created.id)
+        content = _call(openai_file_content, tracer, client.files, "content", "file-out")
+        assert content.content == RESULT_FILE
+
+        create_span, retrieve_span, results_span = span_exporter.get_finished_spans()
+        submitted = create_span.context
+        metadata = json.loads(seen[0].content)["metadata"]
+        assert metadata[TRACEPARENT_KEY] == f"00-{submitted.trace_id:032x}-{submitted.span_id:016x}-{submitted.trace_flags:02x}"
+        assert create_span.attributes["gen_ai.operation.type"] == "batch_create"
+        assert create_span.attributes["gen_ai.batch.id"] == "batch_abc"
+        assert create_span.attributes["gen_ai.batch.endpoint"] == "/v1/chat/completions"
+
+        assert [link.context.span_id for link in retrieve_span.links] == [submitted.span_id]
+        assert retrieve_span.attributes["gen_ai.batch.status"] == "completed"
+        assert retrieve_span.attributes["gen_ai.batch.request_failed"] == 1
+        assert retrieve_span.attributes["gen_ai.usage.cost"] == calculate_cost("gpt-4o-mini", 1300, 560, batch=True)
+
+        attributes = results_span.attributes
+        assert [link.context.span_id for link in results_span.links] == [submitted.span_id]
+        assert results_span.status.status_code == StatusCode.OK
+        assert attributes["gen_ai.batch.id"] == "batch_abc"
+        assert attributes["gen_ai.batch.result_count"] == 5
+        assert attributes["gen_ai.batch.request_succeeded"] == 4
+        assert attributes["gen_ai.batch.request_failed"] == 1
+        assert attributes["gen_ai.usage.input_tokens"] == 1300
+        assert attributes["gen_ai.usage.output_tokens"] == 560
+        assert attributes["gen_ai.batch.models"] == ("gpt-4o", "gpt-4o-mini")
+        cost = calculate_cost("gpt-4o", 1000, 500, batch=True) + calculate_cost("gpt-4o-mini", 300, 60, batch=True)
+        assert attributes["gen_ai.usage.cost"] == pytest.approx(cost)
+        assert attributes["gen_ai.batch.cost_saved"] == pytest.approx(cost, abs=1e-6)
+
+    def test_link_from_metadata_across_processes(self, tracer, span_exporter):
+        traceparent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+        client = _openai_client(lambda request: httpx.Response(200, json=_batch(metadata={TRACEPARENT_KEY: traceparent})))
+
+        _call(openai_batch_retrieve, tracer, client.batches, "retrieve", "batch_abc")
+
+        (link,) = span_exporter.get_finished_spans()[0].links
+        assert link.context.trace_id == 0x0af7651916cd43dd8448eb211c80319c
+        assert link.context.span_id == 0xb7ad6b7169203331
+
+    def test_instrumentor_without_batch_api(self, monkeypatch):
+        from openai.resources.chat.completions import Completions
+        from ward.instrumentation.openai import openaiInstrumentor
+
+        instrumentor = openaiInstrumentor()
+        if instrumentor.is_instrumented_by_opentelemetry:
+            instrumentor.uninstrument()
+        # An openai release from before the Batch API
+        monkeypatch.setitem(sys.modules, "openai.resources.batches", None)
+        try:
+            instrumentor.instrument()
+            assert hasattr(Completions.create, "__wrapped__")
+            assert not any(name == "retrieve" for _, name in instrumentor._wrapped)
+        finally:
+            instrumentor.uninstrument()
+
+    def test_other_files_pass_through(self, tracer, span_exporter):
+        client = _openai_client(lambda request: httpx.Response(200, content=b"training data"))
+
+        assert _call(openai_file_content, tracer, client.files, "content", "file-unrelated").content == b"training data"
+        assert span_exporter.get_finished_spans() == []
+
+    def test_streamed_download(self, tracer, span_exporter):
+        batch_module._remember(batch_module._RESULT_FILES, "file-out", "batch_abc")
+
+        def handler(request):
+            return httpx.Response(200, content=iter(_chunks(RESULT_FILE, 10)))
+
+        client = _openai_client(handler)
+        # What files.with_streaming_response.content() passes to the wrapped method
+        headers = {"X-Stainless-Raw-Response": "stream"}
+        response = _call(openai_file_content, tracer, client.files, "content", "file-out", extra_headers=headers)
+        assert b"".join(response.iter_bytes()) == RESULT_FILE
+        response.close()
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["gen_ai.stream.outcome"] == "completed"
+        assert span.attributes["gen_ai.batch.result_count"] == 5
+        assert span.attributes["gen_ai.usage.input_tokens"] == 1300
+
+
+anthropic = pytest.importorskip("anthropic")
+
+MESSAGE_BATCH = {
+    "id": "msgbatch_1", "type": "message_batch", "processing_status": "ended",
+    "request_counts": {"processing": 0, "succeeded": 2, "errored": 1, "canceled": 0, "expired": 0},
+    "created_at": "2024-01-01T00:00:00Z", "expires_at": "2024-01-02T00:00:00Z", "ended_at": "2024-01-01T01:00:00Z",
+    "archived_at": None, "cancel_initiated_at": None,
+    "results_url": "http://claude.local/v1/messages/batches/msgbatch_1/results",
+}
+
+
+def _anthropic_results():
+    def succeeded(custom_id):
+        return {"custom_id": custom_id, "result": {"type": "succeeded", "message": {
+            "id": f"msg_{custom_id}", "type": "message", "role": "assistant", "model": "claude-3-haiku-20240307",
+            "content": [{"type": "text", "text": "ok"}], "stop_reason": "end_turn", "stop_sequence": None,
+            "usage": {"input_tokens": 400, "output_tokens": 100},
+        }}}
+
+    errored = {"custom_id": "c", "result": {"type": "errored", "error": {
+        "type": "error", "error": {"type": "invalid_request_error", "message": "bad"}}}}
+    return "".join(json.dumps(line) + "\n" for line in (succeeded("a"), succeeded("b"), errored)).encode()
+
+
+def _anthropic_handler(request):
+    if request.url.path.endswith("/results"):
+        return httpx.Response(200, content=iter(_chunks(_anthropic_results())))
+    return httpx.Response(200, json=MESSAGE_BATCH)
+
+
+async def _async_anthropic_handler(request):
+    if request.url.path.endswith("/results"):
+        async def body():
+            for chunk in _chunks(_anthropic_results()):
+                yield chunk
+        return httpx.Response(200, content=body())
+    return httpx.Response(200, json=MESSAGE_BATCH)
+
+
+def _chunks(data, size=16):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestAnthropicBatches:
+    def _client(self, client_class):
+        anthropic_httpx = sys.modules[anthropic.DefaultHttpxClient.__mro__[1].__module__.partition(".")[0]]
+        if client_class is anthropic.AsyncAnthropic:
+            http_client = anthropic.DefaultAsyncHttpxClient(transport=anthropic_httpx.MockTransport(_async_anthropic_handler))
+        else:
+            http_client = anthropic.DefaultHttpxClient(transport=anthropic_httpx.MockTransport(_anthropic_handler))
+        return client_class(api_key="test", base_url="http://claude.local", max_retries=0, http_client=http_client)
+
+    def test_create_counts_requests_as_consumed(self, tracer, span_exporter):
+        batches = self._client(anthropic.Anthropic).messages.batches
+        models = ["claude-3-haiku-20240307", "claude-3-5-sonnet-20241022", "claude-3-haiku-20240307"]
+        requests = (
+            {"custom_id": str(i), "params": {"model": model, "max_tokens": 16,
+                                             "messages": [{"role": "user", "content": "Hi"}]}}
+            for i, model in enumerate(models)
+        )
+
+        _call(anthropic_batch_create, tracer, batches, "create", requests=requests)
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["gen_ai.operation.type"] == "batch_create"
+        assert span.attributes["gen_ai.batch.request_count"] == 3
+        assert span.attributes["gen_ai.batch.models"] == ("claude-3-5-sonnet-20241022", "claude-3-haiku-20240307")
+
+    def test_results_aggregated_while_iterated(self, tracer, span_exporter):
+        batches = self._client(anthropic.Anthropic).messages.batches
+        results = _call(anthropic_batch_results, tracer, batches, "results", "msgbatch_1")
+
+        assert [item.result.type for item in results] == ["succeeded", "succeeded", "errored"]
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["gen_ai.system"] == "anthropic"
+        assert span.attributes["gen_ai.batch.id"] == "msgbatch_1"
+        assert span.attributes["gen_ai.stream.outcome"] == "completed"
+        assert span.attributes["gen_ai.batch.request_succeeded"] == 2
+        assert span.attributes["gen_ai.batch.request_failed"] == 1
+        assert span.attributes["gen_ai.usage.input_tokens"] == 800
+        assert span.attributes["gen_ai.usage.cost"] == calculate_cost(
+            "claude-3-haiku-20240307", 800, 200, provider="anthropic", batch=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_results(self, tracer, span_exporter):
+        batches = self._client(anthropic.AsyncAnthropic).messages.batches
+        wrapper_fn = async_anthropic_batch_results({"tracer": tracer})
+        results = await wrapper_fn(_original(batches, "results"), batches, ("msgbatch_1",), {})
+
+        assert len([item async for item in results]) == 3
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["gen_ai.batch.result_count"] == 3
+        assert span.attributes["gen_ai.usage.output_tokens"] == 200
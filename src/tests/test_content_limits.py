@@ -0,0 +1,137 @@
+"""
+Unit tests for content size limits and truncation markers.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from ward.instrumentation.openai.utils import ContentLimits, set_content_limits
+from ward.policy import Policy, get_policy, set_policy
+
+
+@pytest.fixture(autouse=True)
+def restore_limits():
+    previous = get_policy()
+    yield
+    set_content_limits(None)
+    set_policy(previous)
+
+
+def _openai_call(tracer, messages):
+    from ward.instrumentation.openai.openai import chat_completions
+
+    wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": True})
+    response = MagicMock()
+    response.model_dump.return_value = {
+        "id": "chatcmpl-limits",
+        "model": "gpt-4o",
+        "choices": [{"message": {"role": "assistant", "content": "x" * 50}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    }
+    wrapper_fn(MagicMock(return_value=response), MagicMock(), (), {"model": "gpt-4o", "messages": messages})
+
+
+class TestContentLimits:
+    def test_attribute_length_cap(self, tracer, span_exporter):
+        set_content_limits(ContentLimits(max_attribute_length=100))
+
+        _openai_call(tracer, [{"role": "user", "content": "a" * 1000}])
+
+        attrs = span_exporter.get_finished_spans()[0].attributes
+        assert attrs["gen_ai.user.message.0"] == "a" * 100
+        assert attrs["gen_ai.assistant.message.0"] == "x" * 50
+        assert attrs["ward.truncated.attributes"] == ("gen_ai.user.message.0",)
+        assert attrs["ward.truncated.length"] == 900
+
+    def test_span_budget_spans_attributes(self, tracer, span_exporter):
+        set_content_limits(ContentLimits(max_span_bytes=100))
+
+        _openai_call(tracer, [{"role": "system", "content": "s" * 60}, {"role": "user", "content": "u" * 60}])
+
+        attrs = span_exporter.get_finished_spans()[0].attributes
+        assert attrs["gen_ai.system.message.0"] == "s" * 60
+        assert attrs["gen_ai.user.message.1"] == "u" * 40
+        assert attrs["gen_ai.assistant.message.0"] == ""
+        assert attrs["ward.truncated.attributes"] == ("gen_ai.user.message.1", "gen_ai.assistant.message.0")
+        assert attrs["ward.truncated.length"] == 70
+
+    def test_span_budget_counts_utf8_bytes(self, tracer, span_exporter):
+        set_content_limits(ContentLimits(max_span_bytes=100))
+
+        # 3 bytes per CJK character, 4 per emoji; a cut never splits one
+        _openai_call(tracer, [{"role": "system", "content": "你好" * 10}, {"role": "user", "content": "😀" * 30}])
+
+        attrs = span_exporter.get_finished_spans()[0].attributes
+        assert attrs["gen_ai.system.message.0"] == "你好" * 10
+        assert attrs["gen_ai.user.message.1"] == "😀" * 10
+        assert attrs["gen_ai.assistant.message.0"] == ""
+        assert attrs["ward.truncated.length"] == 20 + 50
+
+    def test_json_conversation_within_byte_budget(self, tracer, span_exporter):
+        set_policy(Policy(content_format="json"))
+        set_content_limits(ContentLimits(max_span_bytes=200))
+
+        _openai_call(tracer, [{"role": "user", "content": "日本語のテキスト" * 40}])
+
+        prompt = span_exporter.get_finished_spans()[0].attributes["gen_ai.prompt"]
+        assert len(prompt.encode()) <= 200
+        assert json.loads(prompt)[0]["content"].startswith("日本語")
+
+    def test_list_attribute_marked_once(self, tracer, span_exporter):
+        from ward.instrumentation.openai.utils import set_content_list_attribute
+
+        set_content_limits(ContentLimits(max_attribute_length=10))
+        span = tracer.start_span("tools")
+        set_content_list_attribute(span, "gen_ai.tool.arguments", ["a" * 30, "short", "b" * 25, "c" * 12])
+        span.end()
+
+        attrs = span_exporter.get_finished_spans()[0].attributes
+        assert attrs["gen_ai.tool.arguments"] == ("a" * 10, "short", "b" * 10, "c" * 10)
+        assert attrs["ward.truncated.attributes"] == ("gen_ai.tool.arguments",)
+        assert attrs["ward.truncated.length"] == 20 + 15 + 2
+
+    def test_untouched_span_has_no_markers(self, tracer, span_exporter):
+        set_content_limits(ContentLimits(max_attribute_length=100))
+
+        _openai_call(tracer, [{"role": "user", "content": "Hi"}])
+
+        attrs = span_exporter.get_finished_spans()[0].attributes
+        assert attrs["gen_ai.user.message.0"] == "Hi"
+        assert "ward.truncated.attributes" not in attrs
+
+    def test_json_conversation_stays_valid(self, tracer, span_exporter):
+        set_policy(Policy(content_format="json"))
+        set_content_limits(ContentLimits(max_attribute_length=200))
+
+        _openai_call(tracer, [{"role": "system", "content": "s" * 500}, {"role": "user", "content": "u" * 500}])
+
+        attrs = span_exporter.get_finished_spans()[0].attributes
+        prompt = attrs["gen_ai.prompt"]
+        assert len(prompt) <= 200
+        messages = json.loads(prompt)
+        assert [m["role"] for m in messages] == ["system", "user"]
+        assert len(messages[0]["content"]) == len(messages[1]["content"]) > 0
+        assert "gen_ai.prompt" in attrs["ward.truncated.attributes"]
+
+    def test_negative_limit_rejected(self):
+        with pytest.raises(ValueError):
+            ContentLimits(max_attribute_length=-1)
+
+    def test_init_installs_and_clears_limits(self):
+        import ward
+        from ward.instrumentation.openai import utils
+
+        ward.init(application_name="test", environment="test", max_attribute_length=64, max_span_bytes=1024)
+        assert utils._CONTENT_LIMITS.max_attribute_length == 64
+        assert utils._CONTENT_LIMITS.max_span_bytes == 1024
+
+        ward.init(application_name="test", environment="test")
+        assert utils._CONTENT_LIMITS is None
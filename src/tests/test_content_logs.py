@@ -0,0 +1,130 @@
+"""
+Unit tests for emitting captured content as OTel log records.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import InMemoryLogRecordExporter, SimpleLogRecordProcessor
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from ward.instrumentation.openai.utils import set_content_logger, set_redactor
+from ward.otel.exporters import RedactingLogExporter
+from ward.policy import Policy, get_policy, set_policy
+from ward.redaction import CONTENT_ATTRIBUTE_PREFIXES, Redactor
+
+
+@pytest.fixture(autouse=True)
+def restore_content_sinks():
+    previous = get_policy()
+    yield
+    set_content_logger(None)
+    set_redactor(None)
+    set_policy(previous)
+
+
+@pytest.fixture()
+def log_exporter():
+    return InMemoryLogRecordExporter()
+
+
+@pytest.fixture()
+def content_logger(log_exporter):
+    provider = LoggerProvider()
+    provider.add_log_record_processor(SimpleLogRecordProcessor(log_exporter))
+    logger = provider.get_logger("ward.content")
+    set_content_logger(logger)
+    return logger
+
+
+def _openai_call(tracer, content="Hi", tool_args=None):
+    from ward.instrumentation.openai.openai import chat_completions
+
+    wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": True})
+    message = {"role": "assistant", "content": "Hello there!"}
+    if tool_args is not None:
+        message["tool_calls"] = [
+            {"id": "call_1", "type": "function", "function": {"name": "lookup", "arguments": tool_args}}
+        ]
+    response = MagicMock()
+    response.model_dump.return_value = {
+        "id": "chatcmpl-logs",
+        "model": "gpt-4o",
+        "choices": [{"message": message, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    }
+    wrapper_fn(
+        MagicMock(return_value=response), MagicMock(), (),
+        {"model": "gpt-4o", "messages": [{"role": "system", "content": "Be brief"}, {"role": "user", "content": content}]},
+    )
+
+
+def _bodies(log_exporter):
+    return {
+        record.log_record.attributes["ward.content.attribute"]: record.log_record.body
+        for record in log_exporter.get_finished_logs()
+    }
+
+
+class TestContentLogs:
+    def test_content_moves_from_span_to_logs(self, tracer, span_exporter, log_exporter, content_logger):
+        _openai_call(tracer, tool_args='{"city": "Paris"}')
+
+        span = span_exporter.get_finished_spans()[0]
+        assert not [key for key in span.attributes if key.startswith(CONTENT_ATTRIBUTE_PREFIXES)]
+        assert span.attributes["gen_ai.tool.name.0"] == ("lookup",)
+        assert span.attributes["gen_ai.usage.input_tokens"] == 3
+        assert _bodies(log_exporter) == {
+            "gen_ai.system.message.0": "Be brief",
+            "gen_ai.user.message.1": "Hi",
+            "gen_ai.assistant.message.0": "Hello there!",
+            "gen_ai.tool.args.0": ['{"city": "Paris"}'],
+        }
+
+    def test_records_correlate_with_span(self, tracer, span_exporter, log_exporter, content_logger):
+        _openai_call(tracer)
+
+        context = span_exporter.get_finished_spans()[0].context
+        records = log_exporter.get_finished_logs()
+        assert records
+        for record in records:
+            assert record.log_record.trace_id == context.trace_id
+            assert record.log_record.span_id == context.span_id
+            assert record.instrumentation_scope.name == "ward.content"
+
+    def test_json_layout(self, tracer, span_exporter, log_exporter, content_logger):
+        set_policy(Policy(content_format="json"))
+
+        _openai_call(tracer)
+
+        assert "gen_ai.prompt" not in span_exporter.get_finished_spans()[0].attributes
+        bodies = _bodies(log_exporter)
+        assert [m["role"] for m in json.loads(bodies["gen_ai.prompt"])] == ["system", "user"]
+        assert json.loads(bodies["gen_ai.output_messages"])[0]["content"] == "Hello there!"
+
+    def test_no_logs_without_content_capture(self, tracer, log_exporter, content_logger):
+        set_policy(Policy(capture_message_content=False))
+
+        _openai_call(tracer)
+
+        assert log_exporter.get_finished_logs() == ()
+
+    def test_deferred_redaction_of_bodies(self, tracer, log_exporter):
+        redactor = Redactor(defer=True)
+        set_redactor(redactor)
+        provider = LoggerProvider()
+        provider.add_log_record_processor(SimpleLogRecordProcessor(RedactingLogExporter(log_exporter, redactor)))
+        set_content_logger(provider.get_logger("ward.content"))
+
+        _openai_call(tracer, content="mail jane@example.com", tool_args='{"to": "bob@example.com"}')
+
+        bodies = _bodies(log_exporter)
+        assert bodies["gen_ai.user.message.1"] == "mail [REDACTED:email]"
+        assert bodies["gen_ai.tool.args.0"] == ['{"to": "[REDACTED:email]"}']
@@ -0,0 +1,144 @@
+"""
+Unit tests for deferred response enrichment on the export thread.
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.trace import StatusCode
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from conftest import InMemorySpanExporter
+from ward.instrumentation.openai.utils import ContentLimits, set_content_limits
+from ward.otel import enrichment
+from ward.otel.enrichment import EnrichingSpanExporter, pending_count, set_enrichment_enabled
+
+
+@pytest.fixture()
+def queued():
+    """Ended spans waiting for export, like a BatchSpanProcessor queue."""
+    return InMemorySpanExporter()
+
+
+@pytest.fixture()
+def deferred_tracer(queued):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(queued))
+    EnrichingSpanExporter(InMemorySpanExporter())  # marks the exporter as installed
+    set_enrichment_enabled(True)
+    yield provider.get_tracer("ward-test")
+    set_enrichment_enabled(False)
+    set_content_limits(None)
+    enrichment._PENDING.clear()
+
+
+def _export(queued):
+    exported = InMemorySpanExporter()
+    EnrichingSpanExporter(exported).export(queued.get_finished_spans())
+    return exported.get_finished_spans()
+
+
+def _chat_response():
+    response = MagicMock()
+    response.model_dump.return_value = {
+        "id": "chatcmpl-deferred",
+        "model": "gpt-4o",
+        "choices": [{"message": {"role": "assistant", "content": "Hello there!"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    }
+    return response
+
+
+def _openai_call(tracer, response, content="Hi"):
+    from ward.instrumentation.openai.openai import chat_completions
+
+    wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": True})
+    return wrapper_fn(
+        MagicMock(return_value=response), MagicMock(), (),
+        {"model": "gpt-4o", "messages": [{"role": "user", "content": content}]},
+    )
+
+
+class TestDeferredEnrichment:
+    def test_response_processed_at_export(self, deferred_tracer, queued):
+        response = _chat_response()
+
+        assert _openai_call(deferred_tracer, response) is response
+
+        response.model_dump.assert_not_called()
+        assert pending_count() == 1
+        ended = queued.get_finished_spans()[0]
+        assert ended.attributes["gen_ai.user.message.0"] == "Hi"
+        assert "gen_ai.usage.input_tokens" not in ended.attributes
+
+        time.sleep(0.05)
+        span = _export(queued)[0]
+        assert pending_count() == 0
+        assert span.attributes["gen_ai.user.message.0"] == "Hi"
+        assert span.attributes["gen_ai.response.id"] == "chatcmpl-deferred"
+        assert span.attributes["gen_ai.usage.input_tokens"] == 3
+        assert span.attributes["gen_ai.assistant.message.0"] == "Hello there!"
+        assert span.attributes["gen_ai.client.operation.duration"] < 0.05
+        assert span.status.status_code == StatusCode.OK
+        assert span.end_time == ended.end_time
+
+    def test_processing_error_recorded_on_span(self, deferred_tracer, queued):
+        def process(span):
+            raise RuntimeError("bad response")
+
+        span = deferred_tracer.start_span("chat gpt-4o")
+        assert enrichment.defer_enrichment(span, process)
+        span.end()
+
+        span = _export(queued)[0]
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.events[-1].attributes["exception.message"] == "bad response"
+
+    def test_content_budget_shared_with_request(self, deferred_tracer, queued):
+        set_content_limits(ContentLimits(max_span_bytes=4))
+
+        _openai_call(deferred_tracer, _chat_response(), content="Hi")
+
+        span = _export(queued)[0]
+        assert span.attributes["gen_ai.assistant.message.0"] == "He"
+        assert span.attributes["ward.truncated.attributes"] == ("gen_ai.assistant.message.0",)
+
+    def test_inline_when_disabled(self, deferred_tracer, queued):
+        set_enrichment_enabled(False)
+        response = _chat_response()
+
+        _openai_call(deferred_tracer, response)
+
+        response.model_dump.assert_called_once()
+        assert pending_count() == 0
+        assert queued.get_finished_spans()[0].attributes["gen_ai.usage.input_tokens"] == 3
+
+    def test_anthropic_messages(self, deferred_tracer, queued):
+        from ward.instrumentation.anthropic.anthropic import messages_create
+
+        response = MagicMock()
+        response.model_dump.return_value = {
+            "id": "msg-deferred",
+            "model": "claude-sonnet-4-20250514",
+            "content": [{"type": "text", "text": "Hello from Claude!"}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": 12, "output_tokens": 6},
+        }
+        wrapper_fn = messages_create({"tracer": deferred_tracer, "pricing_info": {}, "capture_message_content": True})
+        wrapper_fn(
+            MagicMock(return_value=response), MagicMock(), (),
+            {"model": "claude-sonnet-4-20250514", "max_tokens": 64, "messages": [{"role": "user", "content": "Hi"}]},
+        )
+
+        response.model_dump.assert_not_called()
+        span = _export(queued)[0]
+        assert span.attributes["gen_ai.usage.output_tokens"] == 6
+        assert span.attributes["gen_ai.assistant.message.0"] == "Hello from Claude!"
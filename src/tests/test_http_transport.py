@@ -0,0 +1,381 @@
+"""
+Unit tests for transport-level instrumentation (ward.instrumentation.http).
+
+Real OpenAI/Anthropic clients send requests through WardTransport wrapped
+around an httpx MockTransport, so request and response bytes go through
+the same code path as on the wire.
+"""
+
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+openai = pytest.importorskip("openai")
+
+from ward.instrumentation.http import AsyncWardTransport, SSEParser, WardTransport, httpInstrumentor
+
+# The httpx package the OpenAI SDK is built on (httpx, or its httpx2 fork)
+httpx = sys.modules[openai.DefaultHttpxClient.__mro__[1].__module__.partition(".")[0]]
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-wire",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-2024-08-06",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hello there!"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 9, "completion_tokens": 3, "total_tokens": 12},
+}
+
+CHAT_CHUNKS = [
+    {"id": "chatcmpl-sse", "model": "gpt-4o", "choices": [{"index": 0, "delta": {"role": "assistant", "content": "Hel"}}]},
+    {"id": "chatcmpl-sse", "model": "gpt-4o", "choices": [{"index": 0, "delta": {"content": "lo"}}]},
+    {"id": "chatcmpl-sse", "model": "gpt-4o", "choices": [{"index": 0, "delta": {"tool_calls": [
+        {"index": 0, "id": "call_1", "type": "function", "function": {"name": "lookup", "arguments": '{"city":'}},
+    ]}}]},
+    {"id": "chatcmpl-sse", "model": "gpt-4o", "choices": [{"index": 0, "delta": {"tool_calls": [
+        {"index": 0, "function": {"arguments": ' "Paris"}'}},
+    ]}, "finish_reason": "tool_calls"}]},
+    {"id": "chatcmpl-sse", "model": "gpt-4o", "choices": [],
+     "usage": {"prompt_tokens": 5, "completion_tokens": 7, "total_tokens": 12}},
+]
+
+MESSAGE = {
+    "id": "msg_wire",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-3-haiku-20240307",
+    "content": [{"type": "text", "text": "Hi from Claude"}],
+    "stop_reason": "end_turn",
+    "usage": {"input_tokens": 4, "output_tokens": 3},
+}
+
+MESSAGE_EVENTS = [
+    ("message_start", {"type": "message_start", "message": {
+        "id": "msg_sse", "type": "message", "role": "assistant", "model": "claude-3-haiku-20240307",
+        "content": [], "usage": {"input_tokens": 6, "output_tokens": 1},
+    }}),
+    ("content_block_start", {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}),
+    ("content_block_delta", {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hi "}}),
+    ("content_block_delta", {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "there"}}),
+    ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+    ("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": 2}}),
+    ("message_stop", {"type": "message_stop"}),
+]
+
+
+def _chat_sse():
+    return b"".join(f"data: {json.dumps(chunk)}\n\n".encode() for chunk in CHAT_CHUNKS) + b"data: [DONE]\n\n"
+
+
+def _message_sse():
+    return b"".join(f"event: {name}\r\ndata: {json.dumps(data)}\r\n\r\n".encode() for name, data in MESSAGE_EVENTS)
+
+
+RESPONSE = {
+    "id": "resp_wire", "object": "response", "created_at": 0, "model": "gpt-4o-2024-08-06", "status": "completed",
+    "parallel_tool_calls": True, "tool_choice": "auto", "tools": [],
+    "output": [{"type": "message", "id": "msg_1", "role": "assistant", "status": "completed",
+                "content": [{"type": "output_text", "text": "Hi there", "annotations": []}]}],
+    "usage": {"input_tokens": 8, "input_tokens_details": {"cached_tokens": 0, "cache_write_tokens": 0},
+              "output_tokens": 2, "output_tokens_details": {"reasoning_tokens": 0}, "total_tokens": 10},
+}
+
+RESPONSE_EVENTS = [
+    {"type": "response.created", "sequence_number": 0,
+     "response": {**RESPONSE, "status": "in_progress", "output": [], "usage": None}},
+    {"type": "response.output_text.delta", "sequence_number": 1, "item_id": "msg_1", "output_index": 0,
+     "content_index": 0, "delta": "Hi ", "logprobs": []},
+    {"type": "response.output_text.delta", "sequence_number": 2, "item_id": "msg_1", "output_index": 0,
+     "content_index": 0, "delta": "there", "logprobs": []},
+    {"type": "response.completed", "sequence_number": 3, "response": RESPONSE},
+]
+
+
+def _response_sse():
+    return b"".join(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode() for event in RESPONSE_EVENTS)
+
+
+def _pieces(body, size=7):
+    """Body split into small chunks, so events straddle chunk boundaries."""
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def _responder(body, content_type="application/json", headers=None, status=200, seen=None):
+    def handler(request):
+        if seen is not None:
+            seen.append(request)
+        return httpx.Response(
+            status,
+            headers={"content-type": content_type, **(headers or {})},
+            content=iter(_pieces(body)),
+        )
+    return handler
+
+
+def _openai_client(tracer, handler, capture=True):
+    config = {"tracer": tracer, "capture_message_content": capture}
+    transport = WardTransport(httpx.MockTransport(handler), config)
+    return openai.OpenAI(
+        api_key="test", base_url="http://llm.local/v1", max_retries=0,
+        http_client=openai.DefaultHttpxClient(transport=transport),
+    )
+
+
+def _original_create(resource):
+    """Unwrapped bound ``create`` (other tests may leave the class instrumented)."""
+    create = type(resource).__dict__["create"]
+    return getattr(create, "__wrapped__", create).__get__(resource)
+
+
+def _chat(client, **kwargs):
+    return _original_create(client.chat.completions)(
+        model="gpt-4o", messages=[{"role": "user", "content": "Hi"}], **kwargs,
+    )
+
+
+class TestSSEParser:
+    def test_events_split_at_every_byte(self):
+        body = b": keep-alive\n\nevent: ping\r\ndata: {\"a\": 1}\r\n\r\ndata:x\ndata: y\n\nid: 3\ndata: [DONE]\n\n"
+        for size in range(1, len(body) + 1):
+            parser = SSEParser()
+            payloads = []
+            for piece in _pieces(body, size):
+                payloads += parser.feed(piece)
+            assert payloads == [b'{"a": 1}', b"x\ny", b"[DONE]"], size
+            assert parser.flush() == []
+
+    def test_flush_returns_unterminated_event(self):
+        parser = SSEParser()
+        assert parser.feed(b"data: one\n\ndata: tw") == [b"one"]
+        assert parser.feed(b"o") == []
+        assert parser.flush() == [b"two"]
+
+
+class TestWardTransport:
+    def test_chat_json_response(self, tracer, span_exporter):
+        client = _openai_client(tracer, _responder(json.dumps(CHAT_COMPLETION).encode()))
+
+        completion = _chat(client, temperature=0.2)
+
+        assert completion.choices[0].message.content == "Hello there!"
+        span = span_exporter.get_finished_spans()[0]
+        attributes = span.attributes
+        assert span.name == "chat gpt-4o"
+        assert attributes["gen_ai.system"] == "openai"
+        assert attributes["server.address"] == "llm.local"
+        assert attributes["gen_ai.request.temperature"] == 0.2
+        assert attributes["gen_ai.user.message.0"] == "Hi"
+        assert attributes["gen_ai.response.id"] == "chatcmpl-wire"
+        assert attributes["gen_ai.response.model"] == "gpt-4o-2024-08-06"
+        assert attributes["gen_ai.usage.input_tokens"] == 9
+        assert attributes["gen_ai.usage.output_tokens"] == 3
+        assert attributes["gen_ai.response.finish_reasons"] == "stop"
+        assert attributes["gen_ai.assistant.message.0"] == "Hello there!"
+        assert attributes["http.client.attempt_status_codes"] == (200,)
+        assert span.status.is_ok
+
+    def test_gzip_json_response(self, tracer, span_exporter):
+        body = gzip.compress(json.dumps(CHAT_COMPLETION).encode())
+        client = _openai_client(tracer, _responder(body, headers={"content-encoding": "gzip"}))
+
+        assert _chat(client).id == "chatcmpl-wire"
+
+        assert span_exporter.get_finished_spans()[0].attributes["gen_ai.usage.input_tokens"] == 9
+
+    def test_compressed_body_inflated_once(self, tracer, span_exporter, monkeypatch):
+        import zlib
+
+        calls = []
+        decompressobj = zlib.decompressobj
+        monkeypatch.setattr(zlib, "decompressobj", lambda *args: calls.append(args) or decompressobj(*args))
+        body = gzip.compress(json.dumps(CHAT_COMPLETION).encode())
+        transport = WardTransport(httpx.MockTransport(_responder(body, headers={"content-encoding": "gzip"})),
+                                  {"tracer": tracer})
+
+        with httpx.Client(transport=transport) as client:
+            response = client.post("http://llm.local/v1/chat/completions", json={"model": "gpt-4o", "messages": []})
+
+        assert response.json() == CHAT_COMPLETION
+        assert "content-encoding" not in response.headers
+        assert len(calls) == 1
+        assert span_exporter.get_finished_spans()[0].attributes["gen_ai.usage.output_tokens"] == 3
+
+    def test_gzip_event_stream(self, tracer, span_exporter):
+        body = gzip.compress(_chat_sse())
+        client = _openai_client(
+            tracer, _responder(body, content_type="text/event-stream", headers={"content-encoding": "gzip"}),
+        )
+
+        chunks = list(_chat(client, stream=True, stream_options={"include_usage": True}))
+
+        assert len(chunks) == len(CHAT_CHUNKS)
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.stream.outcome"] == "completed"
+        assert attributes["gen_ai.usage.output_tokens"] == 7
+
+    def test_raw_deflate_response(self, tracer, span_exporter):
+        import zlib
+
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        body = compressor.compress(json.dumps(CHAT_COMPLETION).encode()) + compressor.flush()
+        client = _openai_client(tracer, _responder(body, headers={"content-encoding": "deflate"}))
+
+        assert _chat(client).id == "chatcmpl-wire"
+        assert span_exporter.get_finished_spans()[0].attributes["gen_ai.usage.input_tokens"] == 9
+
+    def test_chat_event_stream(self, tracer, span_exporter):
+        client = _openai_client(tracer, _responder(_chat_sse(), content_type="text/event-stream"))
+
+        chunks = list(_chat(client, stream=True, stream_options={"include_usage": True}))
+
+        assert len(chunks) == len(CHAT_CHUNKS)
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.request.is_stream"] is True
+        assert attributes["gen_ai.stream.outcome"] == "completed"
+        assert attributes["gen_ai.response.id"] == "chatcmpl-sse"
+        assert attributes["gen_ai.usage.output_tokens"] == 7
+        assert attributes["gen_ai.response.finish_reasons"] == "tool_calls"
+        assert attributes["gen_ai.assistant.message.0"] == "Hello"
+        assert attributes["gen_ai.tool.name.0"] == ("lookup",)
+        assert attributes["gen_ai.tool.args.0"] == ('{"city": "Paris"}',)
+
+    def test_stream_closed_early(self, tracer, span_exporter):
+        client = _openai_client(tracer, _responder(_chat_sse(), content_type="text/event-stream"))
+
+        stream = _chat(client, stream=True)
+        next(iter(stream))
+        stream.close()
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.stream.outcome"] == "closed_early"
+
+    def test_responses_event_stream(self, tracer, span_exporter):
+        client = _openai_client(tracer, _responder(_response_sse(), content_type="text/event-stream"))
+
+        events = list(_original_create(client.responses)(model="gpt-4o", input="Hi", stream=True))
+
+        assert [event.type for event in events] == [event["type"] for event in RESPONSE_EVENTS]
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.user.message.0"] == "Hi"
+        assert attributes["gen_ai.stream.outcome"] == "completed"
+        assert attributes["gen_ai.response.id"] == "resp_wire"
+        assert attributes["gen_ai.usage.output_tokens"] == 2
+        assert attributes["gen_ai.assistant.message.0"] == "Hi there"
+
+    def test_error_status(self, tracer, span_exporter):
+        error = json.dumps({"error": {"message": "slow down", "type": "rate_limit_error"}}).encode()
+        client = _openai_client(tracer, _responder(error, status=429))
+
+        with pytest.raises(openai.RateLimitError):
+            _chat(client)
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["error.type"] == "429"
+        assert not span.status.is_ok
+
+    def test_other_requests_pass_through(self, tracer, span_exporter):
+        seen = []
+        client = _openai_client(tracer, _responder(b'{"object": "list", "data": []}', seen=seen))
+
+        client.models.list()
+
+        assert seen and not span_exporter.get_finished_spans()
+
+    def test_inside_sdk_wrapper_left_to_wrapper(self, tracer, span_exporter):
+        from ward.instrumentation.openai.openai import chat_completions
+
+        client = _openai_client(tracer, _responder(json.dumps(CHAT_COMPLETION).encode()))
+        completions = client.chat.completions
+        wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": False})
+        wrapper_fn(
+            _original_create(completions), completions, (),
+            {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hi"}]},
+        )
+
+        assert len(span_exporter.get_finished_spans()) == 1
+
+    def test_anthropic_messages(self, tracer, span_exporter):
+        anthropic = pytest.importorskip("anthropic")
+        handler = _responder(json.dumps(MESSAGE).encode())
+        transport = WardTransport(httpx.MockTransport(handler), {"tracer": tracer, "capture_message_content": True})
+        client = anthropic.Anthropic(
+            api_key="test", base_url="http://llm.local", max_retries=0,
+            http_client=anthropic.DefaultHttpxClient(transport=transport),
+        )
+
+        _original_create(client.messages)(model="claude-3-haiku-20240307", max_tokens=16, messages=[{"role": "user", "content": "Hi"}])
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.system"] == "anthropic"
+        assert attributes["gen_ai.usage.input_tokens"] == 4
+        assert attributes["gen_ai.response.finish_reasons"] == "end_turn"
+        assert attributes["gen_ai.assistant.message.0"] == "Hi from Claude"
+
+    def test_anthropic_event_stream(self, tracer, span_exporter):
+        anthropic = pytest.importorskip("anthropic")
+        handler = _responder(_message_sse(), content_type="text/event-stream")
+        transport = WardTransport(httpx.MockTransport(handler), {"tracer": tracer, "capture_message_content": True})
+        client = anthropic.Anthropic(
+            api_key="test", base_url="http://llm.local", max_retries=0,
+            http_client=anthropic.DefaultHttpxClient(transport=transport),
+        )
+
+        stream = _original_create(client.messages)(
+            model="claude-3-haiku-20240307", max_tokens=16, stream=True, messages=[{"role": "user", "content": "Hi"}],
+        )
+        assert [event.type for event in stream][-1] == "message_stop"
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.stream.outcome"] == "completed"
+        assert attributes["gen_ai.usage.input_tokens"] == 6
+        assert attributes["gen_ai.usage.output_tokens"] == 2
+        assert attributes["gen_ai.assistant.message.0"] == "Hi there"
+
+    @pytest.mark.asyncio
+    async def test_async_event_stream(self, tracer, span_exporter):
+        body = _chat_sse()
+
+        async def chunks():
+            for piece in _pieces(body):
+                yield piece
+
+        def handler(request):
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=chunks())
+
+        transport = AsyncWardTransport(httpx.MockTransport(handler), {"tracer": tracer})
+        client = openai.AsyncOpenAI(
+            api_key="test", base_url="http://llm.local/v1", max_retries=0,
+            http_client=openai.DefaultAsyncHttpxClient(transport=transport),
+        )
+
+        stream = await _original_create(client.chat.completions)(
+            model="gpt-4o", messages=[{"role": "user", "content": "Hi"}], stream=True,
+        )
+        async for _ in stream:
+            pass
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.stream.outcome"] == "completed"
+        assert attributes["gen_ai.usage.input_tokens"] == 5
+
+
+class TestHttpInstrumentor:
+    def test_installs_transport_on_new_clients(self, tracer):
+        instrumentor = httpInstrumentor(tracer=tracer)
+        instrumentor.instrument()
+        try:
+            client = openai.OpenAI(api_key="test", base_url="http://llm.local/v1")
+            assert isinstance(client._client._transport, WardTransport)
+            # Clients derived from it share the httpx client; no second layer
+            assert client.with_options(timeout=5)._client._transport is client._client._transport
+        finally:
+            instrumentor.uninstrument()
+
+        assert not isinstance(openai.OpenAI(api_key="test")._client._transport, WardTransport)
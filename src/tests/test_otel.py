@@ -0,0 +1,289 @@
+"""
+Unit tests for Ward's OpenTelemetry plumbing (processors, tracer setup).
+"""
+
+import collections
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from ward.otel.processors import ImmediateSpanProcessor
+from conftest import InMemorySpanExporter
+
+
+class SlowExporter(InMemorySpanExporter):
+    """Exporter that blocks for ``delay`` seconds per export, like a slow collector."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.export_threads = set()
+
+    def export(self, spans):
+        self.export_threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        return super().export(spans)
+
+    def shutdown(self):
+        # Keep captured spans so tests can inspect them after processor shutdown
+        pass
+
+
+def _tracer_with(processor):
+    provider = TracerProvider(shutdown_on_exit=False)
+    provider.add_span_processor(processor)
+    return provider.get_tracer("ward-test")
+
+
+# ---------------------------------------------------------------------------
+# ImmediateSpanProcessor
+# ---------------------------------------------------------------------------
+
+
+class TestImmediateSpanProcessor:
+    def test_exports_from_background_thread(self):
+        exporter = SlowExporter(delay=0)
+        processor = ImmediateSpanProcessor(exporter)
+        _tracer_with(processor).start_span("op").end()
+
+        deadline = time.monotonic() + 2
+        while not exporter.get_finished_spans() and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        assert [s.name for s in exporter.get_finished_spans()] == ["op"]
+        assert threading.get_ident() not in exporter.export_threads
+        processor.shutdown()
+
+    def test_slow_exporter_does_not_block_span_end(self):
+        exporter = SlowExporter(delay=0.3)
+        processor = ImmediateSpanProcessor(exporter)
+        tracer = _tracer_with(processor)
+
+        start = time.perf_counter()
+        for i in range(20):
+            tracer.start_span(f"op-{i}").end()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.1
+        assert processor.force_flush(5000)
+        assert len(exporter.get_finished_spans()) == 20
+        processor.shutdown()
+
+    def test_full_queue_drops_spans(self):
+        exporter = SlowExporter(delay=0.5)
+        processor = ImmediateSpanProcessor(exporter, max_queue_size=5, max_export_batch_size=1)
+        tracer = _tracer_with(processor)
+
+        for i in range(50):
+            tracer.start_span(f"op-{i}").end()
+
+        assert processor.dropped_spans > 0
+        processor.shutdown()
+
+    def test_concurrent_span_ends_respect_bound_and_count_drops(self):
+        release = threading.Event()
+
+        class BlockedExporter(InMemorySpanExporter):
+            def export(self, spans):
+                release.wait(5)
+                return super().export(spans)
+
+            def shutdown(self):
+                pass
+
+        class YieldingDeque(collections.deque):
+            # Give other threads a chance to run between the bound check and the append
+            def __len__(self):
+                length = super().__len__()
+                time.sleep(0)
+                return length
+
+        exporter = BlockedExporter()
+        processor = ImmediateSpanProcessor(exporter, max_queue_size=50, max_export_batch_size=1)
+        processor._queue = YieldingDeque()
+        tracer = _tracer_with(processor)
+        spans = [tracer.start_span(f"op-{i}") for i in range(2000)]
+        threads = [threading.Thread(target=lambda part=spans[i::8]: [s.end() for s in part]) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        queued = super(YieldingDeque, processor._queue).__len__()
+        release.set()
+        processor.shutdown()
+
+        exported = len(exporter.get_finished_spans())
+        assert queued <= 50
+        assert exported + processor.dropped_spans == 2000
+
+    def test_burst_of_spans_shares_one_export(self):
+        class CountingExporter(InMemorySpanExporter):
+            calls = 0
+
+            def export(self, spans):
+                self.calls += 1
+                return super().export(spans)
+
+        exporter = CountingExporter()
+        processor = ImmediateSpanProcessor(exporter, coalesce_millis=200)
+        tracer = _tracer_with(processor)
+        for i in range(10):
+            tracer.start_span(f"op-{i}").end()
+
+        assert processor.force_flush(2000)
+        assert exporter.calls == 1
+        assert len(exporter.get_finished_spans()) == 10
+        processor.shutdown()
+
+    def test_shutdown_flushes_pending_spans(self):
+        exporter = SlowExporter(delay=0.05)
+        processor = ImmediateSpanProcessor(exporter, max_export_batch_size=2)
+        tracer = _tracer_with(processor)
+        for i in range(10):
+            tracer.start_span(f"op-{i}").end()
+
+        processor.shutdown()
+
+        assert len(exporter.get_finished_spans()) == 10
+
+    def test_exporter_failure_does_not_kill_worker(self):
+        class FailingOnce(InMemorySpanExporter):
+            calls = 0
+
+            def export(self, spans):
+                self.calls += 1
+                if self.calls == 1:
+                    raise RuntimeError("collector down")
+                return super().export(spans)
+
+        exporter = FailingOnce()
+        processor = ImmediateSpanProcessor(exporter)
+        tracer = _tracer_with(processor)
+        tracer.start_span("lost").end()
+        assert processor.force_flush(2000)
+        tracer.start_span("kept").end()
+        assert processor.force_flush(2000)
+
+        assert [s.name for s in exporter.get_finished_spans()] == ["kept"]
+        processor.shutdown()
+
+
+# ---------------------------------------------------------------------------
+# Fork safety
+# ---------------------------------------------------------------------------
+
+
+class RecordingCollector:
+    """OTLP/HTTP endpoint on localhost that records the name of every span it receives."""
+
+    def __init__(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+        self.span_names = []
+        self._lock = threading.Lock()
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                request = ExportTraceServiceRequest()
+                request.ParseFromString(body)
+                names = [
+                    span.name
+                    for resource_spans in request.resource_spans
+                    for scope_spans in resource_spans.scope_spans
+                    for span in scope_spans.spans
+                ]
+                with collector._lock:
+                    collector.span_names.extend(names)
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def endpoint(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1/traces"
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+class TestForkSafety:
+    WORKERS = 4
+    SPANS_PER_WORKER = 300
+
+    @pytest.mark.parametrize("use_batch", [True, False], ids=["batch", "immediate"])
+    def test_forked_workers_export_every_span_exactly_once(self, use_batch):
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from ward.otel.exporters import create_span_processor
+        from ward.otel.tracer import _register_fork_handlers
+
+        collector = RecordingCollector()
+        exporter = OTLPSpanExporter(endpoint=collector.endpoint, timeout=5)
+        _register_fork_handlers(exporter)
+        provider = TracerProvider(shutdown_on_exit=False)
+        provider.add_span_processor(create_span_processor(exporter, use_batch=use_batch))
+        tracer = provider.get_tracer("ward-test")
+
+        # Keep the parent busy while forking so children inherit a live queue
+        stop = threading.Event()
+        parent_count = [0]
+
+        def parent_load():
+            while not stop.is_set():
+                tracer.start_span(f"parent-{parent_count[0]}").end()
+                parent_count[0] += 1
+                time.sleep(0.0005)
+
+        load = threading.Thread(target=parent_load)
+        load.start()
+        time.sleep(0.05)
+
+        pids = []
+        for worker in range(self.WORKERS):
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    for i in range(self.SPANS_PER_WORKER):
+                        tracer.start_span(f"child-{worker}-{i}").end()
+                    code = 0 if provider.force_flush(10000) else 1
+                finally:
+                    os._exit(code)
+            pids.append(pid)
+
+        for pid in pids:
+            _, status = os.waitpid(pid, 0)
+            assert os.WEXITSTATUS(status) == 0
+
+        stop.set()
+        load.join()
+        assert provider.force_flush(10000)
+        provider.shutdown()
+        collector.close()
+
+        expected = {f"parent-{i}" for i in range(parent_count[0])}
+        expected |= {f"child-{w}-{i}" for w in range(self.WORKERS) for i in range(self.SPANS_PER_WORKER)}
+        received = collections.Counter(collector.span_names)
+        assert set(received) == expected
+        assert max(received.values()) == 1
@@ -0,0 +1,348 @@
+"""
+Unit tests for the hot-reloadable sampling/capture policy.
+"""
+
+import json
+import os
+import random
+import signal
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
+from opentelemetry.trace import NonRecordingSpan, SpanContext
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from ward.policy import (
+    Policy,
+    PolicyFileWatcher,
+    get_policy,
+    install_reload_signal,
+    load_policy,
+    set_policy,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_policy():
+    previous = get_policy()
+    yield
+    set_policy(previous)
+
+
+def _openai_call(tracer, capture=True, content="Hi"):
+    from ward.instrumentation.openai.openai import chat_completions
+
+    wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": capture})
+    response = MagicMock()
+    response.model_dump.return_value = {
+        "id": "chatcmpl-policy",
+        "model": "gpt-4o",
+        "choices": [{"message": {"role": "assistant", "content": "Hello there!"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    }
+    wrapped = MagicMock(return_value=response)
+    result = wrapper_fn(
+        wrapped, MagicMock(), (), {"model": "gpt-4o", "messages": [{"role": "user", "content": content}]}
+    )
+    return result, response
+
+
+def _span_with(trace_id):
+    return NonRecordingSpan(SpanContext(trace_id, 1, is_remote=False))
+
+
+class TestPolicy:
+    def test_model_overrides_exact_and_pattern(self):
+        policy = Policy(
+            sample_rate=0.5,
+            models={"gpt-4o": {"sample_rate": 1.0}, "claude-*": {"capture_message_content": False}},
+        )
+
+        assert policy.for_model("gpt-4o").sample_rate == 1.0
+        claude = policy.for_model("claude-3-haiku-20240307")
+        assert claude.capture_message_content is False
+        assert claude.sample_rate == 0.5
+        assert policy.for_model("o1") is policy
+        assert policy.for_model("gpt-4o") is policy.for_model("gpt-4o")
+
+    def test_capture_defers_to_instrumentor_when_unset(self):
+        assert Policy().capture_content(True) is True
+        assert Policy().capture_content(False) is False
+        assert Policy(capture_message_content=True).capture_content(False) is True
+
+    def test_operation_overrides_and_model_precedence(self):
+        policy = Policy(
+            content_sample_rate=0.5,
+            operations={"embeddings": {"content_sample_rate": 0.0}, "chat": {"max_content_length": 10}},
+            models={"gpt-4o": {"max_content_length": 20}},
+        )
+
+        assert policy.for_model("text-embedding-3-small", "embeddings").content_sample_rate == 0.0
+        assert policy.for_model("gpt-4o-mini", "chat").max_content_length == 10
+        assert policy.for_model("gpt-4o", "chat").max_content_length == 20
+        assert policy.for_model("gpt-4o-mini", "image") is policy
+
+    def test_content_sampling_is_deterministic_per_trace(self):
+        policy = Policy(content_sample_rate=0.25)
+
+        rng = random.Random(7)
+        trace_ids = [rng.getrandbits(128) for _ in range(4000)]
+        decisions = [policy.capture_content(True, _span_with(t)) for t in trace_ids]
+        assert decisions == [policy.capture_content(True, _span_with(t)) for t in trace_ids]
+        assert 0.2 < sum(decisions) / len(decisions) < 0.3
+        # Content sampling never turns capture on
+        assert not any(policy.capture_content(False, _span_with(t)) for t in trace_ids)
+        assert Policy(content_sample_rate=0.0).capture_content(True, _span_with(trace_ids[0])) is False
+
+    def test_content_sampling_independent_of_trace_id_ratio_sampler(self):
+        sampler = TraceIdRatioBased(0.10)
+        policy = Policy(content_sample_rate=0.02)
+        rng = random.Random(11)
+        sampled = []
+        for _ in range(100000):
+            trace_id = rng.getrandbits(128)
+            if sampler.should_sample(None, trace_id, "span").decision.is_sampled():
+                sampled.append(policy.capture_content(True, _span_with(trace_id)))
+
+        assert 0.014 < sum(sampled) / len(sampled) < 0.026
+
+    def test_invalid_policy_rejected(self):
+        with pytest.raises(ValueError):
+            Policy(content_sample_rate=-0.1)
+        with pytest.raises(ValueError):
+            Policy(operations={"chat": {"bogus": 1}})
+        with pytest.raises(ValueError):
+            Policy(content_format="yaml")
+        with pytest.raises(ValueError):
+            Policy(sample_rate=2)
+        with pytest.raises(ValueError):
+            Policy.from_dict({"sample_rat": 1.0})
+        with pytest.raises(ValueError):
+            Policy(models={"gpt-4o": {"bogus": 1}})
+
+    def test_bad_file_keeps_current_policy(self, tmp_path):
+        current = Policy(sample_rate=0.25)
+        set_policy(current)
+        path = tmp_path / "policy.json"
+        path.write_text("{not json")
+
+        assert load_policy(str(path)) is False
+        assert get_policy() is current
+
+    def test_non_object_sections_keep_current_policy(self, tmp_path):
+        current = Policy(sample_rate=0.25)
+        set_policy(current)
+        path = tmp_path / "policy.json"
+        for data in ({"models": ["gpt-4o"]}, {"operations": {"chat": 0.5}}, ["sample_rate"]):
+            path.write_text(json.dumps(data))
+
+            assert load_policy(str(path)) is False
+            assert get_policy() is current
+
+    def test_invalid_override_values_keep_current_policy(self, tmp_path):
+        current = Policy(sample_rate=0.25)
+        set_policy(current)
+        path = tmp_path / "policy.json"
+        for data in (
+            {"models": {"gpt-4o": {"sample_rate": 1.5}}},
+            {"operations": {"chat": {"content_format": "yaml"}}},
+            {"models": {"claude-*": {"max_content_length": "long"}}},
+        ):
+            path.write_text(json.dumps(data))
+
+            assert load_policy(str(path)) is False
+            assert get_policy() is current
+
+    def test_unresolvable_override_falls_back_to_base(self):
+        policy = Policy(sample_rate=0.5, models={"gpt-4o": {"sample_rate": 1.0}})
+        # Bypass load-time validation, as a policy built by hand could
+        policy.models["gpt-4o"]["sample_rate"] = 1.5
+
+        assert policy.for_model("gpt-4o", "chat") is policy
+
+    def test_watcher_reloads_on_change(self, tmp_path):
+        path = tmp_path / "policy.json"
+        path.write_text(json.dumps({"sample_rate": 0.5}))
+        watcher = PolicyFileWatcher(str(path))
+
+        assert watcher.check() is True
+        assert get_policy().sample_rate == 0.5
+        assert watcher.check() is False
+
+        path.write_text(json.dumps({"sample_rate": 0.1}))
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        assert watcher.check() is True
+        assert get_policy().sample_rate == 0.1
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="requires SIGHUP")
+    def test_sighup_reloads(self, tmp_path):
+        path = tmp_path / "policy.json"
+        path.write_text(json.dumps({"capture_message_content": False}))
+        watcher = PolicyFileWatcher(str(path), interval=0.01).start()
+        set_policy(Policy())
+        previous_handler = signal.getsignal(signal.SIGHUP)
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+        try:
+            assert install_reload_signal(watcher) is True
+            os.kill(os.getpid(), signal.SIGHUP)
+            # Reloaded by the watcher thread, not in the handler
+            deadline = time.monotonic() + 5
+            while get_policy().capture_message_content is not False and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert get_policy().capture_message_content is False
+        finally:
+            watcher.stop()
+            signal.signal(signal.SIGHUP, previous_handler)
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="requires SIGHUP")
+    def test_existing_sighup_handler_kept_unless_chained(self, tmp_path):
+        calls = []
+
+        def app_handler(signum, frame):
+            calls.append(signum)
+
+        watcher = PolicyFileWatcher(str(tmp_path / "policy.json"))
+        previous_handler = signal.signal(signal.SIGHUP, app_handler)
+        try:
+            assert install_reload_signal(watcher) is False
+            assert signal.getsignal(signal.SIGHUP) is app_handler
+
+            assert install_reload_signal(watcher, chain=True) is True
+            signal.getsignal(signal.SIGHUP)(signal.SIGHUP, None)
+            assert watcher._reload_requested is True
+            assert calls == [signal.SIGHUP]
+
+            # Re-init points the installed handler at the new watcher
+            replacement = PolicyFileWatcher(str(tmp_path / "policy.json"))
+            assert install_reload_signal(replacement) is True
+            signal.getsignal(signal.SIGHUP)(signal.SIGHUP, None)
+            assert replacement._reload_requested is True
+            assert calls == [signal.SIGHUP, signal.SIGHUP]
+        finally:
+            signal.signal(signal.SIGHUP, previous_handler)
+
+    def test_requested_reload_rereads_unchanged_file(self, tmp_path):
+        path = tmp_path / "policy.json"
+        path.write_text(json.dumps({"sample_rate": 0.5}))
+        watcher = PolicyFileWatcher(str(path))
+        assert watcher.check() is True
+        set_policy(Policy())
+
+        assert watcher.check() is False
+        watcher.request_reload()
+        assert watcher.check() is True
+        assert get_policy().sample_rate == 0.5
+
+
+class TestPolicyInWrappers:
+    def test_sampled_out_call_is_passed_through(self, tracer, span_exporter):
+        set_policy(Policy(sample_rate=0.0))
+
+        result, response = _openai_call(tracer)
+
+        assert result is response
+        assert span_exporter.get_finished_spans() == []
+
+    def test_broken_override_does_not_fail_the_call(self, tracer, span_exporter):
+        policy = Policy(models={"gpt-4o": {"capture_message_content": False}})
+        policy.models["gpt-4o"]["content_format"] = "yaml"
+        set_policy(policy)
+
+        result, response = _openai_call(tracer)
+
+        assert result is response
+        assert len(span_exporter.get_finished_spans()) == 1
+
+    def test_per_model_capture_override(self, tracer, span_exporter):
+        set_policy(Policy(models={"gpt-4o": {"capture_message_content": False}}))
+
+        _openai_call(tracer, capture=True)
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert "gen_ai.user.message.0" not in attributes
+        assert "gen_ai.assistant.message.0" not in attributes
+
+    def test_content_sampling_shared_across_a_trace(self, tracer, span_exporter):
+        set_policy(Policy(content_sample_rate=0.5))
+
+        for _ in range(40):
+            with tracer.start_as_current_span("agent turn"):
+                _openai_call(tracer)
+                _openai_call(tracer)
+
+        by_trace = {}
+        for span in span_exporter.get_finished_spans():
+            if span.name != "agent turn":
+                by_trace.setdefault(span.context.trace_id, []).append("gen_ai.user.message.0" in span.attributes)
+        assert all(len(set(captured)) == 1 for captured in by_trace.values())
+        assert {captured[0] for captured in by_trace.values()} == {True, False}
+        # Metadata is recorded either way
+        assert all("gen_ai.usage.input_tokens" in s.attributes for s in span_exporter.get_finished_spans()
+                   if s.name != "agent turn")
+
+    def test_json_content_format(self, tracer, span_exporter):
+        set_policy(Policy(content_format="json", max_content_length=5))
+
+        _openai_call(tracer, content="a" * 100)
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert json.loads(attributes["gen_ai.prompt"]) == [{"role": "user", "content": "aaaaa"}]
+        assert json.loads(attributes["gen_ai.output_messages"]) == [
+            {"role": "assistant", "content": "Hello", "finish_reason": "stop"}
+        ]
+        assert not any(key.startswith(("gen_ai.user.message", "gen_ai.assistant.message")) for key in attributes)
+
+    def test_json_content_format_anthropic(self, tracer, span_exporter):
+        from ward.instrumentation.anthropic.anthropic import messages_create
+
+        set_policy(Policy(content_format="json"))
+        wrapper_fn = messages_create({"tracer": tracer, "capture_message_content": True})
+        response = MagicMock()
+        response.model_dump.return_value = {
+            "model": "claude-3-haiku-20240307",
+            "content": [{"type": "text", "text": "Hi "}, {"type": "text", "text": "there"}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": 3, "output_tokens": 2},
+        }
+        wrapper_fn(MagicMock(return_value=response), MagicMock(), (), {
+            "model": "claude-3-haiku-20240307",
+            "system": "Be brief",
+            "messages": [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}],
+        })
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert json.loads(attributes["gen_ai.prompt"]) == [
+            {"role": "system", "content": "Be brief"},
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello"},
+        ]
+        assert json.loads(attributes["gen_ai.output_messages"]) == [
+            {"role": "assistant", "content": "Hi there", "finish_reason": "end_turn"}
+        ]
+
+    def test_stdlib_json_fallback(self, monkeypatch):
+        from ward.instrumentation.openai import utils
+
+        value = [{"role": "user", "content": "héllo", "tool_calls": [object()]}]
+        fast = utils.json_dumps(value)
+        monkeypatch.setattr(utils, "orjson", None)
+        slow = utils.json_dumps(value)
+
+        assert json.loads(slow)[0]["content"] == json.loads(fast)[0]["content"] == "héllo"
+        assert isinstance(json.loads(slow)[0]["tool_calls"][0], str)
+
+    def test_max_content_length_truncates(self, tracer, span_exporter):
+        set_policy(Policy(max_content_length=5))
+
+        _openai_call(tracer, content="a" * 100)
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.user.message.0"] == "aaaaa"
+        assert attributes["gen_ai.assistant.message.0"] == "Hello"
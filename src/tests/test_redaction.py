@@ -0,0 +1,212 @@
+"""
+Unit tests for content redaction, inline and on the export thread.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from ward.instrumentation.openai.utils import set_redactor
+from ward.otel.exporters import RedactingSpanExporter
+from ward.policy import Policy, get_policy, set_policy
+from ward.redaction import RedactionRule, Redactor
+
+PII_TEXT = (
+    "Mail jane.doe+work@example.co.uk or call +1 415 555 0100 / (415) 555-0199. "
+    "Key sk-proj-AbCdEfGhIjKlMnOpQrStUv12, card 4111 1111 1111 1111."
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_redaction():
+    previous = get_policy()
+    yield
+    set_redactor(None)
+    set_policy(previous)
+
+
+def _openai_call(tracer, content, tool_args=None):
+    from ward.instrumentation.openai.openai import chat_completions
+
+    wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": True})
+    message = {"role": "assistant", "content": "Reach me at ops@example.com"}
+    if tool_args is not None:
+        message["tool_calls"] = [
+            {"id": "call_1", "type": "function", "function": {"name": "lookup", "arguments": tool_args}}
+        ]
+    response = MagicMock()
+    response.model_dump.return_value = {
+        "id": "chatcmpl-redact",
+        "model": "gpt-4o",
+        "choices": [{"message": message, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    }
+    wrapper_fn(
+        MagicMock(return_value=response), MagicMock(), (),
+        {"model": "gpt-4o", "messages": [{"role": "user", "content": content}]},
+    )
+
+
+class TestRedactor:
+    def test_builtin_rules(self):
+        redacted = Redactor().redact(PII_TEXT)
+
+        assert redacted == (
+            "Mail [REDACTED:email] or call [REDACTED:phone] / [REDACTED:phone]. "
+            "Key [REDACTED:api_key], card [REDACTED:card_number]."
+        )
+
+    def test_card_numbers_need_a_valid_checksum(self):
+        redactor = Redactor(builtin=["card_number"])
+
+        assert redactor.redact("order 4111 1111 1111 1112") == "order 4111 1111 1111 1112"
+        assert redactor.redact("card 5500-0000-0000-0004") == "card [REDACTED:card_number]"
+
+    def test_plain_numbers_are_kept(self):
+        text = "timestamp 1700000000, version 2024-11-20, total 1234567"
+
+        assert Redactor().redact(text) == text
+
+    def test_matches_inside_anchor_runs(self):
+        # The phone number starts mid-way through the run of digits, the key mid-way through "k_"
+        redactor = Redactor()
+
+        assert redactor.redact("ids 12 415-555-0100") == "ids 12 [REDACTED:phone]"
+        assert redactor.redact("x=rk_live_0123456789abcdefXYZ;") == "x=[REDACTED:api_key];"
+        assert redactor.redact("a@b.io,c@d.io") == "[REDACTED:email],[REDACTED:email]"
+
+    def test_custom_rules_with_groups(self):
+        redactor = Redactor(
+            rules=[
+                RedactionRule("ticket", r"\bTCK-(\d{3})-(?P<suffix>\d{3})\b"),
+                RedactionRule("account", r"acct:(\w+)", replacement="<account>"),
+            ],
+            builtin=["email"],
+        )
+
+        redacted = redactor.redact("TCK-123-456 for acct:alice, cc bob@example.com")
+
+        assert redacted == "[REDACTED:ticket] for <account>, cc [REDACTED:email]"
+
+    def test_no_rules_is_a_no_op(self):
+        assert Redactor(builtin=()).redact(PII_TEXT) == PII_TEXT
+
+    def test_unknown_builtin_rejected(self):
+        with pytest.raises(ValueError):
+            Redactor(builtin=["passport"])
+
+    def test_long_tokens_scan_in_linear_time(self):
+        text = "a" * 200_000 + " " + "1" * 200_000
+
+        start = time.perf_counter()
+        Redactor().redact(text)
+
+        assert time.perf_counter() - start < 1.0
+
+
+class TestInlineRedaction:
+    def test_attribute_layout(self, tracer, span_exporter):
+        set_redactor(Redactor())
+
+        _openai_call(tracer, PII_TEXT, tool_args='{"email": "jane@example.com"}')
+
+        attrs = span_exporter.get_finished_spans()[0].attributes
+        assert "example" not in attrs["gen_ai.user.message.0"]
+        assert "[REDACTED:card_number]" in attrs["gen_ai.user.message.0"]
+        assert attrs["gen_ai.assistant.message.0"] == "Reach me at [REDACTED:email]"
+        assert attrs["gen_ai.tool.args.0"] == ('{"email": "[REDACTED:email]"}',)
+
+    def test_json_layout_stays_valid(self, tracer, span_exporter):
+        set_policy(Policy(content_format="json"))
+        set_redactor(Redactor())
+
+        _openai_call(tracer, PII_TEXT, tool_args='{"email": "jane@example.com"}')
+
+        attrs = span_exporter.get_finished_spans()[0].attributes
+        prompt = json.loads(attrs["gen_ai.prompt"])
+        assert "[REDACTED:email]" in prompt[0]["content"]
+        output = json.loads(attrs["gen_ai.output_messages"])
+        assert output[0]["content"] == "Reach me at [REDACTED:email]"
+        assert "jane@example.com" not in attrs["gen_ai.output_messages"]
+
+    def test_redacts_before_truncating(self, tracer, span_exporter):
+        # A cut through the address would leave "jane.doe@exam", which no rule matches
+        set_policy(Policy(max_content_length=20))
+        set_redactor(Redactor())
+
+        _openai_call(tracer, "Hi jane.doe@example.com")
+
+        assert span_exporter.get_finished_spans()[0].attributes["gen_ai.user.message.0"] == "Hi [REDACTED:email]"
+
+    def test_json_layout_redacted_once_before_truncating(self, tracer, span_exporter):
+        set_policy(Policy(content_format="json", max_content_length=20))
+        redactor = Redactor()
+        seen = []
+        redact = redactor.redact
+        redactor.redact = lambda text: seen.append(text) or redact(text)
+        set_redactor(redactor)
+
+        _openai_call(tracer, "Hi jane.doe@example.com")
+
+        prompt = json.loads(span_exporter.get_finished_spans()[0].attributes["gen_ai.prompt"])
+        assert prompt[0]["content"] == "Hi [REDACTED:email]"
+        assert not any("[REDACTED" in text for text in seen)
+
+    def test_deferred_redactor_leaves_inline_content(self, tracer, span_exporter):
+        set_redactor(Redactor(defer=True), deferred=True)
+
+        _openai_call(tracer, "Hi jane.doe@example.com")
+
+        assert span_exporter.get_finished_spans()[0].attributes["gen_ai.user.message.0"] == "Hi jane.doe@example.com"
+
+
+    def test_deferred_redactor_without_exporter_redacts_inline(self, tracer, span_exporter):
+        set_redactor(Redactor(defer=True))
+
+        _openai_call(tracer, "Hi jane.doe@example.com")
+
+        assert span_exporter.get_finished_spans()[0].attributes["gen_ai.user.message.0"] == "Hi [REDACTED:email]"
+
+    def test_reinit_with_deferred_redactor(self, tracer, span_exporter):
+        # The provider (and any redacting exporter) comes from the first init()
+        import ward
+
+        ward.init(application_name="test", environment="test")
+        ward.init(application_name="test", environment="test", redactor=Redactor(defer=True))
+
+        _openai_call(tracer, "Hi jane.doe@example.com")
+
+        assert span_exporter.get_finished_spans()[0].attributes["gen_ai.user.message.0"] == "Hi [REDACTED:email]"
+
+
+class TestDeferredRedaction:
+    def test_exporter_redacts_content_attributes(self, span_exporter):
+        redactor = Redactor(defer=True)
+        set_redactor(redactor, deferred=True)
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(RedactingSpanExporter(span_exporter, redactor)))
+
+        _openai_call(provider.get_tracer("ward-test"), PII_TEXT)
+
+        span = span_exporter.get_finished_spans()[0]
+        assert "[REDACTED:email]" in span.attributes["gen_ai.user.message.0"]
+        assert span.attributes["gen_ai.assistant.message.0"] == "Reach me at [REDACTED:email]"
+        assert span.attributes["gen_ai.request.model"] == "gpt-4o"
+        assert span.name == "chat gpt-4o"
+
+    def test_spans_without_matches_pass_through(self, span_exporter):
+        span = ReadableSpan(name="plain", attributes={"gen_ai.user.message.0": "nothing to hide"})
+
+        RedactingSpanExporter(span_exporter, Redactor()).export([span])
+
+        assert span_exporter.get_finished_spans()[0] is span
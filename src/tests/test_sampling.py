@@ -0,0 +1,186 @@
+"""
+Unit tests for the rate-limited sampler and error-span admission.
+"""
+
+import random
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.sampling import Decision
+from opentelemetry.trace import Status, StatusCode
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from ward.otel import sampling
+from ward.otel.processors import ErrorAdmittingSpanProcessor
+from ward.otel.sampling import RateLimitingSampler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(sampling.time, "monotonic", clock)
+    return clock
+
+
+def _llm_attributes(model="gpt-4o", operation="chat"):
+    return {"gen_ai.system": "openai", "gen_ai.request.model": model, "gen_ai.operation.type": operation}
+
+
+def _decide(sampler, attributes=None):
+    return sampler.should_sample(None, 1, "span", attributes=attributes)
+
+
+def _provider(sampler, span_exporter):
+    provider = TracerProvider(sampler=sampler)
+    provider.add_span_processor(ErrorAdmittingSpanProcessor(SimpleSpanProcessor(span_exporter)))
+    return provider
+
+
+class TestRateLimitingSampler:
+    def test_global_cap(self, clock):
+        sampler = RateLimitingSampler(spans_per_second=10)
+
+        decisions = [_decide(sampler).decision for _ in range(1000)]
+
+        assert decisions.count(Decision.RECORD_AND_SAMPLE) == 10
+        assert set(decisions[10:]) == {Decision.RECORD_ONLY}
+
+    def test_per_key_caps_are_independent(self, clock):
+        sampler = RateLimitingSampler(spans_per_second=None, per_key_spans_per_second=5)
+
+        kept = {}
+        for _ in range(100):
+            for model in ("gpt-4o", "gpt-4o-mini"):
+                if _decide(sampler, _llm_attributes(model)).decision is Decision.RECORD_AND_SAMPLE:
+                    kept[model] = kept.get(model, 0) + 1
+        # Spans without gen_ai.system have no key and no global cap here
+        assert _decide(sampler).decision is Decision.RECORD_AND_SAMPLE
+
+        assert kept == {"gpt-4o": 5, "gpt-4o-mini": 5}
+
+    def test_stamps_probability_for_reweighting(self, clock):
+        random.seed(7)
+        sampler = RateLimitingSampler(spans_per_second=10)
+
+        # One second at 100 offered spans/s establishes the offered rate
+        for _ in range(100):
+            _decide(sampler)
+            clock.now += 0.01
+        kept = []
+        for _ in range(100):
+            result = _decide(sampler)
+            if result.decision is Decision.RECORD_AND_SAMPLE:
+                kept.append(result.attributes["ward.sampling.probability"])
+            clock.now += 0.01
+
+        assert all(p == pytest.approx(0.1) for p in kept)
+        # Re-weighted count estimates the offered count
+        assert 30 <= sum(1 / p for p in kept) <= 200
+
+    def test_cap_holds_across_threads(self, clock):
+        sampler = RateLimitingSampler(spans_per_second=50, per_key_spans_per_second=50)
+        kept = []
+
+        def worker():
+            count = sum(
+                _decide(sampler, _llm_attributes()).decision is Decision.RECORD_AND_SAMPLE for _ in range(1000)
+            )
+            kept.append(count)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(kept) == 50
+
+    def test_drop_instead_of_record_only(self, clock):
+        sampler = RateLimitingSampler(spans_per_second=1, admit_errors=False)
+
+        assert _decide(sampler).decision is Decision.RECORD_AND_SAMPLE
+        assert _decide(sampler).decision is Decision.DROP
+
+    def test_invalid_limits_rejected(self):
+        with pytest.raises(ValueError):
+            RateLimitingSampler(spans_per_second=0)
+        with pytest.raises(ValueError):
+            RateLimitingSampler(per_key_spans_per_second=-1)
+
+
+class TestErrorAdmission:
+    def test_over_cap_error_span_exported(self, clock, span_exporter):
+        tracer = _provider(RateLimitingSampler(spans_per_second=1), span_exporter).get_tracer("ward-test")
+
+        tracer.start_span("kept").end()
+        tracer.start_span("over cap").end()
+        failed = tracer.start_span("over cap, failed")
+        failed.set_status(Status(StatusCode.ERROR, "boom"))
+        failed.end()
+
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+        assert set(spans) == {"kept", "over cap, failed"}
+        assert spans["kept"].attributes["ward.sampling.probability"] == 1.0
+        admitted = spans["over cap, failed"]
+        assert admitted.context.trace_flags.sampled
+        assert admitted.attributes["ward.sampling.error_admitted"] is True
+        assert admitted.attributes["ward.sampling.probability"] == 1.0
+
+    def test_llm_wrapper_keys_and_error_admission(self, clock, span_exporter):
+        from ward.instrumentation.openai.openai import chat_completions
+
+        sampler = RateLimitingSampler(spans_per_second=None, per_key_spans_per_second=1)
+        tracer = _provider(sampler, span_exporter).get_tracer("ward-test")
+        wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": False})
+        response = MagicMock()
+        response.model_dump.return_value = {"model": "gpt-4o", "choices": [], "usage": {}}
+
+        for model in ("gpt-4o", "gpt-4o", "o1"):
+            wrapper_fn(MagicMock(return_value=response), MagicMock(), (), {"model": model, "messages": []})
+        with pytest.raises(RuntimeError):
+            wrapper_fn(MagicMock(side_effect=RuntimeError("down")), MagicMock(), (), {"model": "gpt-4o", "messages": []})
+
+        spans = span_exporter.get_finished_spans()
+        assert [span.name for span in spans] == ["chat gpt-4o", "chat o1", "chat gpt-4o"]
+        assert spans[-1].attributes["ward.sampling.error_admitted"] is True
+        assert spans[-1].status.status_code is StatusCode.ERROR
+        assert spans[-1].events[0].name == "exception"
+
+    def test_over_cap_call_passes_through_unrecorded(self, clock, span_exporter):
+        from ward.instrumentation.openai.openai import chat_completions
+
+        tracer = _provider(RateLimitingSampler(spans_per_second=1), span_exporter).get_tracer("ward-test")
+        wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": True})
+        response = MagicMock()
+        response.model_dump.return_value = {"model": "gpt-4o", "choices": [], "usage": {}}
+        chunks = iter([])
+
+        wrapper_fn(MagicMock(return_value=response), MagicMock(), (), {"model": "gpt-4o", "messages": []})
+        over_cap = MagicMock(return_value=response)
+        assert wrapper_fn(over_cap, MagicMock(), (), {"model": "gpt-4o", "messages": []}) is response
+        streamed = MagicMock(return_value=chunks)
+        assert wrapper_fn(streamed, MagicMock(), (), {"model": "gpt-4o", "messages": [], "stream": True}) is chunks
+
+        assert "stream_options" not in streamed.call_args.kwargs
+        assert len(span_exporter.get_finished_spans()) == 1
+        with pytest.raises(RuntimeError):
+            wrapper_fn(MagicMock(side_effect=RuntimeError("down")), MagicMock(), (), {"model": "gpt-4o", "messages": []})
+        admitted = span_exporter.get_finished_spans()[-1]
+        assert admitted.attributes["ward.sampling.error_admitted"] is True
+        assert "server.address" not in admitted.attributes
@@ -3,7 +3,9 @@ Unit tests for Ward SDK.
 Uses mocked LLM responses and in-memory span exporter.
 """
 
+import gc
 import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
 
@@ -14,7 +16,7 @@ src_path = Path(__file__).parent.parent
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
-from ward.pricing import calculate_cost
+from ward.pricing import calculate_cost, calculate_image_cost
 
 
 # ---------------------------------------------------------------------------
@@ -41,6 +43,10 @@ class TestPricing:
         cost = calculate_cost("gpt-4o", 0, 0)
         assert cost == 0.0
 
+    def test_image_cost_per_image(self):
+        assert calculate_image_cost("dall-e-3", "1024x1024", "hd", 2) == 0.16
+        assert calculate_image_cost("dall-e-3", "256x256", "standard", 1) is None
+
 
 # ---------------------------------------------------------------------------
 # OpenAI sync non-streaming
@@ -319,6 +325,223 @@ class TestOpenAISyncStreaming:
         call_kwargs = wrapped.call_args[1]
         assert call_kwargs.get("stream_options", {}).get("include_usage") is True
 
+    def test_streaming_keeps_choices_and_tool_calls_apart(self, tracer, span_exporter):
+        from ward.instrumentation.openai.openai import chat_completions
+
+        def chunk(choices):
+            c = MagicMock()
+            c.model_dump.return_value = {"id": "chatcmpl-tools", "model": "gpt-4o", "choices": choices}
+            return c
+
+        def tool_delta(index, call_index, arguments, name=None, call_id=None):
+            function = {"arguments": arguments}
+            if name:
+                function["name"] = name
+            call = {"index": call_index, "function": function}
+            if call_id:
+                call["id"] = call_id
+            return {"index": index, "delta": {"tool_calls": [call]}, "finish_reason": None}
+
+        # Two choices interleaved; choice 0 makes two parallel tool calls
+        chunks = [
+            chunk([{"index": 1, "delta": {"content": "Sun"}, "finish_reason": None}]),
+            chunk([tool_delta(0, 0, "", name="get_weather", call_id="call_a")]),
+            chunk([tool_delta(0, 1, '{"city"', name="get_time", call_id="call_b")]),
+            chunk([tool_delta(0, 0, '{"city": "Paris"}')]),
+            chunk([{"index": 1, "delta": {"content": "ny"}, "finish_reason": "stop"}]),
+            chunk([tool_delta(0, 1, ': "Rome"}')]),
+            chunk([{"index": 0, "delta": {}, "finish_reason": "tool_calls"}]),
+        ]
+        wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": True})
+        stream = wrapper_fn(
+            MagicMock(return_value=iter(chunks)), MagicMock(), (),
+            {"model": "gpt-4o", "messages": [], "stream": True, "n": 2},
+        )
+        list(stream)
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.response.finish_reasons"] == "tool_calls,stop"
+        assert attributes["gen_ai.assistant.message.1"] == "Sunny"
+        assert "gen_ai.assistant.message.0" not in attributes
+        assert attributes["gen_ai.tool.name.0"] == ("get_weather", "get_time")
+        assert attributes["gen_ai.tool.call.id.0"] == ("call_a", "call_b")
+        assert attributes["gen_ai.tool.args.0"] == ('{"city": "Paris"}', '{"city": "Rome"}')
+        assert "gen_ai.tool.name.1" not in attributes
+
+
+# ---------------------------------------------------------------------------
+# Stream wrapper lifecycle
+# ---------------------------------------------------------------------------
+
+
+class CountingSpan:
+    """Span stub that only counts end() calls, cheap enough for a million streams."""
+
+    def __init__(self):
+        self.ended = 0
+
+    def end(self):
+        self.ended += 1
+
+    def is_recording(self):
+        return False
+
+    def set_status(self, status):
+        pass
+
+
+class TestStreamWrapperLifecycle:
+    def test_abandoned_stream_ends_span_on_release(self, tracer, span_exporter):
+        from ward.instrumentation.openai.openai import StreamWrapper
+
+        stream = StreamWrapper(iter(()), tracer.start_span("abandoned"), time.time(), "gpt-4o", False)
+        assert not hasattr(stream, "__dict__")
+        del stream
+
+        assert [s.name for s in span_exporter.get_finished_spans()] == ["abandoned"]
+
+    def test_abandoned_stream_in_cycle_is_reaped(self, tracer, span_exporter):
+        from ward.instrumentation.anthropic.anthropic import AnthropicStreamWrapper
+
+        class SelfReferencingStream:
+            def __next__(self):
+                raise StopIteration
+
+        raw = SelfReferencingStream()
+        raw.owner = AnthropicStreamWrapper(raw, tracer.start_span("cycle"), time.time(), "claude", False)
+        del raw
+        gc.collect()
+
+        assert [s.name for s in span_exporter.get_finished_spans()] == ["cycle"]
+
+    def test_consumed_stream_ends_span_once(self):
+        from ward.instrumentation.openai.openai import StreamWrapper
+
+        span = CountingSpan()
+        stream = StreamWrapper(iter(()), span, time.time(), "gpt-4o", False)
+        list(stream)
+        stream.close()
+        del stream
+
+        assert span.ended == 1
+
+    def test_million_abandoned_streams_keep_memory_flat(self):
+        from ward.instrumentation.openai.openai import StreamWrapper
+
+        span = CountingSpan()
+        for _ in range(10_000):
+            StreamWrapper(iter(()), span, 0.0, "gpt-4o", False)
+        gc.collect()
+        baseline_blocks = sys.getallocatedblocks()
+
+        for _ in range(1_000_000):
+            StreamWrapper(iter(()), span, 0.0, "gpt-4o", False)
+        gc.collect()
+
+        assert span.ended == 1_010_000
+        assert sys.getallocatedblocks() - baseline_blocks < 1000
+
+
+# ---------------------------------------------------------------------------
+# Stream outcomes
+# ---------------------------------------------------------------------------
+
+
+def _content_chunks(texts, usage=None):
+    chunks = []
+    for text in texts:
+        chunk = MagicMock()
+        chunk.model_dump.return_value = {
+            "id": "chatcmpl-outcome", "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+        }
+        chunks.append(chunk)
+    if usage:
+        final = MagicMock()
+        final.model_dump.return_value = {
+            "id": "chatcmpl-outcome", "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            "usage": usage,
+        }
+        chunks.append(final)
+    return chunks
+
+
+class TestStreamOutcomes:
+    def _stream(self, tracer, chunks, **kwargs):
+        from ward.instrumentation.openai.openai import chat_completions
+
+        wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": True})
+        return wrapper_fn(
+            MagicMock(return_value=iter(chunks)), MagicMock(), (),
+            {"model": "gpt-4o", "messages": [], "stream": True, **kwargs},
+        )
+
+    def test_completed_stream_is_ok(self, tracer, span_exporter):
+        usage = {"prompt_tokens": 4, "completion_tokens": 3, "total_tokens": 7}
+        list(self._stream(tracer, _content_chunks(["a", "b", "c"], usage), max_tokens=50))
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.status.status_code == StatusCode.OK
+        assert span.attributes["gen_ai.stream.outcome"] == "completed"
+        assert span.attributes["gen_ai.usage.output_tokens_delivered"] == 3
+        assert "gen_ai.usage.output_tokens_wasted_max" not in span.attributes
+
+    def test_closed_early_records_waste(self, tracer, span_exporter):
+        stream = self._stream(tracer, _content_chunks(["Hello", " world", "!"]), max_tokens=50)
+        next(stream)
+        stream.close()
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.status.status_code == StatusCode.UNSET
+        assert span.attributes["gen_ai.stream.outcome"] == "closed_early"
+        assert span.attributes["gen_ai.assistant.message.0"] == "Hello"
+        assert span.attributes["gen_ai.usage.output_tokens_delivered"] == 2
+        assert span.attributes["gen_ai.usage.output_tokens_wasted_max"] == 48
+
+    def test_abandoned_stream_is_marked(self, tracer, span_exporter):
+        stream = self._stream(tracer, _content_chunks(["Hello", " world"]), max_completion_tokens=10)
+        next(stream)
+        del stream
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.status.status_code == StatusCode.UNSET
+        assert span.attributes["gen_ai.stream.outcome"] == "abandoned"
+        assert span.attributes["gen_ai.usage.output_tokens_delivered"] == 2
+        assert span.attributes["gen_ai.usage.output_tokens_wasted_max"] == 8
+
+    @pytest.mark.asyncio
+    async def test_cancelled_stream_is_error(self, tracer, span_exporter):
+        import asyncio
+        from ward.instrumentation.anthropic.anthropic import async_messages_create
+
+        class CancelledMidStream:
+            def __init__(self):
+                self.events = [{"type": "content_block_delta", "delta": {"text": "Hi there"}}]
+
+            async def __anext__(self):
+                if self.events:
+                    return self.events.pop()
+                raise asyncio.CancelledError()
+
+        async def wrapped(*args, **kwargs):
+            return CancelledMidStream()
+
+        wrapper_fn = async_messages_create({"tracer": tracer, "capture_message_content": True})
+        stream = await wrapper_fn(
+            wrapped, MagicMock(), (),
+            {"model": "claude-3-haiku-20240307", "messages": [], "stream": True, "max_tokens": 100},
+        )
+        with pytest.raises(asyncio.CancelledError):
+            async for _ in stream:
+                pass
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.attributes["gen_ai.stream.outcome"] == "cancelled"
+        assert span.attributes["gen_ai.usage.output_tokens_delivered"] == 2
+        assert span.attributes["gen_ai.usage.output_tokens_wasted_max"] == 98
+
 
 # ---------------------------------------------------------------------------
 # OpenAI async non-streaming
@@ -368,6 +591,357 @@ class TestOpenAIAsyncNonStreaming:
         assert spans[0].attributes["gen_ai.usage.input_tokens"] == 5
 
 
+# ---------------------------------------------------------------------------
+# OpenAI Responses API
+# ---------------------------------------------------------------------------
+
+
+def _responses_body(status="completed", **overrides):
+    body = {
+        "id": "resp_123", "object": "response", "created_at": 0, "model": "gpt-4o-2024-08-06",
+        "status": status, "parallel_tool_calls": True, "tool_choice": "auto", "tools": [],
+        "output": [
+            {"type": "message", "id": "msg_1", "role": "assistant", "status": "completed",
+             "content": [{"type": "output_text", "text": "Hello there", "annotations": []}]},
+            {"type": "function_call", "id": "fc_1", "call_id": "call_1", "name": "get_weather",
+             "arguments": '{"city": "Paris"}', "status": "completed"},
+        ],
+        "usage": {
+            "input_tokens": 20, "input_tokens_details": {"cached_tokens": 16, "cache_write_tokens": 0},
+            "output_tokens": 9, "output_tokens_details": {"reasoning_tokens": 4}, "total_tokens": 29,
+        },
+    }
+    body.update(overrides)
+    return body
+
+
+def _responses_events(*texts, terminal="response.completed", **overrides):
+    from openai.types.responses import ResponseStreamEvent
+    from pydantic import TypeAdapter
+
+    adapter = TypeAdapter(ResponseStreamEvent)
+    created = _responses_body(status="in_progress", output=[], usage=None)
+    events = [{"type": "response.created", "response": created, "sequence_number": 0}]
+    for i, text in enumerate(texts, start=1):
+        events.append({
+            "type": "response.output_text.delta", "item_id": "msg_1", "output_index": 0,
+            "content_index": 0, "delta": text, "sequence_number": i, "logprobs": [],
+        })
+    if terminal:
+        status = terminal.rpartition(".")[2]
+        events.append({
+            "type": terminal, "response": _responses_body(status=status, **overrides),
+            "sequence_number": len(events),
+        })
+    return [adapter.validate_python(event) for event in events]
+
+
+class TestOpenAIResponses:
+    def test_response_read_by_attribute(self, tracer, span_exporter):
+        from openai.types.responses import Response
+        from ward.instrumentation.openai.openai import responses
+
+        response = Response.model_validate(_responses_body())
+        wrapper_fn = responses({"tracer": tracer, "capture_message_content": True})
+        with patch.object(Response, "model_dump", side_effect=AssertionError("dumped")):
+            result = wrapper_fn(
+                MagicMock(return_value=response), MagicMock(), (),
+                {"model": "gpt-4o", "instructions": "Be brief", "input": "Weather in Paris?",
+                 "max_output_tokens": 100},
+            )
+
+        assert result is response
+        span = span_exporter.get_finished_spans()[0]
+        assert span.status.status_code == StatusCode.OK
+        assert span.attributes["gen_ai.response.id"] == "resp_123"
+        assert span.attributes["gen_ai.usage.input_tokens"] == 20
+        assert span.attributes["gen_ai.usage.output_tokens"] == 9
+        assert span.attributes["gen_ai.usage.prompt_tokens_details.cache_read"] == 16
+        assert span.attributes["gen_ai.usage.reasoning_tokens"] == 4
+        assert span.attributes["gen_ai.response.finish_reasons"] == "completed"
+        assert span.attributes["gen_ai.request.max_tokens"] == 100
+        assert span.attributes["gen_ai.system.message.0"] == "Be brief"
+        assert span.attributes["gen_ai.user.message.1"] == "Weather in Paris?"
+        assert span.attributes["gen_ai.assistant.message.0"] == "Hello there"
+        assert span.attributes["gen_ai.tool.name.0"] == ("get_weather",)
+
+    def test_incomplete_response_reports_reason(self, tracer, span_exporter):
+        from ward.instrumentation.openai.openai import responses
+
+        body = _responses_body(status="incomplete", incomplete_details={"reason": "max_output_tokens"})
+        wrapper_fn = responses({"tracer": tracer, "capture_message_content": False})
+        wrapper_fn(MagicMock(return_value=body), MagicMock(), (), {"model": "gpt-4o", "input": "Hi"})
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["gen_ai.response.finish_reasons"] == "max_output_tokens"
+        assert "gen_ai.assistant.message.0" not in span.attributes
+
+    def test_stream_usage_from_terminal_event(self, tracer, span_exporter):
+        from openai.types.responses import ResponseCompletedEvent, ResponseTextDeltaEvent
+        from ward.instrumentation.openai.openai import responses
+
+        events = _responses_events("Hello", " there")
+        wrapped = MagicMock(return_value=iter(events))
+        wrapper_fn = responses({"tracer": tracer, "capture_message_content": True})
+        with patch.object(ResponseTextDeltaEvent, "model_dump", side_effect=AssertionError("dumped")), \
+                patch.object(ResponseCompletedEvent, "model_dump", side_effect=AssertionError("dumped")):
+            stream = wrapper_fn(wrapped, MagicMock(), (), {"model": "gpt-4o", "input": "Hi", "stream": True})
+            assert list(stream) == events
+
+        # The Responses API always reports usage; chat's stream_options must not be injected
+        assert "stream_options" not in wrapped.call_args.kwargs
+        span = span_exporter.get_finished_spans()[0]
+        assert span.status.status_code == StatusCode.OK
+        assert span.attributes["gen_ai.stream.outcome"] == "completed"
+        assert span.attributes["gen_ai.usage.output_tokens"] == 9
+        assert span.attributes["gen_ai.usage.output_tokens_delivered"] == 9
+        assert span.attributes["gen_ai.usage.prompt_tokens_details.cache_read"] == 16
+        assert span.attributes["gen_ai.assistant.message.0"] == "Hello there"
+
+    def test_stream_closed_before_terminal_event(self, tracer, span_exporter):
+        from ward.instrumentation.openai.openai import responses
+
+        wrapper_fn = responses({"tracer": tracer, "capture_message_content": True})
+        stream = wrapper_fn(
+            MagicMock(return_value=iter(_responses_events("Hello", " there", terminal=None))), MagicMock(), (),
+            {"model": "gpt-4o", "input": "Hi", "stream": True, "max_output_tokens": 50},
+        )
+        next(stream), next(stream)
+        stream.close()
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["gen_ai.stream.outcome"] == "closed_early"
+        assert span.attributes["gen_ai.response.id"] == "resp_123"
+        assert span.attributes["gen_ai.assistant.message.0"] == "Hello"
+        assert span.attributes["gen_ai.usage.output_tokens_wasted_max"] == 48
+
+    @pytest.mark.asyncio
+    async def test_async_failed_stream_is_error(self, tracer, span_exporter):
+        from ward.instrumentation.openai.openai import async_responses
+
+        class Events:
+            def __init__(self, events):
+                self.events = iter(events)
+
+            async def __anext__(self):
+                try:
+                    return next(self.events)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        events = _responses_events("Hel", terminal="response.failed", error={"code": "server_error", "message": "boom"})
+        wrapper_fn = async_responses({"tracer": tracer, "capture_message_content": True})
+        stream = await wrapper_fn(
+            AsyncMock(return_value=Events(events)), MagicMock(), (), {"model": "gpt-4o", "input": "Hi", "stream": True},
+        )
+        assert [event async for event in stream] == events
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.status.description == "boom"
+        assert span.attributes["gen_ai.stream.outcome"] == "error"
+        assert span.attributes["gen_ai.response.finish_reasons"] == "failed"
+
+    def test_instrumentor_wraps_responses(self):
+        import wrapt
+        from openai.resources.responses import AsyncResponses, Responses
+        from ward.instrumentation.openai import openaiInstrumentor
+
+        proxy = getattr(wrapt, "BaseObjectProxy", wrapt.ObjectProxy)
+        instrumentor = openaiInstrumentor()
+        if instrumentor.is_instrumented_by_opentelemetry:
+            instrumentor.uninstrument()
+        instrumentor.instrument()
+        try:
+            assert isinstance(Responses.create, proxy)
+            assert isinstance(AsyncResponses.create, proxy)
+        finally:
+            instrumentor.uninstrument()
+        assert not isinstance(Responses.create, proxy)
+
+
+# ---------------------------------------------------------------------------
+# OpenAI embeddings
+# ---------------------------------------------------------------------------
+
+
+class TestOpenAIEmbeddings:
+    def _make_response(self, embedding):
+        from types import SimpleNamespace
+
+        resp = SimpleNamespace(
+            model="text-embedding-3-small",
+            data=[SimpleNamespace(embedding=embedding, index=i) for i in range(3)],
+            usage=SimpleNamespace(prompt_tokens=24, total_tokens=24),
+        )
+        # Reading fields must never dump the (potentially huge) vectors
+        resp.model_dump = MagicMock(side_effect=AssertionError("response was dumped"))
+        return resp
+
+    def test_embedding_span_reads_fields_without_dumping(self, tracer, span_exporter):
+        from ward.instrumentation.openai.openai import embedding
+
+        wrapper_fn = embedding({"tracer": tracer, "capture_message_content": True})
+        response = self._make_response([0.1] * 256)
+        wrapped = MagicMock(return_value=response)
+
+        result = wrapper_fn(
+            wrapped, MagicMock(), (), {"model": "text-embedding-3-small", "input": ["a", "b", "c"]}
+        )
+
+        assert result is response
+        span = span_exporter.get_finished_spans()[0]
+        assert span.status.status_code == StatusCode.OK
+        assert span.attributes["gen_ai.response.model"] == "text-embedding-3-small"
+        assert span.attributes["gen_ai.usage.input_tokens"] == 24
+        assert span.attributes["gen_ai.request.embedding_input_count"] == 3
+        assert span.attributes["gen_ai.embedding.count"] == 3
+        assert span.attributes["gen_ai.response.embedding_dimension"] == 256
+        assert span.attributes["gen_ai.request.encoding_formats"] == ("float",)
+
+    def test_base64_dimension_without_decoding(self, tracer, span_exporter):
+        import base64
+        import struct
+        from ward.instrumentation.openai.openai import embedding
+
+        encoded = base64.b64encode(struct.pack("<5f", *range(5))).decode()
+        wrapper_fn = embedding({"tracer": tracer, "capture_message_content": True})
+        wrapped = MagicMock(return_value=self._make_response(encoded))
+
+        wrapper_fn(
+            wrapped, MagicMock(), (),
+            {"model": "text-embedding-3-small", "input": [1, 2, 3], "encoding_format": "base64"},
+        )
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["gen_ai.response.embedding_dimension"] == 5
+        assert span.attributes["gen_ai.request.embedding_input_count"] == 1
+        assert span.attributes["gen_ai.request.encoding_formats"] == ("base64",)
+
+
+# ---------------------------------------------------------------------------
+# OpenAI images
+# ---------------------------------------------------------------------------
+
+
+class TestOpenAIImages:
+    def test_b64_images_measured_without_copying(self, tracer, span_exporter):
+        from types import SimpleNamespace
+        from ward.instrumentation.openai.openai import image_generate
+
+        # 3 bytes per 4 base64 chars; 'ab==' decodes to one byte
+        images = [SimpleNamespace(b64_json="QUJD" * 1000, url=None), SimpleNamespace(b64_json="ab==", url=None)]
+        response = SimpleNamespace(created=0, data=images)
+        response.model_dump = MagicMock(side_effect=AssertionError("response was dumped"))
+        wrapper_fn = image_generate({"tracer": tracer, "capture_message_content": True})
+        wrapped = MagicMock(return_value=response)
+
+        result = wrapper_fn(
+            wrapped, MagicMock(), (),
+            {"model": "dall-e-3", "prompt": "a cat", "n": 2, "quality": "hd", "style": "vivid",
+             "response_format": "b64_json"},
+        )
+
+        assert result is response
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["gen_ai.image.count"] == 2
+        assert span.attributes["gen_ai.response.image_bytes"] == 3001
+        assert span.attributes["gen_ai.request.image_size"] == "1024x1024"
+        assert span.attributes["gen_ai.request.image_quality"] == "hd"
+        assert span.attributes["gen_ai.request.image_style"] == "vivid"
+        assert span.attributes["gen_ai.request.image_response_format"] == "b64_json"
+        assert span.attributes["gen_ai.usage.cost"] == 0.16
+
+
+# ---------------------------------------------------------------------------
+# OpenAI streamed speech
+# ---------------------------------------------------------------------------
+
+
+class FakeStreamedSpeech:
+    """Stand-in for StreamedBinaryAPIResponse: yields audio chunks on demand."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.closed = False
+
+    def iter_bytes(self, chunk_size=None):
+        yield from self._chunks
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncFakeStreamedSpeech(FakeStreamedSpeech):
+    async def iter_bytes(self, chunk_size=None):
+        for chunk in self._chunks:
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
+SPEECH_KWARGS = {
+    "model": "tts-1", "voice": "alloy", "input": "Hello",
+    "extra_headers": {"X-Stainless-Raw-Response": "stream"},
+}
+
+
+class TestOpenAISpeechStreaming:
+    def test_span_measures_bytes_as_caller_reads(self, tracer, span_exporter):
+        from ward.instrumentation.openai.openai import audio_create
+
+        wrapper_fn = audio_create({"tracer": tracer, "capture_message_content": True})
+        raw = FakeStreamedSpeech([b"a" * 100, b"", b"b" * 50])
+        response = wrapper_fn(MagicMock(return_value=raw), MagicMock(), (), dict(SPEECH_KWARGS))
+
+        assert isinstance(response, FakeStreamedSpeech)
+        assert span_exporter.get_finished_spans() == []
+
+        assert b"".join(response.iter_bytes()) == b"a" * 100 + b"b" * 50
+
+        span = span_exporter.get_finished_spans()[0]
+        assert span.status.status_code == StatusCode.OK
+        assert span.attributes["gen_ai.request.is_stream"] is True
+        assert span.attributes["gen_ai.request.audio_voice"] == "alloy"
+        assert span.attributes["gen_ai.response.audio_bytes"] == 150
+        assert span.attributes["gen_ai.response.audio_time_to_first_byte"] >= 0
+        assert span.attributes["gen_ai.response.audio_bytes_per_second"] > 0
+
+    def test_close_without_reading_ends_span(self, tracer, span_exporter):
+        from ward.instrumentation.openai.openai import audio_create
+
+        wrapper_fn = audio_create({"tracer": tracer, "capture_message_content": True})
+        raw = FakeStreamedSpeech([b"a" * 100])
+        response = wrapper_fn(MagicMock(return_value=raw), MagicMock(), (), dict(SPEECH_KWARGS))
+        response.close()
+        response.close()
+
+        assert raw.closed
+        spans = span_exporter.get_finished_spans()
+        assert len(spans) == 1
+        assert spans[0].attributes["gen_ai.response.audio_bytes"] == 0
+        assert "gen_ai.response.audio_time_to_first_byte" not in spans[0].attributes
+
+    @pytest.mark.asyncio
+    async def test_async_stream_to_file(self, tracer, span_exporter, tmp_path):
+        from ward.instrumentation.openai.openai import async_audio_create
+
+        wrapper_fn = async_audio_create({"tracer": tracer, "capture_message_content": True})
+        raw = AsyncFakeStreamedSpeech([b"a" * 10, b"b" * 20])
+
+        async def wrapped(*args, **kwargs):
+            return raw
+
+        response = await wrapper_fn(wrapped, MagicMock(), (), dict(SPEECH_KWARGS))
+        await response.stream_to_file(tmp_path / "speech.mp3")
+        await response.close()
+
+        assert (tmp_path / "speech.mp3").read_bytes() == b"a" * 10 + b"b" * 20
+        span = span_exporter.get_finished_spans()[0]
+        assert span.attributes["gen_ai.response.audio_bytes"] == 30
+
+
 # ---------------------------------------------------------------------------
 # Anthropic sync non-streaming
 # ---------------------------------------------------------------------------
@@ -425,6 +999,64 @@ class TestAnthropicSync:
         assert span.attributes["gen_ai.assistant.message.0"] == "Hello from Claude!"
 
 
+# ---------------------------------------------------------------------------
+# Sampled-out fast path
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def dropping_tracer():
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+
+    return TracerProvider(sampler=ALWAYS_OFF).get_tracer("ward-test")
+
+
+class TestSampledOutFastPath:
+    def test_openai_stream_passed_through_untouched(self, dropping_tracer):
+        from ward.instrumentation.openai.openai import chat_completions
+
+        wrapper_fn = chat_completions({"tracer": dropping_tracer, "capture_message_content": True})
+        raw_stream = iter([])
+        wrapped = MagicMock(return_value=raw_stream)
+        instance = MagicMock()
+        kwargs = {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hi"}], "stream": True}
+
+        result = wrapper_fn(wrapped, instance, (), kwargs)
+
+        assert result is raw_stream
+        # No stream_options injection, and the client was never touched
+        wrapped.assert_called_once_with(**kwargs)
+        assert instance.mock_calls == []
+
+    @pytest.mark.asyncio
+    async def test_openai_async_response_passed_through(self, dropping_tracer):
+        from ward.instrumentation.openai.openai import async_chat_completions
+
+        wrapper_fn = async_chat_completions({"tracer": dropping_tracer, "capture_message_content": True})
+        response = MagicMock()
+        wrapped = AsyncMock(return_value=response)
+
+        result = await wrapper_fn(wrapped, MagicMock(), (), {"model": "gpt-4o", "messages": []})
+
+        assert result is response
+        response.model_dump.assert_not_called()
+
+    def test_anthropic_stream_passed_through_untouched(self, dropping_tracer):
+        from ward.instrumentation.anthropic.anthropic import messages_create
+
+        wrapper_fn = messages_create({"tracer": dropping_tracer, "capture_message_content": True})
+        raw_stream = iter([])
+        wrapped = MagicMock(return_value=raw_stream)
+
+        result = wrapper_fn(
+            wrapped, MagicMock(), (),
+            {"model": "claude-3-haiku-20240307", "max_tokens": 10, "messages": [], "stream": True},
+        )
+
+        assert result is raw_stream
+
+
 # ---------------------------------------------------------------------------
 # SDK init
 # ---------------------------------------------------------------------------
@@ -449,3 +1081,64 @@ class TestSDKInit:
             instrumentations=["nonexistent"],
         )
         assert tracer is not None
+
+
+# ---------------------------------------------------------------------------
+# Instrumentor lifecycle (idempotency, uninstrument, kill switch)
+# ---------------------------------------------------------------------------
+
+
+class TestInstrumentorLifecycle:
+    @staticmethod
+    def _is_wrapped(func):
+        import wrapt
+
+        # wrapt 2.x renamed the proxy base class
+        return isinstance(func, getattr(wrapt, "BaseObjectProxy", wrapt.ObjectProxy))
+
+    def test_repeated_init_does_not_stack_wrappers(self):
+        import ward
+        from openai.resources.chat.completions import Completions
+
+        ward.init(application_name="test", environment="test")
+        ward.init(application_name="test", environment="test")
+
+        assert self._is_wrapped(Completions.create)
+        assert not self._is_wrapped(Completions.create.__wrapped__)
+
+    def test_uninstrument_restores_original_methods(self):
+        from openai.resources.chat.completions import AsyncCompletions, Completions
+        from ward.instrumentation.openai import openaiInstrumentor
+
+        instrumentor = openaiInstrumentor()
+        if instrumentor.is_instrumented_by_opentelemetry:
+            instrumentor.uninstrument()
+
+        instrumentor.instrument()
+        instrumentor.instrument()
+        assert not self._is_wrapped(Completions.create.__wrapped__)
+
+        instrumentor.uninstrument()
+        assert not self._is_wrapped(Completions.create)
+        assert not self._is_wrapped(AsyncCompletions.create)
+
+    def test_disable_and_enable(self, tracer, span_exporter):
+        import ward
+        from openai.resources.chat.completions import Completions
+        from ward.instrumentation.openai.openai import chat_completions
+
+        ward.init(application_name="test", environment="test")
+        # A wrapper captured before disable(), like openai's with_raw_response does
+        wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": True})
+        wrapped = MagicMock(return_value="raw")
+
+        ward.disable()
+        try:
+            assert not self._is_wrapped(Completions.create)
+            assert wrapper_fn(wrapped, MagicMock(), (), {"model": "gpt-4o", "messages": []}) == "raw"
+            assert span_exporter.get_finished_spans() == []
+        finally:
+            ward.enable()
+
+        assert self._is_wrapped(Completions.create)
+        assert not self._is_wrapped(Completions.create.__wrapped__)
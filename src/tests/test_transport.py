@@ -0,0 +1,262 @@
+"""
+Unit tests for HTTP-level telemetry (ward.instrumentation.transport).
+
+Runs real OpenAI/Anthropic clients against a local HTTP server so the httpx
+event hooks and trace extension see genuine connection activity.
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+openai = pytest.importorskip("openai")
+
+MESSAGE = {
+    "id": "msg_local",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-3-haiku-20240307",
+    "content": [{"type": "text", "text": "Hi"}],
+    "stop_reason": "end_turn",
+    "usage": {"input_tokens": 3, "output_tokens": 1},
+}
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-local",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hi"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4},
+}
+
+
+class LocalLLMServer:
+    """Keep-alive HTTP server that answers every POST with a canned JSON body."""
+
+    def __init__(self, body=CHAT_COMPLETION, headers=None, fail_with=()):
+        payload = json.dumps(body).encode()
+        extra_headers = headers or {}
+        # Status codes to answer the first requests with before succeeding
+        failures = list(fail_with)
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if failures:
+                    error = json.dumps({"error": {"type": "rate_limit_error", "message": "slow down"}}).encode()
+                    self.send_response(failures.pop(0))
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(error)))
+                    self.send_header("retry-after-ms", "50")
+                    self.end_headers()
+                    self.wfile.write(error)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in extra_headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1"
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture()
+def server():
+    server = LocalLLMServer()
+    yield server
+    server.close()
+
+
+def _original_create(resource):
+    """Unwrapped bound ``create`` (other tests may leave the class instrumented)."""
+    create = type(resource).__dict__["create"]
+    return getattr(create, "__wrapped__", create).__get__(resource)
+
+
+def _chat(tracer, client):
+    from ward.instrumentation.openai.openai import chat_completions
+
+    wrapper_fn = chat_completions({"tracer": tracer, "capture_message_content": False})
+    completions = client.chat.completions
+    return wrapper_fn(
+        _original_create(completions), completions, (),
+        {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hi"}]},
+    )
+
+
+class TestHttpPhaseTimings:
+    def test_new_then_reused_connection(self, tracer, span_exporter, server):
+        client = openai.OpenAI(api_key="test", base_url=server.base_url)
+
+        _chat(tracer, client)
+        _chat(tracer, client)
+
+        first, second = [span.attributes for span in span_exporter.get_finished_spans()]
+        assert first["http.client.connection_reused"] is False
+        assert first["http.client.connect_duration"] >= 0
+        assert second["http.client.connection_reused"] is True
+        assert "http.client.connect_duration" not in second
+        for attributes in (first, second):
+            assert 0 <= attributes["http.client.pool_wait_duration"] <= attributes["http.client.time_to_response_headers"]
+            assert attributes["http.client.response_body_duration"] >= 0
+            assert "http.client.tls_duration" not in attributes
+
+    def test_hooks_installed_once_and_inert_outside_calls(self, tracer, span_exporter, server):
+        client = openai.OpenAI(api_key="test", base_url=server.base_url)
+
+        _chat(tracer, client)
+        _chat(tracer, client)
+        hooks = client._client.event_hooks
+        assert len(hooks["request"]) == 1 and len(hooks["response"]) == 1
+
+        # Uninstrumented call through the same client: hooks stay silent
+        _original_create(client.chat.completions)(model="gpt-4o", messages=[{"role": "user", "content": "Hi"}])
+        assert len(span_exporter.get_finished_spans()) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_client(self, tracer, span_exporter, server):
+        from ward.instrumentation.openai.openai import async_chat_completions
+
+        client = openai.AsyncOpenAI(api_key="test", base_url=server.base_url)
+        wrapper_fn = async_chat_completions({"tracer": tracer, "capture_message_content": False})
+        completions = client.chat.completions
+        await wrapper_fn(
+            _original_create(completions), completions, (),
+            {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hi"}]},
+        )
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["http.client.connection_reused"] is False
+        assert attributes["http.client.time_to_response_headers"] > 0
+
+    def test_anthropic_client(self, tracer, span_exporter):
+        anthropic = pytest.importorskip("anthropic")
+        from ward.instrumentation.anthropic.anthropic import messages_create
+
+        server = LocalLLMServer(body=MESSAGE, headers={
+            "request-id": "req_anthropic",
+            "anthropic-ratelimit-requests-remaining": "49",
+            "anthropic-ratelimit-input-tokens-remaining": "39000",
+            "anthropic-ratelimit-tokens-reset": "2026-01-01T00:00:30Z",
+        })
+        try:
+            client = anthropic.Anthropic(api_key="test", base_url=server.base_url.rsplit("/v1", 1)[0])
+            wrapper_fn = messages_create({"tracer": tracer, "capture_message_content": False})
+            messages = client.messages
+            wrapper_fn(
+                _original_create(messages), messages, (),
+                {"model": "claude-3-haiku-20240307", "max_tokens": 10, "messages": [{"role": "user", "content": "Hi"}]},
+            )
+        finally:
+            server.close()
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["http.client.connection_reused"] is False
+        assert attributes["http.client.response_body_duration"] >= 0
+        assert attributes["gen_ai.response.request_id"] == "req_anthropic"
+        assert attributes["gen_ai.ratelimit.requests.remaining"] == 49
+        assert attributes["gen_ai.ratelimit.input_tokens.remaining"] == 39000
+        assert attributes["gen_ai.ratelimit.tokens.reset"] == "2026-01-01T00:00:30Z"
+
+
+class TestProviderHeaders:
+    def test_openai_headers_recorded(self, tracer, span_exporter):
+        server = LocalLLMServer(headers={
+            "x-request-id": "req_123",
+            "openai-processing-ms": "250",
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "499",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-tokens": "29970",
+            "x-ratelimit-reset-tokens": "60ms",
+        })
+        try:
+            _chat(tracer, openai.OpenAI(api_key="test", base_url=server.base_url))
+        finally:
+            server.close()
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["gen_ai.response.request_id"] == "req_123"
+        assert attributes["gen_ai.server.processing_duration"] == 0.25
+        assert attributes["gen_ai.ratelimit.requests.limit"] == 500
+        assert attributes["gen_ai.ratelimit.requests.remaining"] == 499
+        assert attributes["gen_ai.ratelimit.tokens.limit"] == 30000
+        assert attributes["gen_ai.ratelimit.tokens.remaining"] == 29970
+        assert attributes["gen_ai.ratelimit.tokens.reset"] == "60ms"
+
+    def test_malformed_and_missing_headers_skipped(self, tracer, span_exporter):
+        server = LocalLLMServer(headers={"x-ratelimit-remaining-requests": "lots"})
+        try:
+            _chat(tracer, openai.OpenAI(api_key="test", base_url=server.base_url))
+        finally:
+            server.close()
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert "gen_ai.ratelimit.requests.remaining" not in attributes
+        assert "gen_ai.server.processing_duration" not in attributes
+        assert attributes["gen_ai.response.model"] == "gpt-4o"
+
+
+class TestRetries:
+    def test_single_attempt(self, tracer, span_exporter, server):
+        _chat(tracer, openai.OpenAI(api_key="test", base_url=server.base_url))
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["http.client.attempt_count"] == 1
+        assert attributes["http.client.attempt_status_codes"] == (200,)
+        assert "http.request.resend_count" not in attributes
+        assert "http.client.retry_backoff_duration" not in attributes
+
+    def test_retries_and_backoff_recorded(self, tracer, span_exporter):
+        server = LocalLLMServer(fail_with=[429, 503])
+        try:
+            _chat(tracer, openai.OpenAI(api_key="test", base_url=server.base_url, max_retries=2))
+        finally:
+            server.close()
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["http.client.attempt_count"] == 3
+        assert attributes["http.client.attempt_status_codes"] == (429, 503, 200)
+        assert attributes["http.request.resend_count"] == 2
+        # Two retry-after-ms: 50 sleeps
+        assert attributes["http.client.retry_backoff_duration"] >= 0.09
+        assert attributes["http.client.retry_backoff_duration"] < attributes["gen_ai.client.operation.duration"]
+
+    def test_exhausted_retries_recorded_on_error_span(self, tracer, span_exporter):
+        server = LocalLLMServer(fail_with=[429, 429])
+        try:
+            with pytest.raises(openai.RateLimitError):
+                _chat(tracer, openai.OpenAI(api_key="test", base_url=server.base_url, max_retries=1))
+        finally:
+            server.close()
+
+        attributes = span_exporter.get_finished_spans()[0].attributes
+        assert attributes["http.client.attempt_status_codes"] == (429, 429)
+        assert attributes["http.request.resend_count"] == 1
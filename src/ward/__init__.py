@@ -9,17 +9,38 @@ Usage:
     from openai import OpenAI
     client = OpenAI()
     client.chat.completions.create(model="gpt-4o", messages=[...])
+
+    # Kill switch: restore the original client methods, then re-patch.
+    ward.disable()
+    ward.enable()
 """
 
 from typing import Optional
 from opentelemetry import trace as trace_api
+from opentelemetry.sdk.trace import SpanLimits
+from opentelemetry.sdk.trace.sampling import Sampler
 
-from ward.otel.tracer import setup_tracing
+from ward.otel.enrichment import set_enrichment_enabled
+from ward.otel.logs import set_export_redactor as set_log_export_redactor, setup_content_logs
+from ward.otel.tracer import set_export_redactor as set_span_export_redactor, setup_tracing
 from ward.otel.propagators import setup_propagators
 from ward.instrument_mapper import get_instrumentor
+from ward.instrumentation.openai.utils import (
+    ContentLimits,
+    set_content_limits,
+    set_content_logger,
+    set_instrumentation_enabled,
+    set_redactor,
+)
+from ward.policy import PolicyFileWatcher, install_reload_signal
+from ward.redaction import Redactor
 
 __version__ = "0.1.0"
 
+# provider name → instrumentor applied by init(), for disable()/enable()
+_INSTRUMENTORS = {}
+_POLICY_WATCHER = None
+
 
 def init(
     application_name: Optional[str] = None,
@@ -29,6 +50,14 @@ def init(
     instrumentations: Optional[list[str]] = None,
     disable_batch: bool = False,
     capture_message_content: bool = True,
+    policy_file: Optional[str] = None,
+    sampler: Optional[Sampler] = None,
+    max_attribute_length: Optional[int] = None,
+    max_span_attributes: Optional[int] = None,
+    max_span_bytes: Optional[int] = None,
+    redactor: Optional[Redactor] = None,
+    content_logs: bool = False,
+    defer_enrichment: bool = False,
     **kwargs,
 ) -> Optional[trace_api.Tracer]:
     """
@@ -41,20 +70,61 @@ def init(
                        The SDK appends /v1/traces automatically.
         otlp_headers: Optional headers dict for authenticated OTLP endpoints.
         instrumentations: List of providers to instrument. Defaults to ["openai"].
-                         Available: "openai", "anthropic".
-        disable_batch: Use SimpleSpanProcessor instead of BatchSpanProcessor.
+                         Available: "openai", "anthropic", and "http" (a
+                         transport-level alternative to both that also
+                         covers OpenAI-compatible servers).
+        disable_batch: Export each span immediately from a background worker
+                       instead of batching (fresher data, no added call latency).
         capture_message_content: Whether to capture prompt/response content in spans.
+        policy_file: Optional JSON policy (sample rates, content capture, size
+                     caps, per-model overrides — see ward.policy). The file is
+                     re-read when it changes, and on SIGHUP unless the
+                     application already handles that signal.
+        sampler: Optional OTel sampler for the TracerProvider, e.g.
+                 ward.otel.sampling.RateLimitingSampler to cap spans per
+                 second. Only applied when init() creates the provider.
+        max_attribute_length: Cap on each attribute value. Captured content is
+                              cut before it is copied into the span.
+        max_span_attributes: Cap on the number of attributes per span.
+        max_span_bytes: Cap on captured content per span, in UTF-8 bytes,
+                        across attributes.
+                        Cut attributes are listed in ward.truncated.attributes.
+        redactor: Optional ward.redaction.Redactor applied to captured content
+                  (emails, phone numbers, API keys, card numbers, custom
+                  rules). With defer=True it runs on the export thread.
+        content_logs: Emit captured content as OTel log records (scope
+                      "ward.content", own LoggerProvider and batching),
+                      correlated by trace and span id, instead of span
+                      attributes. Spans then carry only metadata.
+        defer_enrichment: Record only timing on the caller's thread for
+                          non-streaming chat responses; reading usage, cost
+                          and content from the response happens on the
+                          export thread. Needs the provider created by init().
 
     Returns:
         Configured OpenTelemetry tracer, or None if setup fails.
+
+    Calling init() again re-applies instrumentation with the new settings
+    instead of stacking a second layer of wrappers.
     """
 
+    span_limits = None
+    if max_attribute_length is not None or max_span_attributes is not None:
+        span_limits = SpanLimits(
+            max_span_attribute_length=max_attribute_length,
+            max_span_attributes=max_span_attributes,
+        )
+
     tracer = setup_tracing(
         application_name=application_name,
         environment=environment,
         otlp_endpoint=otlp_endpoint,
         otlp_headers=otlp_headers,
         disable_batch=disable_batch,
+        sampler=sampler,
+        span_limits=span_limits,
+        redactor=redactor,
+        defer_enrichment=defer_enrichment,
     )
 
     if tracer is None:
@@ -62,12 +132,40 @@ def init(
 
     setup_propagators()
 
+    if max_attribute_length is not None or max_span_bytes is not None:
+        set_content_limits(ContentLimits(max_attribute_length, max_span_bytes))
+    else:
+        set_content_limits(None)
+    set_enrichment_enabled(defer_enrichment)
+    # The providers, and the redacting exporters in them, are only built by
+    # the first init(). Defer only if every pipeline content can take has one.
+    export_redactor = redactor if redactor is not None and redactor.defer else None
+    deferred = set_span_export_redactor(export_redactor)
+    if content_logs:
+        logger = setup_content_logs(application_name, environment, redactor)
+        deferred = set_log_export_redactor(export_redactor) and deferred
+    else:
+        logger = None
+    set_redactor(redactor, deferred=deferred and export_redactor is not None)
+    set_content_logger(logger)
+
+    global _POLICY_WATCHER
+    if _POLICY_WATCHER is not None:
+        _POLICY_WATCHER.stop()
+        _POLICY_WATCHER = None
+    if policy_file is not None:
+        _POLICY_WATCHER = PolicyFileWatcher(policy_file).start()
+        install_reload_signal(_POLICY_WATCHER)
+
     if instrumentations is None:
         instrumentations = ["openai"]
 
     for name in instrumentations:
         try:
             InstrumentorClass = get_instrumentor(name)
+            previous = _INSTRUMENTORS.pop(name, None)
+            if previous is not None and previous.is_instrumented_by_opentelemetry:
+                previous.uninstrument()
             instrumentor = InstrumentorClass(
                 tracer=tracer,
                 environment=environment,
@@ -75,9 +173,32 @@ def init(
                 capture_message_content=capture_message_content,
             )
             instrumentor.instrument()
+            _INSTRUMENTORS[name] = instrumentor
         except ImportError:
             pass
         except Exception as e:
             print(f"Warning: Failed to instrument {name}: {e}")
 
+    set_instrumentation_enabled(True)
     return tracer
+
+
+def disable():
+    """
+    Turn Ward off at runtime without restarting.
+
+    Restores the original client methods, so instrumented calls cost nothing;
+    any wrapper reference that survives (e.g. cached by the client) becomes a
+    pass-through. Spans already in flight are still exported.
+    """
+    set_instrumentation_enabled(False)
+    for instrumentor in _INSTRUMENTORS.values():
+        if instrumentor.is_instrumented_by_opentelemetry:
+            instrumentor.uninstrument()
+
+
+def enable():
+    """Re-apply the instrumentations configured by init() after disable()."""
+    for instrumentor in _INSTRUMENTORS.values():
+        instrumentor.instrument()
+    set_instrumentation_enabled(True)
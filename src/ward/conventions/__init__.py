@@ -15,6 +15,43 @@ class SemanticConventions:
     CLIENT_ADDRESS = "client.address"
     ERROR_TYPE = "error.type"
 
+    # HTTP phase timings of the underlying request (seconds)
+    HTTP_CLIENT_POOL_WAIT_DURATION = "http.client.pool_wait_duration"
+    HTTP_CLIENT_CONNECT_DURATION = "http.client.connect_duration"
+    HTTP_CLIENT_TLS_DURATION = "http.client.tls_duration"
+    HTTP_CLIENT_TIME_TO_HEADERS = "http.client.time_to_response_headers"
+    HTTP_CLIENT_BODY_READ_DURATION = "http.client.response_body_duration"
+    HTTP_CLIENT_CONNECTION_REUSED = "http.client.connection_reused"
+
+    # SDK-internal retries of the underlying request
+    HTTP_REQUEST_RESEND_COUNT = "http.request.resend_count"
+    HTTP_CLIENT_ATTEMPT_COUNT = "http.client.attempt_count"
+    HTTP_CLIENT_ATTEMPT_STATUS_CODES = "http.client.attempt_status_codes"
+    HTTP_CLIENT_RETRY_BACKOFF_DURATION = "http.client.retry_backoff_duration"
+
+    # Sampling (ward.otel.sampling)
+    WARD_SAMPLING_PROBABILITY = "ward.sampling.probability"
+    WARD_SAMPLING_ERROR_ADMITTED = "ward.sampling.error_admitted"
+
+    # Content truncated by ward.init size limits
+    WARD_TRUNCATED_ATTRIBUTES = "ward.truncated.attributes"
+    WARD_TRUNCATED_LENGTH = "ward.truncated.length"
+
+    # Content-log records (ward.otel.logs): the span attribute the body stands in for
+    WARD_CONTENT_ATTRIBUTE = "ward.content.attribute"
+
+    # Provider response headers (request id, server-side time, rate-limit state)
+    GEN_AI_RESPONSE_REQUEST_ID = "gen_ai.response.request_id"
+    GEN_AI_SERVER_PROCESSING_DURATION = "gen_ai.server.processing_duration"
+    GEN_AI_RATELIMIT_REQUESTS_LIMIT = "gen_ai.ratelimit.requests.limit"
+    GEN_AI_RATELIMIT_REQUESTS_REMAINING = "gen_ai.ratelimit.requests.remaining"
+    GEN_AI_RATELIMIT_REQUESTS_RESET = "gen_ai.ratelimit.requests.reset"
+    GEN_AI_RATELIMIT_TOKENS_LIMIT = "gen_ai.ratelimit.tokens.limit"
+    GEN_AI_RATELIMIT_TOKENS_REMAINING = "gen_ai.ratelimit.tokens.remaining"
+    GEN_AI_RATELIMIT_TOKENS_RESET = "gen_ai.ratelimit.tokens.reset"
+    GEN_AI_RATELIMIT_INPUT_TOKENS_REMAINING = "gen_ai.ratelimit.input_tokens.remaining"
+    GEN_AI_RATELIMIT_OUTPUT_TOKENS_REMAINING = "gen_ai.ratelimit.output_tokens.remaining"
+
     # GenAI Metric Names (OTel Semconv)
     GEN_AI_CLIENT_TOKEN_USAGE = "gen_ai.client.token.usage"
     DB_CLIENT_TOKEN_USAGE = "db.client.token.usage"
@@ -106,6 +143,18 @@ class SemanticConventions:
     GEN_AI_OUTPUT_TYPE_SPEECH = "speech"
     GEN_AI_OUTPUT_TYPE_TEXT = "text"
 
+    # How a streamed response ended (GEN_AI_STREAM_OUTCOME values)
+    GEN_AI_STREAM_OUTCOME_COMPLETED = "completed"
+    GEN_AI_STREAM_OUTCOME_CLOSED_EARLY = "closed_early"
+    GEN_AI_STREAM_OUTCOME_CANCELLED = "cancelled"
+    GEN_AI_STREAM_OUTCOME_ABANDONED = "abandoned"
+    GEN_AI_STREAM_OUTCOME_ERROR = "error"
+
+    # Batch API operations (GEN_AI_OPERATION_TYPE values)
+    GEN_AI_OPERATION_TYPE_BATCH_CREATE = "batch_create"
+    GEN_AI_OPERATION_TYPE_BATCH_RETRIEVE = "batch_retrieve"
+    GEN_AI_OPERATION_TYPE_BATCH_RESULTS = "batch_results"
+
     # GenAI System Names (OTel Semconv)
     GEN_AI_SYSTEM_ANTHROPIC = "anthropic"
     GEN_AI_SYSTEM_AWS_BEDROCK = "aws.bedrock"
@@ -188,14 +237,35 @@ class SemanticConventions:
 
     # GenAI Request Attributes (Extra)
     GEN_AI_REQUEST_IS_STREAM = "gen_ai.request.is_stream"
+    GEN_AI_STREAM_OUTCOME = "gen_ai.stream.outcome"
+    GEN_AI_USAGE_OUTPUT_TOKENS_DELIVERED = "gen_ai.usage.output_tokens_delivered"
+    # Upper bound: the part of max_tokens an interrupted stream did not deliver
+    GEN_AI_USAGE_OUTPUT_TOKENS_WASTED_MAX = "gen_ai.usage.output_tokens_wasted_max"
     GEN_AI_REQUEST_USER = "gen_ai.request.user"
     GEN_AI_REQUEST_EMBEDDING_DIMENSION = "gen_ai.request.embedding_dimension"
+    GEN_AI_REQUEST_EMBEDDING_INPUT_COUNT = "gen_ai.request.embedding_input_count"
+    GEN_AI_RESPONSE_EMBEDDING_COUNT = "gen_ai.embedding.count"
+    GEN_AI_RESPONSE_EMBEDDING_DIMENSION = "gen_ai.response.embedding_dimension"
     GEN_AI_REQUEST_TOOL_CHOICE = "gen_ai.request.tool_choice"
     GEN_AI_REQUEST_AUDIO_VOICE = "gen_ai.request.audio_voice"
     GEN_AI_REQUEST_AUDIO_RESPONSE_FORMAT = "gen_ai.request.audio_response_format"
     GEN_AI_REQUEST_AUDIO_SPEED = "gen_ai.request.audio_speed"
     GEN_AI_REQUEST_AUDIO_SETTINGS = "gen_ai.request.audio_settings"
     GEN_AI_REQUEST_AUDIO_DURATION = "gen_ai.request.audio_duration"
+    GEN_AI_RESPONSE_AUDIO_BYTES = "gen_ai.response.audio_bytes"
+    GEN_AI_RESPONSE_AUDIO_TIME_TO_FIRST_BYTE = "gen_ai.response.audio_time_to_first_byte"
+    GEN_AI_RESPONSE_AUDIO_BYTES_PER_SECOND = "gen_ai.response.audio_bytes_per_second"
+
+    # Batch API attributes
+    GEN_AI_BATCH_ID = "gen_ai.batch.id"
+    GEN_AI_BATCH_STATUS = "gen_ai.batch.status"
+    GEN_AI_BATCH_ENDPOINT = "gen_ai.batch.endpoint"
+    GEN_AI_BATCH_REQUEST_COUNT = "gen_ai.batch.request_count"
+    GEN_AI_BATCH_REQUEST_SUCCEEDED = "gen_ai.batch.request_succeeded"
+    GEN_AI_BATCH_REQUEST_FAILED = "gen_ai.batch.request_failed"
+    GEN_AI_BATCH_RESULT_COUNT = "gen_ai.batch.result_count"
+    GEN_AI_BATCH_MODELS = "gen_ai.batch.models"
+    GEN_AI_BATCH_COST_SAVED = "gen_ai.batch.cost_saved"
 
     # Translation request attributes
     GEN_AI_REQUEST_TRANSLATE_SOURCE_LANGUAGE = (
@@ -275,6 +345,7 @@ class SemanticConventions:
     GEN_AI_REQUEST_IMAGE_SIZE = "gen_ai.request.image_size"
     GEN_AI_REQUEST_IMAGE_QUALITY = "gen_ai.request.image_quality"
     GEN_AI_REQUEST_IMAGE_STYLE = "gen_ai.request.image_style"
+    GEN_AI_REQUEST_IMAGE_RESPONSE_FORMAT = "gen_ai.request.image_response_format"
     GEN_AI_HUB_OWNER = "gen_ai.hub.owner"
     GEN_AI_HUB_REPO = "gen_ai.hub.repo"
     GEN_AI_RETRIEVAL_SOURCE = "gen_ai.retrieval.source"
@@ -288,6 +359,8 @@ class SemanticConventions:
     GEN_AI_USAGE_TOTAL_TOKENS = "gen_ai.usage.total_tokens"
     GEN_AI_USAGE_COST = "gen_ai.usage.cost"
     GEN_AI_RESPONSE_IMAGE = "gen_ai.response.image"
+    GEN_AI_RESPONSE_IMAGE_COUNT = "gen_ai.image.count"
+    GEN_AI_RESPONSE_IMAGE_BYTES = "gen_ai.response.image_bytes"
     GEN_AI_TOOL_CALLS = "gen_ai.response.tool_calls"
 
     # GenAI Content
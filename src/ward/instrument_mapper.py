@@ -11,12 +11,14 @@ import importlib
 MODULE_MAP = {
     "openai": "openai",
     "anthropic": "anthropic",
+    "http": "openai",
 }
 
 # provider name → fully qualified instrumentor class path
 INSTRUMENT_MAP = {
     "openai": "ward.instrumentation.openai.openaiInstrumentor",
     "anthropic": "ward.instrumentation.anthropic.anthropicInstrumentor",
+    "http": "ward.instrumentation.http.httpInstrumentor",
 }
 
 
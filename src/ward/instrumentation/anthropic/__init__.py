@@ -5,12 +5,21 @@ Auto-instrumentation for the Anthropic Python client (sync + async).
 from typing import Collection, Optional, Any
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry import trace
+from opentelemetry.instrumentation.utils import unwrap
 from wrapt import wrap_function_wrapper
 
 from ward.instrumentation.anthropic.anthropic import (
     messages_create,
     async_messages_create,
 )
+from ward.instrumentation.batch import (
+    anthropic_batch_create,
+    anthropic_batch_retrieve,
+    anthropic_batch_results,
+    async_anthropic_batch_create,
+    async_anthropic_batch_retrieve,
+    async_anthropic_batch_results,
+)
 
 
 class anthropicInstrumentor(BaseInstrumentor):
@@ -39,17 +48,24 @@ class anthropicInstrumentor(BaseInstrumentor):
             "disable_metrics": disable_metrics,
             "version": version,
         }
+        # BaseInstrumentor is a singleton, so __init__ re-runs on every
+        # construction — keep the record of what is currently wrapped.
+        self._wrapped = getattr(self, "_wrapped", [])
 
     def instrument(self, **kwargs):
+        if self._is_instrumented_by_opentelemetry:
+            return
         self._instrument_sync()
         self._instrument_async()
+        self._is_instrumented_by_opentelemetry = True
 
     def _instrument_sync(self):
         try:
             from anthropic.resources.messages import Messages
 
             if hasattr(Messages, "create"):
-                wrap_function_wrapper(Messages, "create", messages_create(self._config))
+                self._wrap(Messages, "create", messages_create(self._config))
+            self._instrument_batches()
         except ImportError as e:
             print(f"Warning: Anthropic not installed or incompatible version: {e}")
             raise
@@ -61,14 +77,38 @@ class anthropicInstrumentor(BaseInstrumentor):
             from anthropic.resources.messages import AsyncMessages
 
             if hasattr(AsyncMessages, "create"):
-                wrap_function_wrapper(AsyncMessages, "create", async_messages_create(self._config))
+                self._wrap(AsyncMessages, "create", async_messages_create(self._config))
+            self._instrument_batches(is_async=True)
         except ImportError:
             pass
         except Exception as e:
             print(f"Warning: Failed to instrument anthropic (async): {e}")
 
+    def _instrument_batches(self, is_async=False):
+        # Message Batches left beta in anthropic 0.39
+        try:
+            from anthropic.resources.messages.batches import AsyncBatches, Batches
+        except ImportError:
+            return
+        if is_async:
+            owner = AsyncBatches
+            factories = (async_anthropic_batch_create, async_anthropic_batch_retrieve, async_anthropic_batch_results)
+        else:
+            owner = Batches
+            factories = (anthropic_batch_create, anthropic_batch_retrieve, anthropic_batch_results)
+        for name, factory in zip(("create", "retrieve", "results"), factories):
+            if hasattr(owner, name):
+                self._wrap(owner, name, factory(self._config))
+
     def instrumentation_dependencies(self) -> Collection[str]:
         return ["anthropic >= 0.18.0"]
 
+    def _wrap(self, owner, name, wrapper):
+        wrap_function_wrapper(owner, name, wrapper)
+        self._wrapped.append((owner, name))
+
     def _uninstrument(self, **kwargs):
-        pass
+        """Restore every method patched by instrument()."""
+        while self._wrapped:
+            owner, name = self._wrapped.pop()
+            unwrap(owner, name)
@@ -6,12 +6,30 @@ Anthropic streaming uses SSE events (message_start, content_block_delta,
 message_delta, message_stop) rather than OpenAI's chunk-per-choice format.
 """
 
+import asyncio
 import time
 from typing import Callable, Dict, Any
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 from ward.conventions import SemanticConventions
-from ward.instrumentation.openai.utils import handle_exception, response_to_dict
+from ward.instrumentation.openai.utils import (
+    StreamProgress,
+    end_stream_span,
+    async_call_unsampled,
+    call_unsampled,
+    handle_exception,
+    is_instrumentation_enabled,
+    is_sampled,
+    message_to_dict,
+    reap_span,
+    response_to_dict,
+    set_content_attribute,
+    set_conversation_attribute,
+    use_json_content,
+)
+from ward.instrumentation.transport import start_http_recording, stop_http_recording
+from ward.otel.enrichment import defer_enrichment, enrichment_enabled
+from ward.policy import get_policy
 
 
 def _get_server_info(instance):
@@ -34,18 +52,27 @@ def _get_server_info(instance):
 class AnthropicStreamWrapper:
     """Wraps an Anthropic sync stream to capture telemetry."""
 
-    def __init__(self, stream, span, start_time, request_model, capture_message_content):
+    __slots__ = (
+        "_stream", "_span", "_start_time", "_model", "_capture_message_content", "_policy",
+        "_input_tokens", "_output_tokens", "_response_id", "_stop_reason", "_chunks_content",
+        "_progress", "_reaper", "__weakref__",
+    )
+
+    def __init__(self, stream, span, start_time, request_model, capture_message_content, policy=None,
+                 max_tokens=None):
         self._stream = stream
         self._span = span
         self._start_time = start_time
         self._model = request_model
         self._capture_message_content = capture_message_content
+        self._policy = policy
         self._input_tokens = 0
         self._output_tokens = 0
         self._response_id = None
         self._stop_reason = None
         self._chunks_content = []
-        self._finalized = False
+        self._progress = StreamProgress(max_tokens)
+        self._reaper = reap_span(self, span, self._progress)
 
     def __iter__(self):
         return self
@@ -56,11 +83,11 @@ class AnthropicStreamWrapper:
             self._process_event(event)
             return event
         except StopIteration:
-            self._finalize_success()
+            self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
             raise
         except Exception as e:
             handle_exception(self._span, e)
-            self._end_span()
+            self._end_span(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR)
             raise
 
     def __enter__(self):
@@ -71,12 +98,12 @@ class AnthropicStreamWrapper:
     def __exit__(self, *args):
         if hasattr(self._stream, "__exit__"):
             self._stream.__exit__(*args)
-        self._finalize_success()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
 
     def close(self):
         if hasattr(self._stream, "close"):
             self._stream.close()
-        self._finalize_success()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
 
     def _process_event(self, event):
         """
@@ -103,6 +130,9 @@ class AnthropicStreamWrapper:
             delta = event_dict.get("delta", {})
             if isinstance(delta, dict) and delta.get("text"):
                 self._chunks_content.append(delta["text"])
+                self._progress.add_text(delta["text"])
+            elif isinstance(delta, dict) and delta.get("partial_json"):
+                self._progress.add_text(delta["partial_json"])
 
         elif event_type == "message_delta":
             delta = event_dict.get("delta", {})
@@ -112,12 +142,12 @@ class AnthropicStreamWrapper:
             if isinstance(usage, dict):
                 self._output_tokens = usage.get("output_tokens", self._output_tokens)
 
-    def _finalize_success(self):
-        if self._finalized:
+    def _finalize(self, outcome):
+        """End the span with everything accumulated so far; no-op once ended."""
+        if not self._reaper.alive:
             return
         self._set_span_attributes()
-        self._span.set_status(trace.Status(trace.StatusCode.OK))
-        self._end_span()
+        self._end_span(outcome)
 
     def _set_span_attributes(self):
         if not self._span.is_recording():
@@ -136,35 +166,33 @@ class AnthropicStreamWrapper:
         if self._stop_reason:
             self._span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_FINISH_REASON, self._stop_reason)
         if self._capture_message_content and self._chunks_content:
-            self._span.set_attribute(
-                f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.0",
-                "".join(self._chunks_content),
-            )
-
-    def _end_span(self):
-        if not self._finalized:
-            self._finalized = True
-            self._span.end()
+            _set_output_content(self._span, [(0, "".join(self._chunks_content))], self._stop_reason, self._policy)
 
-    def __del__(self):
-        self._end_span()
+    def _end_span(self, outcome):
+        if self._reaper.detach():
+            end_stream_span(self._span, outcome, self._progress, self._output_tokens or None)
 
 
 class AsyncAnthropicStreamWrapper:
     """Async equivalent of AnthropicStreamWrapper."""
 
-    def __init__(self, stream, span, start_time, request_model, capture_message_content):
+    __slots__ = AnthropicStreamWrapper.__slots__
+
+    def __init__(self, stream, span, start_time, request_model, capture_message_content, policy=None,
+                 max_tokens=None):
         self._stream = stream
         self._span = span
         self._start_time = start_time
         self._model = request_model
         self._capture_message_content = capture_message_content
+        self._policy = policy
         self._input_tokens = 0
         self._output_tokens = 0
         self._response_id = None
         self._stop_reason = None
         self._chunks_content = []
-        self._finalized = False
+        self._progress = StreamProgress(max_tokens)
+        self._reaper = reap_span(self, span, self._progress)
 
     def __aiter__(self):
         return self
@@ -175,11 +203,14 @@ class AsyncAnthropicStreamWrapper:
             self._process_event(event)
             return event
         except StopAsyncIteration:
-            self._finalize_success()
+            self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+            raise
+        except asyncio.CancelledError:
+            self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED)
             raise
         except Exception as e:
             handle_exception(self._span, e)
-            self._end_span()
+            self._end_span(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR)
             raise
 
     async def __aenter__(self):
@@ -190,7 +221,12 @@ class AsyncAnthropicStreamWrapper:
     async def __aexit__(self, *args):
         if hasattr(self._stream, "__aexit__"):
             await self._stream.__aexit__(*args)
-        self._finalize_success()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+    async def close(self):
+        if hasattr(self._stream, "close"):
+            await self._stream.close()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
 
     def _process_event(self, event):
         event_dict = response_to_dict(event)
@@ -208,6 +244,9 @@ class AsyncAnthropicStreamWrapper:
             delta = event_dict.get("delta", {})
             if isinstance(delta, dict) and delta.get("text"):
                 self._chunks_content.append(delta["text"])
+                self._progress.add_text(delta["text"])
+            elif isinstance(delta, dict) and delta.get("partial_json"):
+                self._progress.add_text(delta["partial_json"])
         elif event_type == "message_delta":
             delta = event_dict.get("delta", {})
             if isinstance(delta, dict):
@@ -216,12 +255,12 @@ class AsyncAnthropicStreamWrapper:
             if isinstance(usage, dict):
                 self._output_tokens = usage.get("output_tokens", self._output_tokens)
 
-    def _finalize_success(self):
-        if self._finalized:
+    def _finalize(self, outcome):
+        """End the span with everything accumulated so far; no-op once ended."""
+        if not self._reaper.alive:
             return
         self._set_span_attributes()
-        self._span.set_status(trace.Status(trace.StatusCode.OK))
-        self._end_span()
+        self._end_span(outcome)
 
     def _set_span_attributes(self):
         if not self._span.is_recording():
@@ -240,32 +279,45 @@ class AsyncAnthropicStreamWrapper:
         if self._stop_reason:
             self._span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_FINISH_REASON, self._stop_reason)
         if self._capture_message_content and self._chunks_content:
-            self._span.set_attribute(
-                f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.0",
-                "".join(self._chunks_content),
-            )
+            _set_output_content(self._span, [(0, "".join(self._chunks_content))], self._stop_reason, self._policy)
 
-    def _end_span(self):
-        if not self._finalized:
-            self._finalized = True
-            self._span.end()
+    def _end_span(self, outcome):
+        if self._reaper.detach():
+            end_stream_span(self._span, outcome, self._progress, self._output_tokens or None)
 
-    def __del__(self):
-        self._end_span()
 
+def _set_output_content(span, texts, stop_reason, policy=None):
+    """
+    Record assistant text, per content block or as one JSON output message.
 
-def _set_request_attributes(span, kwargs, capture_message_content):
+    ``texts`` is a list of (content block index, text).
+    """
+    if use_json_content(policy):
+        message = {"role": "assistant", "content": "".join(text for _, text in texts)}
+        if stop_reason:
+            message["finish_reason"] = stop_reason
+        set_conversation_attribute(span, SemanticConventions.GEN_AI_OUTPUT_MESSAGES, [message], policy)
+        return
+    for i, text in texts:
+        set_content_attribute(span, f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.{i}", text, policy)
+
+
+def _set_request_attributes(span, kwargs, capture_message_content, policy=None):
     """Record prompt messages and model parameters as span attributes."""
-    # Anthropic passes system prompt as a top-level kwarg, not inside messages
-    if capture_message_content and "messages" in kwargs:
-        for i, msg in enumerate(kwargs["messages"]):
+    if capture_message_content and use_json_content(policy):
+        messages = [message_to_dict(msg) for msg in kwargs.get("messages") or ()]
+        if "system" in kwargs:
+            messages.insert(0, {"role": "system", "content": kwargs["system"]})
+        set_conversation_attribute(span, SemanticConventions.GEN_AI_CONTENT_PROMPT, messages, policy)
+    elif capture_message_content:
+        for i, msg in enumerate(kwargs.get("messages") or ()):
             role = msg.get("role") if isinstance(msg, dict) else getattr(msg, "role", None)
             content = msg.get("content") if isinstance(msg, dict) else getattr(msg, "content", None)
             if role == "user" and content:
-                span.set_attribute(f"{SemanticConventions.GEN_AI_USER_MESSAGE}.{i}", str(content))
-
-    if capture_message_content and "system" in kwargs:
-        span.set_attribute(f"{SemanticConventions.GEN_AI_SYSTEM_MESSAGE}.0", str(kwargs["system"]))
+                set_content_attribute(span, f"{SemanticConventions.GEN_AI_USER_MESSAGE}.{i}", content, policy)
+        # Anthropic passes system prompt as a top-level kwarg, not inside messages
+        if "system" in kwargs:
+            set_content_attribute(span, f"{SemanticConventions.GEN_AI_SYSTEM_MESSAGE}.0", kwargs["system"], policy)
 
     for param, attr in [
         ("temperature", SemanticConventions.GEN_AI_REQUEST_TEMPERATURE),
@@ -277,12 +329,27 @@ def _set_request_attributes(span, kwargs, capture_message_content):
             span.set_attribute(attr, kwargs[param])
 
 
-def _process_message_response(response, span, start_time, request_model, pricing_info, capture_message_content):
+def _defer_message_response(
+    response, span, start_time, request_model, pricing_info, capture_message_content, policy,
+) -> bool:
+    """Leave response processing to the export thread when enrichment is deferred."""
+    if not enrichment_enabled():
+        return False
+    return defer_enrichment(
+        span, _process_message_response,
+        response=response, start_time=start_time, request_model=request_model, pricing_info=pricing_info,
+        capture_message_content=capture_message_content, policy=policy, end_time=time.time(),
+    )
+
+
+def _process_message_response(
+    response, span, start_time, request_model, pricing_info, capture_message_content, policy=None, end_time=None,
+):
     """Process a non-streaming Anthropic Messages response."""
     if not span.is_recording():
         return
 
-    duration = time.time() - start_time
+    duration = (end_time or time.time()) - start_time
     span.set_attribute(SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, duration)
 
     response_dict = response_to_dict(response)
@@ -317,12 +384,12 @@ def _process_message_response(response, span, start_time, request_model, pricing
     if capture_message_content:
         content_blocks = response_dict.get("content", [])
         if isinstance(content_blocks, list):
-            for i, block in enumerate(content_blocks):
-                if isinstance(block, dict) and block.get("text"):
-                    span.set_attribute(
-                        f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.{i}",
-                        str(block["text"]),
-                    )
+            texts = [
+                (i, block["text"]) for i, block in enumerate(content_blocks)
+                if isinstance(block, dict) and block.get("text")
+            ]
+            if texts:
+                _set_output_content(span, texts, response_dict.get("stop_reason"), policy)
 
     span.set_status(trace.Status(trace.StatusCode.OK))
 
@@ -334,30 +401,59 @@ def messages_create(config: Dict[str, Any]) -> Callable:
     capture_message_content = config.get("capture_message_content", True)
 
     def wrapper(wrapped, instance, args, kwargs):
-        server_address, server_port = _get_server_info(instance)
+        if not is_instrumentation_enabled():
+            return wrapped(*args, **kwargs)
+
         request_model = kwargs.get("model", "claude-sonnet-4-20250514")
-        span_name = f"chat {request_model}"
+        policy = get_policy().for_model(request_model, SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT)
+        if not policy.sampled():
+            return wrapped(*args, **kwargs)
+
+        span = tracer.start_span(
+            f"chat {request_model}",
+            kind=SpanKind.CLIENT,
+            # Set at start so samplers can key on them
+            attributes={
+                SemanticConventions.GEN_AI_SYSTEM: SemanticConventions.GEN_AI_SYSTEM_ANTHROPIC,
+                SemanticConventions.GEN_AI_OPERATION_TYPE: SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT,
+                SemanticConventions.GEN_AI_REQUEST_MODEL: request_model,
+            },
+        )
+        if not is_sampled(span):
+            # Dropped, or kept RECORD_ONLY over a rate cap: pass the call and its
+            # response through untouched, recording only a raised error
+            return call_unsampled(span, wrapped, args, kwargs)
+
+        capture_content = policy.capture_content(capture_message_content, span)
+        server_address, server_port = _get_server_info(instance)
         is_streaming = kwargs.get("stream", False)
 
-        span = tracer.start_span(span_name, kind=SpanKind.CLIENT)
-
-        if span.is_recording():
-            span.set_attribute(SemanticConventions.GEN_AI_SYSTEM, SemanticConventions.GEN_AI_SYSTEM_ANTHROPIC)
-            span.set_attribute(SemanticConventions.GEN_AI_OPERATION_TYPE, SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT)
-            span.set_attribute(SemanticConventions.GEN_AI_REQUEST_MODEL, request_model)
-            span.set_attribute(SemanticConventions.SERVER_ADDRESS, server_address)
-            span.set_attribute(SemanticConventions.SERVER_PORT, server_port)
-            _set_request_attributes(span, kwargs, capture_message_content)
+        span.set_attribute(SemanticConventions.SERVER_ADDRESS, server_address)
+        span.set_attribute(SemanticConventions.SERVER_PORT, server_port)
+        _set_request_attributes(span, kwargs, capture_content, policy)
 
         start_time = time.time()
 
         try:
-            response = wrapped(*args, **kwargs)
+            recorder, token = start_http_recording(instance, is_async=False)
+            try:
+                response = wrapped(*args, **kwargs)
+            finally:
+                stop_http_recording(token)
+                recorder.set_span_attributes(span)
 
             if is_streaming:
-                return AnthropicStreamWrapper(response, span, start_time, request_model, capture_message_content)
-
-            _process_message_response(response, span, start_time, request_model, pricing_info, capture_message_content)
+                return AnthropicStreamWrapper(
+                    response, span, start_time, request_model, capture_content, policy,
+                    max_tokens=kwargs.get("max_tokens"),
+                )
+
+            if not _defer_message_response(
+                response, span, start_time, request_model, pricing_info, capture_content, policy,
+            ):
+                _process_message_response(
+                    response, span, start_time, request_model, pricing_info, capture_content, policy,
+                )
             span.end()
             return response
         except Exception as e:
@@ -375,30 +471,59 @@ def async_messages_create(config: Dict[str, Any]) -> Callable:
     capture_message_content = config.get("capture_message_content", True)
 
     async def async_wrapper(wrapped, instance, args, kwargs):
-        server_address, server_port = _get_server_info(instance)
+        if not is_instrumentation_enabled():
+            return await wrapped(*args, **kwargs)
+
         request_model = kwargs.get("model", "claude-sonnet-4-20250514")
-        span_name = f"chat {request_model}"
+        policy = get_policy().for_model(request_model, SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT)
+        if not policy.sampled():
+            return await wrapped(*args, **kwargs)
+
+        span = tracer.start_span(
+            f"chat {request_model}",
+            kind=SpanKind.CLIENT,
+            # Set at start so samplers can key on them
+            attributes={
+                SemanticConventions.GEN_AI_SYSTEM: SemanticConventions.GEN_AI_SYSTEM_ANTHROPIC,
+                SemanticConventions.GEN_AI_OPERATION_TYPE: SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT,
+                SemanticConventions.GEN_AI_REQUEST_MODEL: request_model,
+            },
+        )
+        if not is_sampled(span):
+            # Dropped, or kept RECORD_ONLY over a rate cap: pass the call and its
+            # response through untouched, recording only a raised error
+            return await async_call_unsampled(span, wrapped, args, kwargs)
+
+        capture_content = policy.capture_content(capture_message_content, span)
+        server_address, server_port = _get_server_info(instance)
         is_streaming = kwargs.get("stream", False)
 
-        span = tracer.start_span(span_name, kind=SpanKind.CLIENT)
-
-        if span.is_recording():
-            span.set_attribute(SemanticConventions.GEN_AI_SYSTEM, SemanticConventions.GEN_AI_SYSTEM_ANTHROPIC)
-            span.set_attribute(SemanticConventions.GEN_AI_OPERATION_TYPE, SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT)
-            span.set_attribute(SemanticConventions.GEN_AI_REQUEST_MODEL, request_model)
-            span.set_attribute(SemanticConventions.SERVER_ADDRESS, server_address)
-            span.set_attribute(SemanticConventions.SERVER_PORT, server_port)
-            _set_request_attributes(span, kwargs, capture_message_content)
+        span.set_attribute(SemanticConventions.SERVER_ADDRESS, server_address)
+        span.set_attribute(SemanticConventions.SERVER_PORT, server_port)
+        _set_request_attributes(span, kwargs, capture_content, policy)
 
         start_time = time.time()
 
         try:
-            response = await wrapped(*args, **kwargs)
+            recorder, token = start_http_recording(instance, is_async=True)
+            try:
+                response = await wrapped(*args, **kwargs)
+            finally:
+                stop_http_recording(token)
+                recorder.set_span_attributes(span)
 
             if is_streaming:
-                return AsyncAnthropicStreamWrapper(response, span, start_time, request_model, capture_message_content)
-
-            _process_message_response(response, span, start_time, request_model, pricing_info, capture_message_content)
+                return AsyncAnthropicStreamWrapper(
+                    response, span, start_time, request_model, capture_content, policy,
+                    max_tokens=kwargs.get("max_tokens"),
+                )
+
+            if not _defer_message_response(
+                response, span, start_time, request_model, pricing_info, capture_content, policy,
+            ):
+                _process_message_response(
+                    response, span, start_time, request_model, pricing_info, capture_content, policy,
+                )
             span.end()
             return response
         except Exception as e:
@@ -0,0 +1,821 @@
+"""
+Batch API instrumentation: OpenAI Batch API and Anthropic Message Batches.
+
+A batch is submitted in one trace and collected in others, often hours later
+and from another process. Ward records three kinds of span:
+
+  - ``batch_create``: the submission. Its span context is remembered under
+    the batch id and, for OpenAI, also written to the batch's ``metadata``
+    as a W3C traceparent (``ward_traceparent``) so other processes find it.
+  - ``batch_retrieve``: a status poll. Status and request counts, plus token
+    usage and discounted cost when the API reports them (OpenAI).
+  - ``batch_results``: reading the results, i.e. downloading an OpenAI
+    batch's output or error file, or iterating Anthropic's
+    ``batches.results()``. Results are parsed one line at a time as the
+    caller reads them, so memory stays constant however large the file.
+    They are aggregated into request counts, token totals, cost at the batch
+    discount and the saving against real-time prices (see BatchResults).
+
+Retrieve and results spans link to the create span. OpenAI file downloads
+are only recorded for files a retrieve in this process reported as a
+batch's output or error file; other files pass through untouched.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import wrapt
+from opentelemetry import trace
+from opentelemetry.trace import Link, SpanContext, SpanKind, TraceFlags
+
+from ward.conventions import SemanticConventions
+from ward.instrumentation.openai.utils import (
+    async_call_unsampled,
+    call_unsampled,
+    end_stream_span,
+    get_field,
+    handle_exception,
+    is_instrumentation_enabled,
+    is_sampled,
+    json_loads,
+    reap_span,
+    set_server_address_and_port,
+)
+from ward.otel.enrichment import defer_enrichment, enrichment_enabled
+from ward.pricing import calculate_cost
+
+# Batch ids (and OpenAI result files) remembered for linking; oldest dropped first
+_MAX_TRACKED = 4096
+_SUBMITTED = OrderedDict()  # batch id -> SpanContext of its batch_create span
+_RESULT_FILES = OrderedDict()  # OpenAI output/error file id -> batch id
+_LOCK = threading.Lock()
+
+# OpenAI batch metadata key carrying the submitting span's traceparent
+TRACEPARENT_KEY = "ward_traceparent"
+# OpenAI allows at most this many metadata keys per batch
+_MAX_METADATA_KEYS = 16
+
+# Header the OpenAI SDK sets on requests made via with_raw_response / with_streaming_response
+_RAW_RESPONSE_HEADER = "X-Stainless-Raw-Response"
+
+# Returned by an operation's batch_id hook for calls that are not recorded
+_PASS = object()
+
+
+def _remember(table, key, value):
+    with _LOCK:
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > _MAX_TRACKED:
+            table.popitem(last=False)
+
+
+def _lookup(table, key):
+    with _LOCK:
+        return table.get(key)
+
+
+def _traceparent(span_context):
+    return f"00-{span_context.trace_id:032x}-{span_context.span_id:016x}-{int(span_context.trace_flags):02x}"
+
+
+def _parse_traceparent(value):
+    try:
+        _, trace_id, span_id, flags = value.split("-")
+        span_context = SpanContext(
+            int(trace_id, 16), int(span_id, 16), is_remote=True, trace_flags=TraceFlags(int(flags, 16)),
+        )
+    except (AttributeError, ValueError):
+        return None
+    return span_context if span_context.is_valid else None
+
+
+class BatchResults:
+    """
+    Running totals over a batch's results, fed one result at a time.
+
+    Accepts OpenAI result lines (``{"custom_id", "response": {"status_code",
+    "body"}, "error"}``, for any batch endpoint) and Anthropic results
+    (``{"custom_id", "result": {"type", "message"}}``), as dicts or SDK
+    objects. Tokens are summed per model and priced once at the end, so
+    per-request rounding never accumulates. ``feed`` takes raw JSONL bytes in
+    chunks of any size.
+    """
+
+    __slots__ = ("provider", "count", "succeeded", "failed", "_models", "_partial")
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.count = 0
+        self.succeeded = 0
+        self.failed = 0
+        self._models = {}  # model -> [input tokens, output tokens]
+        self._partial = []  # bytes of a line not yet terminated
+
+    def add(self, result):
+        """Count one result."""
+        self.count += 1
+        outcome = get_field(result, "result")
+        if outcome is not None:
+            body = get_field(outcome, "message") if get_field(outcome, "type") == "succeeded" else None
+        else:
+            response = get_field(result, "response")
+            ok = get_field(response, "status_code") == 200 and not get_field(result, "error")
+            body = get_field(response, "body") if ok else None
+        if body is None:
+            self.failed += 1
+            return
+        self.succeeded += 1
+        usage = get_field(body, "usage")
+        input_tokens = get_field(usage, "input_tokens")
+        if input_tokens is None:
+            input_tokens = get_field(usage, "prompt_tokens")
+        output_tokens = get_field(usage, "output_tokens")
+        if output_tokens is None:
+            output_tokens = get_field(usage, "completion_tokens")
+        model = get_field(body, "model") or "unknown"
+        totals = self._models.get(model)
+        if totals is None:
+            totals = self._models[model] = [0, 0]
+        totals[0] += input_tokens or 0
+        totals[1] += output_tokens or 0
+
+    def add_line(self, line):
+        """Count one JSONL line; blank lines are skipped, unparseable ones count as failed."""
+        if not line.strip():
+            return
+        try:
+            result = json_loads(line)
+        except ValueError:
+            self.count += 1
+            self.failed += 1
+            return
+        self.add(result)
+
+    def feed(self, chunk):
+        """Count every line ``chunk`` completes; a trailing partial line waits for the next chunk."""
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            if chunk:
+                self._partial.append(chunk)
+            return
+        start = 0
+        if self._partial:
+            first = chunk.find(b"\n")
+            self._partial.append(chunk[:first])
+            self.add_line(b"".join(self._partial))
+            self._partial = []
+            start = first + 1
+        # Walk the chunk in place: a whole downloaded file is never copied or split into a list
+        while start < end:
+            stop = chunk.find(b"\n", start, end)
+            if stop == -1:
+                stop = end
+            self.add_line(chunk[start:stop])
+            start = stop + 1
+        if end + 1 < len(chunk):
+            self._partial.append(chunk[end + 1:])
+
+    def flush(self):
+        """Count a final line the data ended without terminating."""
+        if self._partial:
+            line = b"".join(self._partial)
+            self._partial = []
+            self.add_line(line)
+
+    def set_span_attributes(self, span):
+        if not span.is_recording():
+            return
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_RESULT_COUNT, self.count)
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_REQUEST_SUCCEEDED, self.succeeded)
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_REQUEST_FAILED, self.failed)
+        if not self._models:
+            return
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_MODELS, sorted(self._models))
+        span.set_attribute(
+            SemanticConventions.GEN_AI_USAGE_INPUT_TOKENS, sum(tokens[0] for tokens in self._models.values()),
+        )
+        span.set_attribute(
+            SemanticConventions.GEN_AI_USAGE_OUTPUT_TOKENS, sum(tokens[1] for tokens in self._models.values()),
+        )
+        _set_batch_cost(span, self.provider, self._models.items())
+
+
+def _set_batch_cost(span, provider, model_tokens):
+    """Cost at the batch discount, and what the same tokens would have cost in real time."""
+    cost = realtime_cost = 0.0
+    priced = False
+    for model, (input_tokens, output_tokens) in model_tokens:
+        discounted = calculate_cost(model, input_tokens, output_tokens, provider=provider, batch=True)
+        if discounted is None:
+            continue
+        priced = True
+        cost += discounted
+        realtime_cost += calculate_cost(model, input_tokens, output_tokens, provider=provider)
+    if priced:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_COST, round(cost, 6))
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_COST_SAVED, round(realtime_cost - cost, 6))
+
+
+# ---------------------------------------------------------------------------
+# Result readers
+# ---------------------------------------------------------------------------
+
+class _ResultsStreamMixin:
+    """Span ending shared by the result proxies."""
+
+    def _self_finalize(self, outcome):
+        if not self._self_reaper.alive:
+            return
+        span = self._self_span
+        if span.is_recording():
+            self._self_results.flush()
+            self._self_results.set_span_attributes(span)
+            span.set_attribute(
+                SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, time.time() - self._self_start_time,
+            )
+        self._self_end_span(outcome)
+
+    def _self_fail(self, e):
+        handle_exception(self._self_span, e)
+        self._self_end_span(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR)
+
+    def _self_end_span(self, outcome):
+        if self._self_reaper.detach():
+            end_stream_span(self._self_span, outcome)
+
+
+class BatchFileStreamWrapper(_ResultsStreamMixin, wrapt.ObjectProxy):
+    """
+    Proxy around a streamed OpenAI batch result file (``files.with_streaming_response.content``).
+
+    Feeds the bytes to BatchResults as the caller reads them; nothing is
+    buffered beyond one partial line.
+    """
+
+    def __init__(self, response, span, start_time, results):
+        super().__init__(response)
+        self._self_span = span
+        self._self_start_time = start_time
+        self._self_results = results
+        # Ends the span if the caller drops the response without closing it
+        self._self_reaper = reap_span(self, span)
+
+    def iter_bytes(self, chunk_size=None):
+        try:
+            for chunk in self.__wrapped__.iter_bytes(chunk_size):
+                self._self_results.feed(chunk)
+                yield chunk
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+
+    def iter_lines(self):
+        try:
+            for line in self.__wrapped__.iter_lines():
+                self._self_results.add_line(line)
+                yield line
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+
+    def read(self):
+        try:
+            content = self.__wrapped__.read()
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_results.feed(content)
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+        return content
+
+    def text(self):
+        self.read()
+        return self.__wrapped__.text()
+
+    def json(self):
+        self.read()
+        return self.__wrapped__.json()
+
+    def stream_to_file(self, file, *, chunk_size=None):
+        # Re-implemented so the writes go through our iter_bytes, not the wrapped one
+        with open(file, mode="wb") as f:
+            for data in self.iter_bytes(chunk_size):
+                f.write(data)
+
+    def close(self):
+        try:
+            self.__wrapped__.close()
+        finally:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+
+class AsyncBatchFileStreamWrapper(_ResultsStreamMixin, wrapt.ObjectProxy):
+    """Async equivalent of BatchFileStreamWrapper."""
+
+    def __init__(self, response, span, start_time, results):
+        super().__init__(response)
+        self._self_span = span
+        self._self_start_time = start_time
+        self._self_results = results
+        # Ends the span if the caller drops the response without closing it
+        self._self_reaper = reap_span(self, span)
+
+    async def iter_bytes(self, chunk_size=None):
+        try:
+            async for chunk in self.__wrapped__.iter_bytes(chunk_size):
+                self._self_results.feed(chunk)
+                yield chunk
+        except asyncio.CancelledError:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED)
+            raise
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+
+    async def iter_lines(self):
+        try:
+            async for line in self.__wrapped__.iter_lines():
+                self._self_results.add_line(line)
+                yield line
+        except asyncio.CancelledError:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED)
+            raise
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+
+    async def read(self):
+        try:
+            content = await self.__wrapped__.read()
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_results.feed(content)
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+        return content
+
+    async def text(self):
+        await self.read()
+        return await self.__wrapped__.text()
+
+    async def json(self):
+        await self.read()
+        return await self.__wrapped__.json()
+
+    async def stream_to_file(self, file, *, chunk_size=None):
+        import anyio
+
+        path = anyio.Path(file)
+        async with await path.open(mode="wb") as f:
+            async for data in self.iter_bytes(chunk_size):
+                await f.write(data)
+
+    async def close(self):
+        try:
+            await self.__wrapped__.close()
+        finally:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+
+class BatchResultsWrapper(_ResultsStreamMixin, wrapt.ObjectProxy):
+    """
+    Proxy around the decoder Anthropic's ``batches.results()`` returns.
+
+    The SDK already decodes the JSONL stream one line at a time; each result
+    is counted as it is yielded and then dropped.
+    """
+
+    def __init__(self, decoder, span, start_time, results):
+        super().__init__(decoder)
+        self._self_span = span
+        self._self_start_time = start_time
+        self._self_results = results
+        # Ends the span if the caller drops the decoder without finishing or closing it
+        self._self_reaper = reap_span(self, span)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            result = next(self.__wrapped__)
+        except StopIteration:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+            raise
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_results.add(result)
+        return result
+
+    def close(self):
+        try:
+            self.__wrapped__.close()
+        finally:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+
+class AsyncBatchResultsWrapper(_ResultsStreamMixin, wrapt.ObjectProxy):
+    """Async equivalent of BatchResultsWrapper."""
+
+    def __init__(self, decoder, span, start_time, results):
+        super().__init__(decoder)
+        self._self_span = span
+        self._self_start_time = start_time
+        self._self_results = results
+        # Ends the span if the caller drops the decoder without finishing or closing it
+        self._self_reaper = reap_span(self, span)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            result = await self.__wrapped__.__anext__()
+        except StopAsyncIteration:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+            raise
+        except asyncio.CancelledError:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED)
+            raise
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_results.add(result)
+        return result
+
+    async def close(self):
+        try:
+            await self.__wrapped__.close()
+        finally:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+
+def _process_result_file(span, content, provider):
+    """Aggregate a downloaded result file that is already in memory, line by line."""
+    results = BatchResults(provider)
+    results.feed(content)
+    results.flush()
+    results.set_span_attributes(span)
+
+
+# ---------------------------------------------------------------------------
+# Operations
+# ---------------------------------------------------------------------------
+
+class _Operation:
+    """How to record one batch API method."""
+
+    __slots__ = ("system", "name", "default_address", "batch_id", "record_request", "record_response")
+
+    def __init__(self, system, name, default_address, batch_id, record_request, record_response):
+        self.system = system
+        self.name = name
+        self.default_address = default_address
+        self.batch_id = batch_id  # (args, kwargs) -> batch id, None, or _PASS
+        self.record_request = record_request  # (span, kwargs) -> kwargs to call with
+        self.record_response = record_response  # (span, response, kwargs, start_time, is_async) -> proxy or None
+
+
+def _argument(name):
+    """Batch id hook reading the first positional argument or keyword ``name``."""
+    def batch_id(args, kwargs):
+        return args[0] if args else kwargs.get(name)
+    return batch_id
+
+
+def _no_batch_id(args, kwargs):
+    return None
+
+
+def _keep_kwargs(span, kwargs):
+    return kwargs
+
+
+def _submitted(span, batch_id):
+    """Remember the create span under the batch id it got."""
+    if batch_id:
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_ID, batch_id)
+        _remember(_SUBMITTED, batch_id, span.get_span_context())
+
+
+def _record_openai_create(span, kwargs):
+    if kwargs.get("endpoint"):
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_ENDPOINT, str(kwargs["endpoint"]))
+    metadata = kwargs.get("metadata")
+    if metadata is not None and not isinstance(metadata, dict):
+        return kwargs
+    metadata = metadata or {}
+    if TRACEPARENT_KEY in metadata or len(metadata) >= _MAX_METADATA_KEYS:
+        return kwargs
+    return {**kwargs, "metadata": {**metadata, TRACEPARENT_KEY: _traceparent(span.get_span_context())}}
+
+
+def _record_openai_batch(span, batch, kwargs, start_time, is_async):
+    """Attributes of an OpenAI ``Batch`` (create and retrieve responses)."""
+    batch_id = get_field(batch, "id")
+    if batch_id:
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_ID, batch_id)
+    status = get_field(batch, "status")
+    if status:
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_STATUS, str(status))
+    if get_field(batch, "endpoint"):
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_ENDPOINT, str(get_field(batch, "endpoint")))
+    counts = get_field(batch, "request_counts")
+    if counts is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_REQUEST_COUNT, get_field(counts, "total") or 0)
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_REQUEST_SUCCEEDED, get_field(counts, "completed") or 0)
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_REQUEST_FAILED, get_field(counts, "failed") or 0)
+    usage = get_field(batch, "usage")
+    if usage is not None:
+        input_tokens = get_field(usage, "input_tokens") or 0
+        output_tokens = get_field(usage, "output_tokens") or 0
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_INPUT_TOKENS, input_tokens)
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_OUTPUT_TOKENS, output_tokens)
+        model = get_field(batch, "model")
+        if model:
+            span.set_attribute(SemanticConventions.GEN_AI_BATCH_MODELS, [str(model)])
+            _set_batch_cost(span, "openai", [(model, (input_tokens, output_tokens))])
+    for field in ("output_file_id", "error_file_id"):
+        file_id = get_field(batch, field)
+        if file_id and batch_id:
+            _remember(_RESULT_FILES, file_id, batch_id)
+    return None
+
+
+def _record_openai_created(span, batch, kwargs, start_time, is_async):
+    _record_openai_batch(span, batch, kwargs, start_time, is_async)
+    _submitted(span, get_field(batch, "id"))
+    return None
+
+
+def _record_openai_retrieved(span, batch, kwargs, start_time, is_async):
+    _record_openai_batch(span, batch, kwargs, start_time, is_async)
+    # Submitted in another process: the link travels in the batch's metadata
+    if _lookup(_SUBMITTED, get_field(batch, "id")) is None and hasattr(span, "add_link"):
+        submitted = _parse_traceparent(get_field(get_field(batch, "metadata"), TRACEPARENT_KEY))
+        if submitted is not None:
+            span.add_link(submitted)
+    return None
+
+
+def _openai_result_file(args, kwargs):
+    """Batch id of a result file download; anything else is passed through."""
+    extra_headers = kwargs.get("extra_headers") or {}
+    if extra_headers.get(_RAW_RESPONSE_HEADER) == "raw":
+        return _PASS
+    file_id = args[0] if args else kwargs.get("file_id")
+    batch_id = _lookup(_RESULT_FILES, file_id)
+    return _PASS if batch_id is None else batch_id
+
+
+def _record_openai_file(span, response, kwargs, start_time, is_async):
+    extra_headers = kwargs.get("extra_headers") or {}
+    if extra_headers.get(_RAW_RESPONSE_HEADER) == "stream":
+        # files.with_streaming_response.content: the body is read as the caller reads it
+        wrapper = AsyncBatchFileStreamWrapper if is_async else BatchFileStreamWrapper
+        return wrapper(response, span, start_time, BatchResults("openai"))
+    # files.content has downloaded the whole file: aggregate now, or on the export thread
+    content = response.content
+    deferred = enrichment_enabled() and defer_enrichment(
+        span, _process_result_file, content=content, provider="openai",
+    )
+    if not deferred:
+        _process_result_file(span, content, "openai")
+    return None
+
+
+def _counted_requests(span, requests):
+    """Yield ``requests``, recording their count and models on ``span`` once all are seen."""
+    count = 0
+    models = set()
+    for request in requests:
+        count += 1
+        model = get_field(get_field(request, "params"), "model")
+        if model is not None:
+            models.add(str(model))
+        yield request
+    span.set_attribute(SemanticConventions.GEN_AI_BATCH_REQUEST_COUNT, count)
+    if models:
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_MODELS, sorted(models))
+
+
+def _record_anthropic_create(span, kwargs):
+    requests = kwargs.get("requests")
+    if requests is None:
+        return kwargs
+    if isinstance(requests, Sequence):
+        for _ in _counted_requests(span, requests):
+            pass
+        return kwargs
+    # Count as the SDK consumes the iterable rather than copying it first
+    return {**kwargs, "requests": _counted_requests(span, requests)}
+
+
+def _record_anthropic_batch(span, batch, kwargs, start_time, is_async):
+    """Attributes of an Anthropic ``MessageBatch`` (create and retrieve responses)."""
+    batch_id = get_field(batch, "id")
+    if batch_id:
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_ID, batch_id)
+    status = get_field(batch, "processing_status")
+    if status:
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_STATUS, str(status))
+    counts = get_field(batch, "request_counts")
+    if counts is not None:
+        succeeded = get_field(counts, "succeeded") or 0
+        failed = sum(get_field(counts, field) or 0 for field in ("errored", "canceled", "expired"))
+        total = succeeded + failed + (get_field(counts, "processing") or 0)
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_REQUEST_COUNT, total)
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_REQUEST_SUCCEEDED, succeeded)
+        span.set_attribute(SemanticConventions.GEN_AI_BATCH_REQUEST_FAILED, failed)
+    return None
+
+
+def _record_anthropic_created(span, batch, kwargs, start_time, is_async):
+    _record_anthropic_batch(span, batch, kwargs, start_time, is_async)
+    _submitted(span, get_field(batch, "id"))
+    return None
+
+
+def _record_anthropic_results(span, decoder, kwargs, start_time, is_async):
+    wrapper = AsyncBatchResultsWrapper if is_async else BatchResultsWrapper
+    return wrapper(decoder, span, start_time, BatchResults("anthropic"))
+
+
+_OPENAI = SemanticConventions.GEN_AI_SYSTEM_OPENAI
+_ANTHROPIC = SemanticConventions.GEN_AI_SYSTEM_ANTHROPIC
+_CREATE = SemanticConventions.GEN_AI_OPERATION_TYPE_BATCH_CREATE
+_RETRIEVE = SemanticConventions.GEN_AI_OPERATION_TYPE_BATCH_RETRIEVE
+_RESULTS = SemanticConventions.GEN_AI_OPERATION_TYPE_BATCH_RESULTS
+
+_OPENAI_CREATE = _Operation(
+    _OPENAI, _CREATE, "api.openai.com", _no_batch_id, _record_openai_create, _record_openai_created,
+)
+_OPENAI_RETRIEVE = _Operation(
+    _OPENAI, _RETRIEVE, "api.openai.com", _argument("batch_id"), _keep_kwargs, _record_openai_retrieved,
+)
+_OPENAI_FILE_CONTENT = _Operation(
+    _OPENAI, _RESULTS, "api.openai.com", _openai_result_file, _keep_kwargs, _record_openai_file,
+)
+_ANTHROPIC_CREATE = _Operation(
+    _ANTHROPIC, _CREATE, "api.anthropic.com", _no_batch_id, _record_anthropic_create, _record_anthropic_created,
+)
+_ANTHROPIC_RETRIEVE = _Operation(
+    _ANTHROPIC, _RETRIEVE, "api.anthropic.com", _argument("message_batch_id"), _keep_kwargs,
+    _record_anthropic_batch,
+)
+_ANTHROPIC_RESULTS = _Operation(
+    _ANTHROPIC, _RESULTS, "api.anthropic.com", _argument("message_batch_id"), _keep_kwargs,
+    _record_anthropic_results,
+)
+
+
+def _begin(tracer, operation, instance, args, kwargs):
+    """
+    Start the span for one call; returns (None, kwargs) when the call is not
+    traced, and an unenriched span when it will only be exported on failure.
+    """
+    if not is_instrumentation_enabled():
+        return None, kwargs
+    batch_id = operation.batch_id(args, kwargs)
+    if batch_id is _PASS:
+        return None, kwargs
+    attributes = {
+        SemanticConventions.GEN_AI_SYSTEM: operation.system,
+        SemanticConventions.GEN_AI_OPERATION_TYPE: operation.name,
+    }
+    links = None
+    if batch_id:
+        attributes[SemanticConventions.GEN_AI_BATCH_ID] = batch_id
+        submitted = _lookup(_SUBMITTED, batch_id)
+        if submitted is not None:
+            links = [Link(submitted)]
+    span = tracer.start_span(operation.name, kind=SpanKind.CLIENT, attributes=attributes, links=links)
+    if not is_sampled(span):
+        return span, kwargs
+    server_address, server_port = set_server_address_and_port(instance, operation.default_address, 443)
+    span.set_attribute(SemanticConventions.SERVER_ADDRESS, server_address)
+    span.set_attribute(SemanticConventions.SERVER_PORT, server_port)
+    try:
+        kwargs = operation.record_request(span, kwargs)
+    except Exception as e:
+        handle_exception(span, e)
+    return span, kwargs
+
+
+def _complete(span, operation, response, kwargs, start_time, is_async):
+    """Record the response; end the span unless a result proxy took it over."""
+    try:
+        proxy = operation.record_response(span, response, kwargs, start_time, is_async)
+    except Exception as e:
+        handle_exception(span, e)
+        proxy = None
+    if proxy is not None:
+        return proxy
+    span.set_attribute(SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, time.time() - start_time)
+    span.set_status(trace.Status(trace.StatusCode.OK))
+    span.end()
+    return response
+
+
+def _create_wrapper(config, operation):
+    tracer = config.get("tracer")
+
+    def wrapper(wrapped, instance, args, kwargs):
+        span, kwargs = _begin(tracer, operation, instance, args, kwargs)
+        if span is None:
+            return wrapped(*args, **kwargs)
+        if not is_sampled(span):
+            return call_unsampled(span, wrapped, args, kwargs)
+        start_time = time.time()
+        try:
+            response = wrapped(*args, **kwargs)
+        except Exception as e:
+            handle_exception(span, e)
+            span.end()
+            raise
+        return _complete(span, operation, response, kwargs, start_time, is_async=False)
+
+    return wrapper
+
+
+def _create_async_wrapper(config, operation):
+    tracer = config.get("tracer")
+
+    async def async_wrapper(wrapped, instance, args, kwargs):
+        span, kwargs = _begin(tracer, operation, instance, args, kwargs)
+        if span is None:
+            return await wrapped(*args, **kwargs)
+        if not is_sampled(span):
+            return await async_call_unsampled(span, wrapped, args, kwargs)
+        start_time = time.time()
+        try:
+            response = await wrapped(*args, **kwargs)
+        except Exception as e:
+            handle_exception(span, e)
+            span.end()
+            raise
+        return _complete(span, operation, response, kwargs, start_time, is_async=True)
+
+    return async_wrapper
+
+
+# ---------------------------------------------------------------------------
+# Public wrapper factories
+# ---------------------------------------------------------------------------
+
+def openai_batch_create(config):
+    return _create_wrapper(config, _OPENAI_CREATE)
+
+
+def openai_batch_retrieve(config):
+    return _create_wrapper(config, _OPENAI_RETRIEVE)
+
+
+def openai_file_content(config):
+    return _create_wrapper(config, _OPENAI_FILE_CONTENT)
+
+
+def anthropic_batch_create(config):
+    return _create_wrapper(config, _ANTHROPIC_CREATE)
+
+
+def anthropic_batch_retrieve(config):
+    return _create_wrapper(config, _ANTHROPIC_RETRIEVE)
+
+
+def anthropic_batch_results(config):
+    return _create_wrapper(config, _ANTHROPIC_RESULTS)
+
+
+# Async variants
+def async_openai_batch_create(config):
+    return _create_async_wrapper(config, _OPENAI_CREATE)
+
+
+def async_openai_batch_retrieve(config):
+    return _create_async_wrapper(config, _OPENAI_RETRIEVE)
+
+
+def async_openai_file_content(config):
+    return _create_async_wrapper(config, _OPENAI_FILE_CONTENT)
+
+
+def async_anthropic_batch_create(config):
+    return _create_async_wrapper(config, _ANTHROPIC_CREATE)
+
+
+def async_anthropic_batch_retrieve(config):
+    return _create_async_wrapper(config, _ANTHROPIC_RETRIEVE)
+
+
+def async_anthropic_batch_results(config):
+    return _create_async_wrapper(config, _ANTHROPIC_RESULTS)
@@ -0,0 +1,111 @@
+"""
+Provider-agnostic instrumentation at the httpx transport layer.
+
+Instead of wrapping SDK methods, this installs WardTransport on the httpx
+client of every OpenAI and Anthropic client constructed after instrument(),
+including clients pointed at OpenAI-compatible servers through
+``base_url``. Use it instead of the "openai"/"anthropic" instrumentations,
+not alongside them (requests made inside an SDK-level wrapper are left to
+the wrapper).
+"""
+
+import importlib
+from typing import Collection, Optional, Any
+from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
+from opentelemetry import trace
+from opentelemetry.instrumentation.utils import unwrap
+from wrapt import wrap_function_wrapper
+
+from ward.instrumentation.http.sse import SSEParser
+from ward.instrumentation.http.transport import AsyncWardTransport, WardTransport
+
+__all__ = ["AsyncWardTransport", "SSEParser", "WardTransport", "httpInstrumentor", "instrument_client"]
+
+
+def instrument_client(client, config=None):
+    """
+    Install WardTransport on an existing SDK client (or raw httpx client).
+
+    Proxy transports mounted on the httpx client are wrapped too. Clients
+    that already have it are left alone. Returns ``client``.
+    """
+    http_client = getattr(client, "_client", client)
+    transport = getattr(http_client, "_transport", None)
+    if transport is None or isinstance(transport, (WardTransport, AsyncWardTransport)):
+        return client
+    wrapper = AsyncWardTransport if hasattr(transport, "handle_async_request") else WardTransport
+    http_client._transport = wrapper(transport, config)
+    mounts = getattr(http_client, "_mounts", None)
+    if mounts:
+        http_client._mounts = {
+            pattern: mounted if mounted is None else wrapper(mounted, config)
+            for pattern, mounted in mounts.items()
+        }
+    return client
+
+
+class httpInstrumentor(BaseInstrumentor):
+    """Instrumentor that installs WardTransport on OpenAI and Anthropic clients."""
+
+    def __init__(
+        self,
+        tracer: Optional[trace.Tracer] = None,
+        pricing_info: Optional[dict] = None,
+        environment: Optional[str] = None,
+        application_name: Optional[str] = None,
+        metrics: Optional[Any] = None,
+        capture_message_content: bool = True,
+        disable_metrics: bool = False,
+        version: str = "unknown",
+    ):
+        super().__init__()
+        self._tracer = tracer or trace.get_tracer(__name__)
+        self._config = {
+            "tracer": self._tracer,
+            "pricing_info": pricing_info or {},
+            "environment": environment,
+            "application_name": application_name,
+            "metrics": metrics,
+            "capture_message_content": capture_message_content,
+            "disable_metrics": disable_metrics,
+            "version": version,
+        }
+        # BaseInstrumentor is a singleton, so __init__ re-runs on every
+        # construction — keep the record of what is currently wrapped.
+        self._wrapped = getattr(self, "_wrapped", [])
+
+    def instrument(self, **kwargs):
+        """Patch the SDK client constructors (no-op if already done)."""
+        if self._is_instrumented_by_opentelemetry:
+            return
+        for package in ("openai", "anthropic"):
+            try:
+                base_client = importlib.import_module(f"{package}._base_client")
+            except ImportError:
+                continue
+            for name in ("SyncAPIClient", "AsyncAPIClient"):
+                owner = getattr(base_client, name, None)
+                if owner is not None:
+                    self._wrap(owner, "__init__", self._after_init)
+        self._is_instrumented_by_opentelemetry = True
+
+    def _after_init(self, wrapped, instance, args, kwargs):
+        result = wrapped(*args, **kwargs)
+        try:
+            instrument_client(instance, self._config)
+        except Exception as e:
+            print(f"Warning: Failed to install Ward transport: {e}")
+        return result
+
+    def instrumentation_dependencies(self) -> Collection[str]:
+        return []
+
+    def _wrap(self, owner, name, wrapper):
+        wrap_function_wrapper(owner, name, wrapper)
+        self._wrapped.append((owner, name))
+
+    def _uninstrument(self, **kwargs):
+        """Restore the client constructors; transports already installed pass calls through while disabled."""
+        while self._wrapped:
+            owner, name = self._wrapped.pop()
+            unwrap(owner, name)
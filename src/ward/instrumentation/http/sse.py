@@ -0,0 +1,62 @@
+"""
+Incremental Server-Sent Events parser over raw response bytes.
+
+Feeds on the byte chunks of a ``text/event-stream`` body as the client reads
+them and returns the ``data`` payload of every event the chunk completes,
+still as bytes. Events may be split across chunks at any byte; lines end
+with LF or CRLF. Only ``data`` fields matter here: OpenAI sends untyped
+events (``data: {...}``) ending with ``data: [DONE]``, and Anthropic repeats
+the event name as ``"type"`` inside each payload, so ``event``, ``id`` and
+``retry`` fields and comments are skipped.
+"""
+
+
+class SSEParser:
+    """Split an event-stream byte stream into event data payloads."""
+
+    __slots__ = ("_partial", "_data")
+
+    def __init__(self):
+        self._partial = []  # bytes of a line not yet terminated
+        self._data = []  # data lines of the event being read
+
+    def feed(self, chunk: bytes) -> list:
+        """Return the data payloads of the events ``chunk`` completes."""
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            if chunk:
+                self._partial.append(chunk)
+            return []
+        if self._partial:
+            self._partial.append(chunk[:end])
+            text = b"".join(self._partial)
+            self._partial = []
+        else:
+            text = chunk[:end]
+        if end + 1 < len(chunk):
+            self._partial.append(chunk[end + 1:])
+
+        payloads = []
+        data = self._data
+        for line in text.split(b"\n"):
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if not line:
+                if data:
+                    payloads.append(data[0] if len(data) == 1 else b"\n".join(data))
+                    data = self._data = []
+            elif line.startswith(b"data:"):
+                data.append(line[6:] if line[5:6] == b" " else line[5:])
+        return payloads
+
+    def flush(self) -> list:
+        """Payload of a final event the stream ended without terminating, if any."""
+        if self._partial:
+            line = b"".join(self._partial).rstrip(b"\r")
+            self._partial = []
+            if line.startswith(b"data:"):
+                self._data.append(line[6:] if line[5:6] == b" " else line[5:])
+        data, self._data = self._data, []
+        if not data:
+            return []
+        return [b"\n".join(data)]
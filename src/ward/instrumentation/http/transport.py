@@ -0,0 +1,572 @@
+"""
+httpx transports that instrument LLM calls from the bytes on the wire.
+
+WardTransport (and AsyncWardTransport) wrap the transport of an httpx client
+used by an OpenAI- or Anthropic-compatible SDK. For chat requests they
+parse the request JSON, start the span, and replace the response byte
+stream with one that observes the body as the client reads it: JSON bodies
+are parsed once at the end, and ``text/event-stream`` bodies go through
+SSEParser as they arrive, one ``json`` decode per event. No SDK response
+models are built. Everything after parsing is shared with the SDK-level
+wrappers (request attributes, response processors, stream accumulators),
+so spans look the same in both modes.
+
+Recognised requests:
+
+  - ``POST .../chat/completions``: OpenAI chat and every OpenAI-compatible
+    server (Azure OpenAI, vLLM, LiteLLM and other proxies)
+  - ``POST .../responses``: the OpenAI Responses API
+  - ``POST .../messages`` carrying an ``anthropic-version`` header: Anthropic
+
+Anything else passes through untouched. Each HTTP attempt is its own span,
+so SDK retries show up as separate spans with their status codes. gzip and
+deflate bodies are decompressed here, once, and handed to the client
+already decoded (``Content-Encoding`` removed), so the client does not
+inflate them a second time. Bodies compressed any other way are not
+parsed; the span still gets status, headers and timings. Requests made
+inside an SDK-level wrapper (both modes enabled) are left to the wrapper.
+
+Use directly with any httpx client:
+
+    client = OpenAI(http_client=httpx.Client(transport=WardTransport(httpx.HTTPTransport())))
+
+or let ``ward.init(instrumentations=["http"])`` install it on every client.
+"""
+
+import asyncio
+import logging
+import re
+import sys
+import time
+import weakref
+import zlib
+
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from ward.conventions import SemanticConventions
+from ward.instrumentation.anthropic import anthropic as anthropic_calls
+from ward.instrumentation.http.sse import SSEParser
+from ward.instrumentation.openai import openai as openai_calls
+from ward.instrumentation.openai.utils import (
+    handle_exception,
+    is_instrumentation_enabled,
+    is_sampled,
+    json_loads,
+)
+from ward.instrumentation.transport import HttpCallRecorder, http_recording_active
+from ward.policy import get_policy
+
+logger = logging.getLogger(__name__)
+
+# Finds the model without parsing the body, for the sampling decision. Escaped
+# quotes inside message strings can't match: "model" must be a bare key.
+_MODEL_FIELD = re.compile(rb'"model"\s*:\s*"([^"\\]*)"')
+
+# Stream events after which the SDKs stop reading (OpenAI chat ends with [DONE] instead)
+_STREAM_END_EVENTS = frozenset(("message_stop",)) | openai_calls._RESPONSES_TERMINAL_EVENTS
+
+
+class _Endpoint:
+    """How to instrument one kind of LLM request."""
+
+    __slots__ = ("system", "set_request_attributes", "process_response", "stream_accumulator", "event_method")
+
+    def __init__(self, system, set_request_attributes, process_response, stream_accumulator, event_method):
+        self.system = system
+        self.set_request_attributes = set_request_attributes
+        self.process_response = process_response
+        self.stream_accumulator = stream_accumulator
+        self.event_method = event_method
+
+
+def _openai_processor(process_response):
+    def process(exchange, response):
+        config = exchange.config
+        process_response(
+            response=response,
+            request_model=exchange.model,
+            pricing_info=config.get("pricing_info"),
+            server_port=exchange.server_port,
+            server_address=exchange.server_address,
+            environment=config.get("environment"),
+            application_name=config.get("application_name"),
+            metrics=config.get("metrics"),
+            start_time=exchange.start_time,
+            span=exchange.span,
+            capture_message_content=exchange.capture_content,
+            disable_metrics=config.get("disable_metrics", False),
+            version=config.get("version", "unknown"),
+            policy=exchange.policy,
+        )
+    return process
+
+
+def _process_anthropic_message(exchange, response):
+    anthropic_calls._process_message_response(
+        response, exchange.span, exchange.start_time, exchange.model,
+        exchange.config.get("pricing_info"), exchange.capture_content, exchange.policy,
+    )
+
+
+_OPENAI_CHAT = _Endpoint(
+    SemanticConventions.GEN_AI_SYSTEM_OPENAI,
+    openai_calls._set_request_attributes,
+    _openai_processor(openai_calls.process_chat_response),
+    openai_calls.StreamWrapper,
+    "_process_chunk",
+)
+_OPENAI_RESPONSES = _Endpoint(
+    SemanticConventions.GEN_AI_SYSTEM_OPENAI,
+    openai_calls._set_responses_request_attributes,
+    _openai_processor(openai_calls.process_responses_response),
+    openai_calls.ResponsesStreamWrapper,
+    "_process_event",
+)
+_ANTHROPIC_MESSAGES = _Endpoint(
+    SemanticConventions.GEN_AI_SYSTEM_ANTHROPIC,
+    anthropic_calls._set_request_attributes,
+    _process_anthropic_message,
+    anthropic_calls.AnthropicStreamWrapper,
+    "_process_event",
+)
+
+
+def _endpoint_for(request):
+    if request.method != "POST":
+        return None
+    path = request.url.path.rstrip("/")
+    if path.endswith("/chat/completions"):
+        return _OPENAI_CHAT
+    if path.endswith("/responses"):
+        return _OPENAI_RESPONSES
+    if path.endswith("/messages") and "anthropic-version" in request.headers:
+        return _ANTHROPIC_MESSAGES
+    return None
+
+
+class _BodyDecoder:
+    """Incremental gzip/deflate decompression, raising the client's DecodingError like httpx does."""
+
+    def __init__(self, encoding, decoding_error):
+        self._deflate = encoding == "deflate"
+        self._decompressor = zlib.decompressobj(zlib.MAX_WBITS if self._deflate else zlib.MAX_WBITS | 16)
+        self._first = True
+        self._decoding_error = decoding_error
+
+    def decompress(self, chunk):
+        first, self._first = self._first, False
+        try:
+            return self._decompressor.decompress(chunk)
+        except zlib.error as e:
+            if first and self._deflate:
+                # Some servers send raw deflate data without the zlib header
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                return self.decompress(chunk)
+            raise self._decoding_error(str(e)) from e
+
+    def flush(self):
+        try:
+            return self._decompressor.flush()
+        except zlib.error as e:
+            raise self._decoding_error(str(e)) from e
+
+
+def _body_decoder(response):
+    """Decoder for ``response``'s body; None for identity, False if unsupported."""
+    encoding = response.headers.get("content-encoding")
+    if not encoding or encoding == "identity":
+        return None
+    if encoding in ("gzip", "deflate"):
+        package = sys.modules[type(response).__module__.partition(".")[0]]
+        return _BodyDecoder(encoding, package.DecodingError)
+    return False
+
+
+class _Exchange:
+    """One instrumented HTTP request and the span that records it."""
+
+    def __init__(self, config, endpoint, request, span, policy, model, body, is_async):
+        self.config = config
+        self.endpoint = endpoint
+        self.span = span
+        self.policy = policy
+        self.model = model
+        self.capture_content = policy.capture_content(config.get("capture_message_content", True), span)
+        url = request.url
+        self.server_address = url.host
+        self.server_port = url.port or (443 if url.scheme == "https" else 80)
+        self.max_tokens = (
+            body.get("max_completion_tokens") or body.get("max_tokens") or body.get("max_output_tokens")
+        )
+        self.recorder = HttpCallRecorder()
+        attempt = self.recorder.start_attempt(request)
+        request.extensions.setdefault("trace", attempt.on_trace_async if is_async else attempt.on_trace)
+
+        span.set_attribute(SemanticConventions.SERVER_ADDRESS, self.server_address)
+        span.set_attribute(SemanticConventions.SERVER_PORT, self.server_port)
+        span.set_attribute(SemanticConventions.GEN_AI_ENDPOINT, f"{self.server_address}:{self.server_port}")
+        endpoint.set_request_attributes(span, body, self.capture_content, policy)
+
+        self.accumulator = None
+        self.parser = None
+        self.parts = None
+        self.decoder = None
+        self.reaper = None
+        self.stream_done = False
+        self.finished = False
+        self.start_time = time.time()
+
+    def observe(self, response, is_async):
+        """Hand ``response`` back with its byte stream observed, or end the span if the body is of no use."""
+        self.recorder.finish_attempt(response)
+        status = response.status_code
+        if status >= 400:
+            self.span.set_attribute(SemanticConventions.ERROR_TYPE, str(status))
+            self.span.set_status(Status(StatusCode.ERROR, f"HTTP {status}"))
+            self._end()
+            return response
+        stream = None
+        if getattr(response, "_content", None) is None:
+            decoder = _body_decoder(response)
+            if decoder is False:
+                logger.debug("Ward: not parsing %s response body", response.headers.get("content-encoding"))
+                self._end()
+                return response
+            if decoder is not None:
+                # The stream hands the client decoded bytes; it must not decode them again
+                del response.headers["content-encoding"]
+                response.headers.pop("content-length", None)
+            self.decoder = decoder
+            stream = _observed_stream_class(response, is_async)(response.stream, self)
+        if "text/event-stream" in response.headers.get("content-type", ""):
+            self.parser = SSEParser()
+            # Ends the span itself, marked abandoned, if the stream is dropped unread
+            self.accumulator = self.endpoint.stream_accumulator(
+                None, self.span, self.start_time, self.model, self.capture_content, self.policy,
+                max_tokens=self.max_tokens,
+            )
+        else:
+            self.parts = []
+            if stream is not None:
+                self.reaper = weakref.finalize(stream, self.span.end)
+        if stream is None:
+            # Body already read and decoded (e.g. by a mock transport); its stream won't be iterated
+            self.on_chunk(response.content)
+            self.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+        else:
+            response.stream = stream
+        return response
+
+    def on_chunk(self, chunk):
+        """Observe the next piece of the body; returns it decoded, for the client."""
+        if self.decoder is not None:
+            chunk = self.decoder.decompress(chunk)
+        self._observe(chunk)
+        return chunk
+
+    def on_body_end(self):
+        """The body was read to the end; returns what the decoder still held."""
+        if self.decoder is None:
+            return b""
+        tail = self.decoder.flush()
+        self._observe(tail)
+        return tail
+
+    def _observe(self, chunk):
+        if self.finished or (self.parser is None and self.parts is None):
+            return
+        try:
+            if self.parser is not None:
+                for payload in self.parser.feed(chunk):
+                    self._on_event(payload)
+            else:
+                self.parts.append(chunk)
+        except Exception:
+            # Never break the caller's read: stop observing this body instead
+            logger.debug("Ward: could not parse response body", exc_info=True)
+            self.parser = self.parts = None
+
+    def _on_event(self, payload):
+        if payload == b"[DONE]":
+            self.stream_done = True
+            return
+        try:
+            event = json_loads(payload)
+        except ValueError:
+            return
+        if isinstance(event, dict):
+            getattr(self.accumulator, self.endpoint.event_method)(event)
+            if event.get("type") in _STREAM_END_EVENTS:
+                self.stream_done = True
+
+    def close(self):
+        """
+        The client closed the body. SDKs stop reading at the end-of-stream
+        event and close without draining, so that counts as completed.
+        """
+        if self.stream_done:
+            self.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+        else:
+            self.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+    def fail(self, error):
+        """
+        The request failed, or reading the body did. SDKs drain what is left
+        of a stream after its end event and ignore errors doing so; so does this.
+        """
+        if self.stream_done:
+            self.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+        else:
+            self.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR, error)
+
+    def finish(self, outcome, error=None):
+        """Record everything observed and end the span; no-op once finished."""
+        if self.finished:
+            return
+        self.finished = True
+        span = self.span
+        if self.accumulator is not None:
+            self.recorder.set_span_attributes(span)
+            if error is not None:
+                handle_exception(span, error)
+                self.accumulator._end_span(outcome)
+                return
+            if self.parser is not None:
+                for payload in self.parser.flush():
+                    self._on_event(payload)
+            self.accumulator._finalize(outcome)
+            return
+        if error is not None:
+            handle_exception(span, error)
+        elif outcome == SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED and self.parts is not None:
+            try:
+                self.endpoint.process_response(self, json_loads(b"".join(self.parts)))
+            except Exception as e:
+                handle_exception(span, e)
+        self.parts = None
+        self._end()
+
+    def _end(self):
+        self.finished = True
+        self.recorder.set_span_attributes(self.span)
+        if self.reaper is None or self.reaper.detach():
+            self.span.end()
+
+
+class _UnsampledExchange:
+    """
+    A request whose span will not be exported unless it fails (kept
+    RECORD_ONLY over a rate cap): the response is handed back untouched and
+    only an error status or exception is recorded, so
+    ErrorAdmittingSpanProcessor can still export the span.
+    """
+
+    __slots__ = ("span",)
+
+    def __init__(self, span):
+        self.span = span
+
+    def observe(self, response, is_async):
+        status = response.status_code
+        if status >= 400:
+            self.span.set_attribute(SemanticConventions.ERROR_TYPE, str(status))
+            self.span.set_status(Status(StatusCode.ERROR, f"HTTP {status}"))
+        self.span.end()
+        return response
+
+    def fail(self, error):
+        self.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR, error)
+
+    def finish(self, outcome, error=None):
+        if error is not None:
+            handle_exception(self.span, error)
+        self.span.end()
+
+
+def _start_exchange(config, request, is_async):
+    """Start a span for ``request`` if it is an LLM call to record, else return None."""
+    if not is_instrumentation_enabled() or http_recording_active():
+        return None
+    endpoint = _endpoint_for(request)
+    if endpoint is None:
+        return None
+    try:
+        content = request.content
+    except Exception:  # streamed request body; never the case for SDK calls
+        return None
+
+    match = _MODEL_FIELD.search(content)
+    model = match.group(1).decode() if match else "unknown"
+    operation = SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT
+    policy = get_policy().for_model(model, operation)
+    if not policy.sampled():
+        return None
+    span = config["tracer"].start_span(
+        f"{operation} {model}",
+        kind=SpanKind.CLIENT,
+        attributes={
+            SemanticConventions.GEN_AI_SYSTEM: endpoint.system,
+            SemanticConventions.GEN_AI_OPERATION_TYPE: operation,
+            SemanticConventions.GEN_AI_REQUEST_MODEL: model,
+        },
+    )
+    if not span.is_recording():
+        span.end()
+        return None
+    if not is_sampled(span):
+        return _UnsampledExchange(span)
+    try:
+        body = json_loads(content)
+    except ValueError:
+        body = None
+    return _Exchange(config, endpoint, request, span, policy, model, body if isinstance(body, dict) else {}, is_async)
+
+
+def _default_config(config):
+    config = dict(config or {})
+    config.setdefault("tracer", trace.get_tracer(__name__))
+    config.setdefault("pricing_info", {})
+    return config
+
+
+class WardTransport:
+    """
+    Wrap an httpx transport and record a span for every LLM request it sends.
+
+    ``config`` is an instrumentor config dict (tracer, pricing_info,
+    capture_message_content, ...); the global tracer is used by default.
+    """
+
+    def __init__(self, transport, config=None):
+        self._transport = transport
+        self._config = _default_config(config)
+
+    def handle_request(self, request):
+        exchange = _start_exchange(self._config, request, is_async=False)
+        if exchange is None:
+            return self._transport.handle_request(request)
+        try:
+            response = self._transport.handle_request(request)
+        except Exception as e:
+            exchange.fail(e)
+            raise
+        return exchange.observe(response, is_async=False)
+
+    def close(self):
+        self._transport.close()
+
+    def __enter__(self):
+        self._transport.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        self._transport.__exit__(*args)
+
+
+class AsyncWardTransport:
+    """Async equivalent of WardTransport for httpx AsyncClient transports."""
+
+    def __init__(self, transport, config=None):
+        self._transport = transport
+        self._config = _default_config(config)
+
+    async def handle_async_request(self, request):
+        exchange = _start_exchange(self._config, request, is_async=True)
+        if exchange is None:
+            return await self._transport.handle_async_request(request)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except asyncio.CancelledError as e:
+            exchange.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED, e)
+            raise
+        except Exception as e:
+            exchange.fail(e)
+            raise
+        return exchange.observe(response, is_async=True)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+    async def __aenter__(self):
+        await self._transport.__aenter__()
+        return self
+
+    async def __aexit__(self, *args):
+        await self._transport.__aexit__(*args)
+
+
+class _ObservedStream:
+    """Response byte stream that shows each chunk to the exchange as the client reads it."""
+
+    def __init__(self, stream, exchange):
+        self._stream = stream
+        self._exchange = exchange
+
+    def __iter__(self):
+        exchange = self._exchange
+        try:
+            for chunk in self._stream:
+                chunk = exchange.on_chunk(chunk)
+                if chunk:
+                    yield chunk
+            tail = exchange.on_body_end()
+            if tail:
+                yield tail
+        except Exception as e:
+            exchange.fail(e)
+            raise
+        exchange.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+
+    def close(self):
+        self._stream.close()
+        self._exchange.close()
+
+
+class _AsyncObservedStream:
+    """Async equivalent of _ObservedStream."""
+
+    def __init__(self, stream, exchange):
+        self._stream = stream
+        self._exchange = exchange
+
+    async def __aiter__(self):
+        exchange = self._exchange
+        try:
+            async for chunk in self._stream:
+                chunk = exchange.on_chunk(chunk)
+                if chunk:
+                    yield chunk
+            tail = exchange.on_body_end()
+            if tail:
+                yield tail
+        except asyncio.CancelledError:
+            exchange.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED)
+            raise
+        except Exception as e:
+            exchange.fail(e)
+            raise
+        exchange.finish(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+
+    async def aclose(self):
+        await self._stream.aclose()
+        self._exchange.close()
+
+
+# (httpx package name, is_async) -> observed stream class. httpx checks
+# response streams with isinstance, and SDKs may use httpx or a fork of it
+# (httpx2), so the base class comes from the package the response is from.
+_STREAM_CLASSES = {}
+
+
+def _observed_stream_class(response, is_async):
+    package = type(response).__module__.partition(".")[0]
+    cls = _STREAM_CLASSES.get((package, is_async))
+    if cls is None:
+        module = sys.modules[package]
+        if is_async:
+            cls = type("AsyncObservedStream", (_AsyncObservedStream, module.AsyncByteStream), {})
+        else:
+            cls = type("ObservedStream", (_ObservedStream, module.SyncByteStream), {})
+        _STREAM_CLASSES[(package, is_async)] = cls
+    return cls
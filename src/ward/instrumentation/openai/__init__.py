@@ -5,6 +5,7 @@ Auto-instrumentation for OpenAI (sync + async).
 from typing import Collection, Optional, Any
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry import trace
+from opentelemetry.instrumentation.utils import unwrap
 from wrapt import wrap_function_wrapper
 
 from ward.instrumentation.openai.openai import (
@@ -16,10 +17,19 @@ from ward.instrumentation.openai.openai import (
     image_variatons,
     audio_create,
     async_chat_completions,
+    async_responses,
     async_embedding,
     async_image_generate,
     async_audio_create,
 )
+from ward.instrumentation.batch import (
+    openai_batch_create,
+    openai_batch_retrieve,
+    openai_file_content,
+    async_openai_batch_create,
+    async_openai_batch_retrieve,
+    async_openai_file_content,
+)
 
 
 class openaiInstrumentor(BaseInstrumentor):
@@ -48,11 +58,17 @@ class openaiInstrumentor(BaseInstrumentor):
             "disable_metrics": disable_metrics,
             "version": version,
         }
+        # BaseInstrumentor is a singleton, so __init__ re-runs on every
+        # construction — keep the record of what is currently wrapped.
+        self._wrapped = getattr(self, "_wrapped", [])
 
     def instrument(self, **kwargs):
-        """Instrument both sync and async OpenAI client methods."""
+        """Instrument both sync and async OpenAI client methods (no-op if already done)."""
+        if self._is_instrumented_by_opentelemetry:
+            return
         self._instrument_sync()
         self._instrument_async()
+        self._is_instrumented_by_opentelemetry = True
 
     def _instrument_sync(self):
         try:
@@ -62,17 +78,19 @@ class openaiInstrumentor(BaseInstrumentor):
             from openai.resources.audio.speech import Speech
 
             if hasattr(Completions, "create"):
-                wrap_function_wrapper(Completions, "create", chat_completions(self._config))
+                self._wrap(Completions, "create", chat_completions(self._config))
             if hasattr(Completions, "create_parse"):
-                wrap_function_wrapper(Completions, "create_parse", chat_completions_parse(self._config))
+                self._wrap(Completions, "create_parse", chat_completions_parse(self._config))
             if hasattr(Embeddings, "create"):
-                wrap_function_wrapper(Embeddings, "create", embedding(self._config))
+                self._wrap(Embeddings, "create", embedding(self._config))
             if hasattr(Images, "create"):
-                wrap_function_wrapper(Images, "create", image_generate(self._config))
+                self._wrap(Images, "create", image_generate(self._config))
             if hasattr(Images, "create_variation"):
-                wrap_function_wrapper(Images, "create_variation", image_variatons(self._config))
+                self._wrap(Images, "create_variation", image_variatons(self._config))
             if hasattr(Speech, "create"):
-                wrap_function_wrapper(Speech, "create", audio_create(self._config))
+                self._wrap(Speech, "create", audio_create(self._config))
+            self._instrument_responses()
+            self._instrument_batches()
 
         except ImportError as e:
             print(f"Warning: OpenAI not installed or incompatible version: {e}")
@@ -89,21 +107,62 @@ class openaiInstrumentor(BaseInstrumentor):
             from openai.resources.audio.speech import AsyncSpeech
 
             if hasattr(AsyncCompletions, "create"):
-                wrap_function_wrapper(AsyncCompletions, "create", async_chat_completions(self._config))
+                self._wrap(AsyncCompletions, "create", async_chat_completions(self._config))
             if hasattr(AsyncEmbeddings, "create"):
-                wrap_function_wrapper(AsyncEmbeddings, "create", async_embedding(self._config))
+                self._wrap(AsyncEmbeddings, "create", async_embedding(self._config))
             if hasattr(AsyncImages, "create"):
-                wrap_function_wrapper(AsyncImages, "create", async_image_generate(self._config))
+                self._wrap(AsyncImages, "create", async_image_generate(self._config))
             if hasattr(AsyncSpeech, "create"):
-                wrap_function_wrapper(AsyncSpeech, "create", async_audio_create(self._config))
+                self._wrap(AsyncSpeech, "create", async_audio_create(self._config))
+            self._instrument_responses(is_async=True)
+            self._instrument_batches(is_async=True)
 
         except ImportError:
             pass
         except Exception as e:
             print(f"Warning: Failed to instrument openai (async): {e}")
 
+    def _instrument_responses(self, is_async=False):
+        # The Responses API only exists in openai>=1.66
+        try:
+            from openai.resources.responses import AsyncResponses, Responses
+        except ImportError:
+            return
+        if is_async:
+            if hasattr(AsyncResponses, "create"):
+                self._wrap(AsyncResponses, "create", async_responses(self._config))
+        elif hasattr(Responses, "create"):
+            self._wrap(Responses, "create", responses(self._config))
+
+    def _instrument_batches(self, is_async=False):
+        # The Batch API only exists in openai>=1.18
+        try:
+            from openai.resources.batches import AsyncBatches, Batches
+            from openai.resources.files import AsyncFiles, Files
+        except ImportError:
+            return
+        if is_async:
+            batches, files = AsyncBatches, AsyncFiles
+            create, retrieve, content = async_openai_batch_create, async_openai_batch_retrieve, async_openai_file_content
+        else:
+            batches, files = Batches, Files
+            create, retrieve, content = openai_batch_create, openai_batch_retrieve, openai_file_content
+        if hasattr(batches, "create"):
+            self._wrap(batches, "create", create(self._config))
+        if hasattr(batches, "retrieve"):
+            self._wrap(batches, "retrieve", retrieve(self._config))
+        if hasattr(files, "content"):
+            self._wrap(files, "content", content(self._config))
+
     def instrumentation_dependencies(self) -> Collection[str]:
         return ["openai >= 1.0.0"]
 
+    def _wrap(self, owner, name, wrapper):
+        wrap_function_wrapper(owner, name, wrapper)
+        self._wrapped.append((owner, name))
+
     def _uninstrument(self, **kwargs):
-        pass
+        """Restore every method patched by instrument()."""
+        while self._wrapped:
+            owner, name = self._wrapped.pop()
+            unwrap(owner, name)
@@ -9,19 +9,159 @@ Streaming design:
     span must stay open until the caller finishes consuming the iterator — well after
     the wrapper function returns. Instead we call `tracer.start_span()` and pass
     ownership to StreamWrapper/AsyncStreamWrapper, which call `span.end()` on
-    exhaustion, error, or garbage collection.
+    exhaustion or error. Abandoned streams are reaped by a weakref finalizer
+    (see utils.reap_span) rather than `__del__`.
+
+    Speech requests made through `with_streaming_response` return a binary
+    response whose body has not been read yet. SpeechStreamWrapper and
+    AsyncSpeechStreamWrapper proxy it, timing bytes as the caller reads them.
 """
 
+import asyncio
 import time
 from typing import Callable, Dict, Any
+import wrapt
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 from ward.conventions import SemanticConventions
 from ward.instrumentation.openai.utils import (
     set_server_address_and_port,
+    get_field,
+    StreamProgress,
+    end_stream_span,
     handle_exception,
+    is_instrumentation_enabled,
+    is_sampled,
+    call_unsampled,
+    async_call_unsampled,
+    reap_span,
+    message_to_dict,
+    redact_content,
     response_to_dict,
+    set_content_attribute,
+    set_content_list_attribute,
+    set_conversation_attribute,
+    use_json_content,
 )
+from ward.instrumentation.transport import start_http_recording, stop_http_recording
+from ward.otel.enrichment import defer_enrichment, enrichment_enabled
+from ward.policy import get_policy
+
+
+class _ToolCallAccumulator:
+    """One streamed tool call. Argument fragments are joined once, at the end."""
+
+    __slots__ = ("id", "name", "argument_parts")
+
+    def __init__(self):
+        self.id = None
+        self.name = None
+        self.argument_parts = []
+
+
+class _ChoiceAccumulator:
+    """Content, finish reason and tool calls for one streamed choice."""
+
+    __slots__ = ("content_parts", "finish_reason", "tool_calls")
+
+    def __init__(self):
+        self.content_parts = []
+        self.finish_reason = None
+        self.tool_calls = {}
+
+
+def _accumulate_choices(choices, chunk_choices, progress=None):
+    """
+    Fold one chunk's choice deltas into ``choices`` (index -> _ChoiceAccumulator).
+
+    Choices and tool calls are keyed by the index the API sends with every
+    delta, so interleaved ``n>1`` streams and parallel tool calls stay apart.
+    Fragments are appended to lists rather than concatenated, keeping long
+    tool-argument streams linear. Delivered text is counted on ``progress``.
+    """
+    for choice in chunk_choices or ():
+        if not isinstance(choice, dict):
+            continue
+        index = choice.get("index") or 0
+        accumulator = choices.get(index)
+        if accumulator is None:
+            accumulator = choices[index] = _ChoiceAccumulator()
+        if choice.get("finish_reason"):
+            accumulator.finish_reason = str(choice["finish_reason"])
+        delta = choice.get("delta")
+        if not isinstance(delta, dict):
+            continue
+        if delta.get("content"):
+            accumulator.content_parts.append(delta["content"])
+            if progress is not None:
+                progress.add_text(delta["content"])
+        for tool_call in delta.get("tool_calls") or ():
+            call_index = tool_call.get("index") or 0
+            call = accumulator.tool_calls.get(call_index)
+            if call is None:
+                call = accumulator.tool_calls[call_index] = _ToolCallAccumulator()
+            if tool_call.get("id"):
+                call.id = tool_call["id"]
+            function = tool_call.get("function") or {}
+            if function.get("name"):
+                call.name = function["name"]
+            if function.get("arguments"):
+                call.argument_parts.append(function["arguments"])
+                if progress is not None:
+                    progress.add_text(function["arguments"])
+
+
+def _set_choice_attributes(span, choices, capture_message_content, policy=None):
+    """Emit finish reasons, per-choice content and tool calls from the stream accumulators."""
+    ordered = sorted(choices.items())
+    finish_reasons = [choice.finish_reason for _, choice in ordered if choice.finish_reason]
+    if finish_reasons:
+        span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_FINISH_REASON, ",".join(finish_reasons))
+    as_json = capture_message_content and use_json_content(policy)
+    output_messages = []
+    for index, choice in ordered:
+        content = "".join(choice.content_parts) if choice.content_parts else None
+        calls = [
+            (call.id, call.name, "".join(call.argument_parts))
+            for _, call in sorted(choice.tool_calls.items())
+        ]
+        if as_json:
+            output_messages.append(_output_message(content, choice.finish_reason, calls, policy))
+        elif capture_message_content and content:
+            set_content_attribute(span, f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.{index}", content, policy)
+        if calls:
+            _set_tool_call_attributes(span, index, calls, capture_message_content and not as_json, policy)
+    if as_json:
+        set_conversation_attribute(span, SemanticConventions.GEN_AI_OUTPUT_MESSAGES, output_messages, policy)
+
+
+def _output_message(content, finish_reason, tool_calls, policy=None):
+    """One assistant choice in the JSON output conversation."""
+    message = {"role": "assistant", "content": content}
+    if finish_reason:
+        message["finish_reason"] = finish_reason
+    if tool_calls:
+        message["tool_calls"] = [
+            {"id": id_, "name": name, "arguments": policy.truncate(redact_content(str(args or ""))) if policy else args}
+            for id_, name, args in tool_calls
+        ]
+    return message
+
+
+def _set_tool_call_attributes(span, index, tool_calls, capture_message_content, policy=None):
+    """
+    Record the tool calls of choice ``index`` as parallel sequence attributes.
+
+    ``tool_calls`` is a list of (id, name, arguments); arguments are message
+    content and only recorded when content capture is on.
+    """
+    span.set_attribute(f"{SemanticConventions.GEN_AI_TOOL_NAME}.{index}", [name or "" for _, name, _ in tool_calls])
+    span.set_attribute(f"{SemanticConventions.GEN_AI_TOOL_CALL_ID}.{index}", [id_ or "" for id_, _, _ in tool_calls])
+    if capture_message_content:
+        arguments = [redact_content(str(args or "")) for _, _, args in tool_calls]
+        if policy is not None:
+            arguments = [policy.truncate(args) for args in arguments]
+        set_content_list_attribute(span, f"{SemanticConventions.GEN_AI_TOOL_ARGS}.{index}", arguments)
 
 
 class StreamWrapper:
@@ -29,22 +169,32 @@ class StreamWrapper:
     Transparent proxy around an OpenAI sync stream.
 
     Yields chunks unchanged while accumulating token/usage data.
-    Finalizes the OTel span once the stream is fully consumed or closed.
+    Finalizes the OTel span once the stream is fully consumed or closed; a
+    stream that is dropped unfinished has its span ended by a weakref
+    finalizer as soon as it is collected.
     """
 
-    def __init__(self, stream, span, start_time, request_model, capture_message_content):
+    __slots__ = (
+        "_stream", "_span", "_start_time", "_model", "_capture_message_content", "_policy",
+        "_choices", "_input_tokens", "_output_tokens", "_total_tokens", "_response_id",
+        "_progress", "_reaper", "__weakref__",
+    )
+
+    def __init__(self, stream, span, start_time, request_model, capture_message_content, policy=None,
+                 max_tokens=None):
         self._stream = stream
         self._span = span
         self._start_time = start_time
         self._model = request_model
         self._capture_message_content = capture_message_content
-        self._finish_reasons = []
+        self._policy = policy
+        self._choices = {}
         self._input_tokens = 0
         self._output_tokens = 0
         self._total_tokens = 0
         self._response_id = None
-        self._chunks_content = []
-        self._finalized = False
+        self._progress = StreamProgress(max_tokens)
+        self._reaper = reap_span(self, span, self._progress)
 
     def __iter__(self):
         return self
@@ -55,11 +205,11 @@ class StreamWrapper:
             self._process_chunk(chunk)
             return chunk
         except StopIteration:
-            self._finalize_success()
+            self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
             raise
         except Exception as e:
             handle_exception(self._span, e)
-            self._end_span()
+            self._end_span(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR)
             raise
 
     def __enter__(self):
@@ -70,12 +220,12 @@ class StreamWrapper:
     def __exit__(self, *args):
         if hasattr(self._stream, "__exit__"):
             self._stream.__exit__(*args)
-        self._finalize_success()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
 
     def close(self):
         if hasattr(self._stream, "close"):
             self._stream.close()
-        self._finalize_success()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
 
     @property
     def response(self):
@@ -100,20 +250,14 @@ class StreamWrapper:
             self._output_tokens = usage.get("completion_tokens", self._output_tokens)
             self._total_tokens = usage.get("total_tokens", self._total_tokens)
 
-        for choice in chunk_dict.get("choices", []):
-            if isinstance(choice, dict):
-                if choice.get("finish_reason"):
-                    self._finish_reasons.append(str(choice["finish_reason"]))
-                delta = choice.get("delta", {})
-                if isinstance(delta, dict) and delta.get("content"):
-                    self._chunks_content.append(delta["content"])
+        _accumulate_choices(self._choices, chunk_dict.get("choices"), self._progress)
 
-    def _finalize_success(self):
-        if self._finalized:
+    def _finalize(self, outcome):
+        """End the span with everything accumulated so far; no-op once ended."""
+        if not self._reaper.alive:
             return
         self._set_span_attributes()
-        self._span.set_status(trace.Status(trace.StatusCode.OK))
-        self._end_span()
+        self._end_span(outcome)
 
     def _set_span_attributes(self):
         if not self._span.is_recording():
@@ -131,43 +275,33 @@ class StreamWrapper:
             self._span.set_attribute(SemanticConventions.GEN_AI_USAGE_OUTPUT_TOKENS, self._output_tokens)
         if self._total_tokens:
             self._span.set_attribute(SemanticConventions.GEN_AI_CLIENT_TOKEN_USAGE, self._total_tokens)
-        if self._finish_reasons:
-            self._span.set_attribute(
-                SemanticConventions.GEN_AI_RESPONSE_FINISH_REASON,
-                ",".join(self._finish_reasons),
-            )
-        if self._capture_message_content and self._chunks_content:
-            self._span.set_attribute(
-                f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.0",
-                "".join(self._chunks_content),
-            )
+        _set_choice_attributes(self._span, self._choices, self._capture_message_content, self._policy)
 
-    def _end_span(self):
-        if not self._finalized:
-            self._finalized = True
-            self._span.end()
-
-    def __del__(self):
-        # Safety net: end span if caller abandons the stream without consuming it
-        self._end_span()
+    def _end_span(self, outcome):
+        if self._reaper.detach():
+            end_stream_span(self._span, outcome, self._progress, self._output_tokens or None)
 
 
 class AsyncStreamWrapper:
     """Async equivalent of StreamWrapper for AsyncOpenAI streaming."""
 
-    def __init__(self, stream, span, start_time, request_model, capture_message_content):
+    __slots__ = StreamWrapper.__slots__
+
+    def __init__(self, stream, span, start_time, request_model, capture_message_content, policy=None,
+                 max_tokens=None):
         self._stream = stream
         self._span = span
         self._start_time = start_time
         self._model = request_model
         self._capture_message_content = capture_message_content
-        self._finish_reasons = []
+        self._policy = policy
+        self._choices = {}
         self._input_tokens = 0
         self._output_tokens = 0
         self._total_tokens = 0
         self._response_id = None
-        self._chunks_content = []
-        self._finalized = False
+        self._progress = StreamProgress(max_tokens)
+        self._reaper = reap_span(self, span, self._progress)
 
     def __aiter__(self):
         return self
@@ -178,11 +312,14 @@ class AsyncStreamWrapper:
             self._process_chunk(chunk)
             return chunk
         except StopAsyncIteration:
-            self._finalize_success()
+            self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+            raise
+        except asyncio.CancelledError:
+            self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED)
             raise
         except Exception as e:
             handle_exception(self._span, e)
-            self._end_span()
+            self._end_span(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR)
             raise
 
     async def __aenter__(self):
@@ -193,7 +330,12 @@ class AsyncStreamWrapper:
     async def __aexit__(self, *args):
         if hasattr(self._stream, "__aexit__"):
             await self._stream.__aexit__(*args)
-        self._finalize_success()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+    async def close(self):
+        if hasattr(self._stream, "close"):
+            await self._stream.close()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
 
     @property
     def response(self):
@@ -215,20 +357,14 @@ class AsyncStreamWrapper:
             self._output_tokens = usage.get("completion_tokens", self._output_tokens)
             self._total_tokens = usage.get("total_tokens", self._total_tokens)
 
-        for choice in chunk_dict.get("choices", []):
-            if isinstance(choice, dict):
-                if choice.get("finish_reason"):
-                    self._finish_reasons.append(str(choice["finish_reason"]))
-                delta = choice.get("delta", {})
-                if isinstance(delta, dict) and delta.get("content"):
-                    self._chunks_content.append(delta["content"])
+        _accumulate_choices(self._choices, chunk_dict.get("choices"), self._progress)
 
-    def _finalize_success(self):
-        if self._finalized:
+    def _finalize(self, outcome):
+        """End the span with everything accumulated so far; no-op once ended."""
+        if not self._reaper.alive:
             return
         self._set_span_attributes()
-        self._span.set_status(trace.Status(trace.StatusCode.OK))
-        self._end_span()
+        self._end_span(outcome)
 
     def _set_span_attributes(self):
         if not self._span.is_recording():
@@ -246,36 +382,384 @@ class AsyncStreamWrapper:
             self._span.set_attribute(SemanticConventions.GEN_AI_USAGE_OUTPUT_TOKENS, self._output_tokens)
         if self._total_tokens:
             self._span.set_attribute(SemanticConventions.GEN_AI_CLIENT_TOKEN_USAGE, self._total_tokens)
-        if self._finish_reasons:
-            self._span.set_attribute(
-                SemanticConventions.GEN_AI_RESPONSE_FINISH_REASON,
-                ",".join(self._finish_reasons),
-            )
-        if self._capture_message_content and self._chunks_content:
-            self._span.set_attribute(
-                f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.0",
-                "".join(self._chunks_content),
-            )
+        _set_choice_attributes(self._span, self._choices, self._capture_message_content, self._policy)
+
+    def _end_span(self, outcome):
+        if self._reaper.detach():
+            end_stream_span(self._span, outcome, self._progress, self._output_tokens or None)
+
+
+# Responses API stream events that end a response, each carrying its final state
+_RESPONSES_TERMINAL_EVENTS = frozenset(("response.completed", "response.incomplete", "response.failed"))
+
+
+class _ResponsesStreamMixin:
+    """
+    Event handling shared by the sync and async Responses API stream wrappers.
+
+    Events are typed (``response.output_text.delta``, ``response.completed``,
+    ...) rather than chat chunks with ``choices``. Only the ``type`` and the
+    one or two fields each event needs are read, by attribute: usage, output
+    and status come once, from the terminal event's response, so no event is
+    ever dumped.
+    """
+
+    __slots__ = ()
+
+    def _init_state(self, stream, span, start_time, request_model, capture_message_content, policy, max_tokens):
+        self._stream = stream
+        self._span = span
+        self._start_time = start_time
+        self._model = request_model
+        self._capture_message_content = capture_message_content
+        self._policy = policy
+        self._response = None
+        self._response_id = None
+        self._text_parts = []
+        self._error = None
+        self._progress = StreamProgress(max_tokens)
+        self._reaper = reap_span(self, span, self._progress)
+
+    @property
+    def response(self):
+        """Expose the underlying httpx response for callers that need it."""
+        return getattr(self._stream, "response", None)
+
+    def _process_event(self, event):
+        event_type = get_field(event, "type")
+        if event_type == "response.output_text.delta":
+            delta = get_field(event, "delta")
+            if delta:
+                self._progress.add_text(delta)
+                if self._capture_message_content:
+                    self._text_parts.append(delta)
+        elif event_type in _RESPONSES_TERMINAL_EVENTS:
+            self._response = get_field(event, "response")
+        elif event_type == "response.created":
+            created = get_field(event, "response")
+            self._response_id = get_field(created, "id")
+            self._model = get_field(created, "model") or self._model
+        elif event_type == "error":
+            self._error = get_field(event, "message") or "error"
+
+    def _finalize(self, outcome):
+        """End the span with everything received so far; no-op once ended."""
+        if not self._reaper.alive:
+            return
+        error = self._error or _responses_error(self._response)
+        if self._span.is_recording():
+            duration = time.time() - self._start_time
+            self._span.set_attribute(SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, duration)
+            self._span.set_attribute(SemanticConventions.GEN_AI_REQUEST_IS_STREAM, True)
+            if self._response is not None:
+                _set_responses_attributes(
+                    self._span, self._response, self._model, self._capture_message_content, self._policy,
+                )
+            else:
+                # Interrupted before the terminal event: keep what was delivered
+                if self._response_id:
+                    self._span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_ID, self._response_id)
+                if self._model:
+                    self._span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_MODEL, self._model)
+                if self._text_parts:
+                    _set_responses_output(
+                        self._span, "".join(self._text_parts), [], None,
+                        self._capture_message_content, self._policy,
+                    )
+            if error is not None:
+                self._span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+        if error is not None and outcome == SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED:
+            outcome = SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR
+        self._end_span(outcome)
+
+    def _end_span(self, outcome):
+        if self._reaper.detach():
+            usage = get_field(self._response, "usage")
+            end_stream_span(self._span, outcome, self._progress, get_field(usage, "output_tokens"))
+
+
+class ResponsesStreamWrapper(_ResponsesStreamMixin):
+    """Transparent proxy around a sync Responses API event stream."""
+
+    __slots__ = (
+        "_stream", "_span", "_start_time", "_model", "_capture_message_content", "_policy",
+        "_response", "_response_id", "_text_parts", "_error", "_progress", "_reaper", "__weakref__",
+    )
+
+    def __init__(self, stream, span, start_time, request_model, capture_message_content, policy=None,
+                 max_tokens=None):
+        self._init_state(stream, span, start_time, request_model, capture_message_content, policy, max_tokens)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            event = next(self._stream)
+            self._process_event(event)
+            return event
+        except StopIteration:
+            self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+            raise
+        except Exception as e:
+            handle_exception(self._span, e)
+            self._end_span(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR)
+            raise
+
+    def __enter__(self):
+        if hasattr(self._stream, "__enter__"):
+            self._stream.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        if hasattr(self._stream, "__exit__"):
+            self._stream.__exit__(*args)
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+    def close(self):
+        if hasattr(self._stream, "close"):
+            self._stream.close()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+
+class AsyncResponsesStreamWrapper(_ResponsesStreamMixin):
+    """Async equivalent of ResponsesStreamWrapper."""
+
+    __slots__ = ResponsesStreamWrapper.__slots__
+
+    def __init__(self, stream, span, start_time, request_model, capture_message_content, policy=None,
+                 max_tokens=None):
+        self._init_state(stream, span, start_time, request_model, capture_message_content, policy, max_tokens)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            event = await self._stream.__anext__()
+            self._process_event(event)
+            return event
+        except StopAsyncIteration:
+            self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+            raise
+        except asyncio.CancelledError:
+            self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED)
+            raise
+        except Exception as e:
+            handle_exception(self._span, e)
+            self._end_span(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR)
+            raise
+
+    async def __aenter__(self):
+        if hasattr(self._stream, "__aenter__"):
+            await self._stream.__aenter__()
+        return self
+
+    async def __aexit__(self, *args):
+        if hasattr(self._stream, "__aexit__"):
+            await self._stream.__aexit__(*args)
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+    async def close(self):
+        if hasattr(self._stream, "close"):
+            await self._stream.close()
+        self._finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+
+# Header the OpenAI SDK sets on requests made via `with_streaming_response`
+_RAW_RESPONSE_HEADER = "X-Stainless-Raw-Response"
+
+
+def _is_streamed_response(kwargs):
+    """True when the call returns an unread binary response (with_streaming_response)."""
+    extra_headers = kwargs.get("extra_headers") or {}
+    return extra_headers.get(_RAW_RESPONSE_HEADER) == "stream"
+
+
+class _SpeechStreamMixin:
+    """Byte accounting shared by the sync and async speech proxies."""
+
+    def _self_record(self, chunk):
+        if chunk:
+            if self._self_first_byte_time is None:
+                self._self_first_byte_time = time.time()
+            self._self_bytes += len(chunk)
+
+    def _self_finalize(self, outcome):
+        if not self._self_reaper.alive:
+            return
+        span = self._self_span
+        if span.is_recording():
+            end_time = time.time()
+            duration = end_time - self._self_start_time
+            span.set_attribute(SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, duration)
+            span.set_attribute(SemanticConventions.GEN_AI_REQUEST_IS_STREAM, True)
+            span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_AUDIO_BYTES, self._self_bytes)
+            if self._self_first_byte_time is not None:
+                span.set_attribute(
+                    SemanticConventions.GEN_AI_RESPONSE_AUDIO_TIME_TO_FIRST_BYTE,
+                    self._self_first_byte_time - self._self_start_time,
+                )
+            if duration > 0:
+                span.set_attribute(
+                    SemanticConventions.GEN_AI_RESPONSE_AUDIO_BYTES_PER_SECOND, self._self_bytes / duration
+                )
+        self._self_end_span(outcome)
+
+    def _self_fail(self, e):
+        handle_exception(self._self_span, e)
+        self._self_end_span(SemanticConventions.GEN_AI_STREAM_OUTCOME_ERROR)
+
+    def _self_end_span(self, outcome):
+        if self._self_reaper.detach():
+            end_stream_span(self._self_span, outcome)
+
+
+class SpeechStreamWrapper(_SpeechStreamMixin, wrapt.ObjectProxy):
+    """
+    Proxy around a streamed speech response (``StreamedBinaryAPIResponse``).
+
+    Counts bytes as the caller reads them and ends the span once the body is
+    exhausted or the response is closed. Chunks are passed straight through;
+    nothing is buffered.
+    """
 
-    def _end_span(self):
-        if not self._finalized:
-            self._finalized = True
-            self._span.end()
+    def __init__(self, response, span, start_time):
+        super().__init__(response)
+        self._self_span = span
+        self._self_start_time = start_time
+        self._self_first_byte_time = None
+        self._self_bytes = 0
+        # Ends the span if the caller drops the response without closing it
+        self._self_reaper = reap_span(self, span)
+
+    def iter_bytes(self, chunk_size=None):
+        try:
+            for chunk in self.__wrapped__.iter_bytes(chunk_size):
+                self._self_record(chunk)
+                yield chunk
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+
+    def read(self):
+        try:
+            content = self.__wrapped__.read()
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_record(content)
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+        return content
+
+    def text(self):
+        self.read()
+        return self.__wrapped__.text()
+
+    def json(self):
+        self.read()
+        return self.__wrapped__.json()
+
+    def stream_to_file(self, file, *, chunk_size=None):
+        # Re-implemented so the writes go through our iter_bytes, not the wrapped one
+        with open(file, mode="wb") as f:
+            for data in self.iter_bytes(chunk_size):
+                f.write(data)
+
+    def close(self):
+        try:
+            self.__wrapped__.close()
+        finally:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
+
+
+class AsyncSpeechStreamWrapper(_SpeechStreamMixin, wrapt.ObjectProxy):
+    """Async equivalent of SpeechStreamWrapper (``AsyncStreamedBinaryAPIResponse``)."""
+
+    def __init__(self, response, span, start_time):
+        super().__init__(response)
+        self._self_span = span
+        self._self_start_time = start_time
+        self._self_first_byte_time = None
+        self._self_bytes = 0
+        # Ends the span if the caller drops the response without closing it
+        self._self_reaper = reap_span(self, span)
+
+    async def iter_bytes(self, chunk_size=None):
+        try:
+            async for chunk in self.__wrapped__.iter_bytes(chunk_size):
+                self._self_record(chunk)
+                yield chunk
+        except asyncio.CancelledError:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED)
+            raise
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+
+    async def read(self):
+        try:
+            content = await self.__wrapped__.read()
+        except Exception as e:
+            self._self_fail(e)
+            raise
+        self._self_record(content)
+        self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED)
+        return content
+
+    async def text(self):
+        await self.read()
+        return await self.__wrapped__.text()
+
+    async def json(self):
+        await self.read()
+        return await self.__wrapped__.json()
+
+    async def stream_to_file(self, file, *, chunk_size=None):
+        import anyio
+
+        path = anyio.Path(file)
+        async with await path.open(mode="wb") as f:
+            async for data in self.iter_bytes(chunk_size):
+                await f.write(data)
+
+    async def close(self):
+        try:
+            await self.__wrapped__.close()
+        finally:
+            self._self_finalize(SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY)
 
-    def __del__(self):
-        self._end_span()
 
+def _set_speech_request_attributes(span, kwargs):
+    """Record text-to-speech request parameters."""
+    if kwargs.get("voice") is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_REQUEST_AUDIO_VOICE, str(kwargs["voice"]))
+    span.set_attribute(
+        SemanticConventions.GEN_AI_REQUEST_AUDIO_RESPONSE_FORMAT, str(kwargs.get("response_format") or "mp3")
+    )
+    if kwargs.get("speed") is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_REQUEST_AUDIO_SPEED, kwargs["speed"])
 
-def _set_request_attributes(span, kwargs, capture_message_content):
+
+def _set_request_attributes(span, kwargs, capture_message_content, policy=None):
     """Record prompt messages and model parameters as span attributes."""
-    if capture_message_content and "messages" in kwargs:
+    if capture_message_content and "messages" in kwargs and use_json_content(policy):
+        set_conversation_attribute(
+            span,
+            SemanticConventions.GEN_AI_CONTENT_PROMPT,
+            [message_to_dict(msg) for msg in kwargs["messages"]],
+            policy,
+        )
+    elif capture_message_content and "messages" in kwargs:
         for i, msg in enumerate(kwargs["messages"]):
             role = msg.get("role") if isinstance(msg, dict) else getattr(msg, "role", None)
             content = msg.get("content") if isinstance(msg, dict) else getattr(msg, "content", None)
             if role == "user" and content:
-                span.set_attribute(f"{SemanticConventions.GEN_AI_USER_MESSAGE}.{i}", str(content))
+                set_content_attribute(span, f"{SemanticConventions.GEN_AI_USER_MESSAGE}.{i}", content, policy)
             elif role == "system" and content:
-                span.set_attribute(f"{SemanticConventions.GEN_AI_SYSTEM_MESSAGE}.{i}", str(content))
+                set_content_attribute(span, f"{SemanticConventions.GEN_AI_SYSTEM_MESSAGE}.{i}", content, policy)
 
     for param in ["temperature", "max_tokens", "top_p", "frequency_penalty", "presence_penalty", "seed"]:
         if param in kwargs:
@@ -284,18 +768,61 @@ def _set_request_attributes(span, kwargs, capture_message_content):
                 span.set_attribute(attr_name, kwargs[param])
 
 
+def _responses_messages(kwargs):
+    """The ``instructions`` and ``input`` of a Responses API request, as chat-style messages."""
+    messages = []
+    if kwargs.get("instructions"):
+        messages.append({"role": "system", "content": kwargs["instructions"]})
+    items = kwargs.get("input")
+    if isinstance(items, str):
+        messages.append({"role": "user", "content": items})
+        return messages
+    for item in items or ():
+        if get_field(item, "role") is not None:
+            messages.append(item)
+        elif get_field(item, "type") == "function_call_output":
+            messages.append(
+                {"role": "tool", "tool_call_id": get_field(item, "call_id"), "content": get_field(item, "output")}
+            )
+    return messages
+
+
+def _set_responses_request_attributes(span, kwargs, capture_message_content, policy=None):
+    """Record a Responses API request the way _set_request_attributes records a chat one."""
+    request = {"messages": _responses_messages(kwargs)} if capture_message_content else {}
+    for param in ("temperature", "top_p"):
+        if param in kwargs:
+            request[param] = kwargs[param]
+    if kwargs.get("max_output_tokens") is not None:
+        request["max_tokens"] = kwargs["max_output_tokens"]
+    _set_request_attributes(span, request, capture_message_content, policy)
+
+
+def _defer_response(span, operation_type, process_response_func, response_arguments) -> bool:
+    """
+    Leave chat response processing to the export thread when enrichment is deferred.
+
+    Request kwargs are not passed on: callers often mutate them after the call.
+    """
+    if operation_type != SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT or not enrichment_enabled():
+        return False
+    return defer_enrichment(span, process_response_func, end_time=time.time(), **response_arguments)
+
+
 def create_wrapper(
     config: Dict[str, Any],
     operation_type: str,
     process_response_func: Callable,
     default_model: str,
+    set_request_attributes: Callable = _set_request_attributes,
+    stream_wrapper: type = StreamWrapper,
 ) -> Callable:
     """
     Factory that returns a wrapt-compatible sync wrapper for one OpenAI endpoint.
 
     The returned wrapper has signature (wrapped, instance, args, kwargs) and
     creates an OTel span around the original call. For streaming calls, span
-    ownership is transferred to a StreamWrapper.
+    ownership is transferred to ``stream_wrapper``.
     """
     tracer = config.get("tracer")
     pricing_info = config.get("pricing_info")
@@ -305,57 +832,98 @@ def create_wrapper(
     capture_message_content = config.get("capture_message_content", True)
     disable_metrics = config.get("disable_metrics", False)
     version = config.get("version", "unknown")
+    # Only chat completions need stream_options to report usage
+    inject_usage_option = (
+        operation_type == SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT and stream_wrapper is StreamWrapper
+    )
 
     def wrapper(wrapped, instance, args, kwargs):
-        server_address, server_port = set_server_address_and_port(instance, "api.openai.com", 443)
+        if not is_instrumentation_enabled():
+            return wrapped(*args, **kwargs)
+
         request_model = kwargs.get("model", default_model)
-        span_name = f"{operation_type} {request_model}"
-        is_streaming = kwargs.get("stream", False)
+        policy = get_policy().for_model(request_model, operation_type)
+        if not policy.sampled():
+            return wrapped(*args, **kwargs)
 
         # Manual span management — streaming spans outlive this function scope
-        span = tracer.start_span(span_name, kind=SpanKind.CLIENT)
+        span = tracer.start_span(
+            f"{operation_type} {request_model}",
+            kind=SpanKind.CLIENT,
+            # Set at start so samplers can key on them
+            attributes={
+                SemanticConventions.GEN_AI_SYSTEM: SemanticConventions.GEN_AI_SYSTEM_OPENAI,
+                SemanticConventions.GEN_AI_OPERATION_TYPE: operation_type,
+                SemanticConventions.GEN_AI_REQUEST_MODEL: request_model,
+            },
+        )
+        if not is_sampled(span):
+            # Dropped, or kept RECORD_ONLY over a rate cap: pass the call and its
+            # response through untouched, recording only a raised error
+            return call_unsampled(span, wrapped, args, kwargs)
+
+        capture_content = policy.capture_content(capture_message_content, span)
+        server_address, server_port = set_server_address_and_port(instance, "api.openai.com", 443)
+        is_streaming = kwargs.get("stream", False)
+        is_speech_stream = (
+            operation_type == SemanticConventions.GEN_AI_OPERATION_TYPE_AUDIO and _is_streamed_response(kwargs)
+        )
 
-        if span.is_recording():
-            span.set_attribute(SemanticConventions.GEN_AI_SYSTEM, SemanticConventions.GEN_AI_SYSTEM_OPENAI)
-            span.set_attribute(SemanticConventions.GEN_AI_OPERATION_TYPE, operation_type)
-            span.set_attribute(SemanticConventions.GEN_AI_REQUEST_MODEL, request_model)
-            span.set_attribute(SemanticConventions.SERVER_ADDRESS, server_address)
-            span.set_attribute(SemanticConventions.SERVER_PORT, server_port)
-            span.set_attribute(SemanticConventions.GEN_AI_ENDPOINT, f"{server_address}:{server_port}")
-            _set_request_attributes(span, kwargs, capture_message_content)
+        span.set_attribute(SemanticConventions.SERVER_ADDRESS, server_address)
+        span.set_attribute(SemanticConventions.SERVER_PORT, server_port)
+        span.set_attribute(SemanticConventions.GEN_AI_ENDPOINT, f"{server_address}:{server_port}")
+        set_request_attributes(span, kwargs, capture_content, policy)
+        if operation_type == SemanticConventions.GEN_AI_OPERATION_TYPE_AUDIO:
+            _set_speech_request_attributes(span, kwargs)
 
         start_time = time.time()
 
         try:
             # Inject stream_options so the final chunk includes token usage
-            if is_streaming and operation_type == SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT:
+            if is_streaming and inject_usage_option:
                 stream_opts = kwargs.get("stream_options") or {}
                 if not stream_opts.get("include_usage"):
                     kwargs = {**kwargs, "stream_options": {**stream_opts, "include_usage": True}}
 
-            response = wrapped(*args, **kwargs)
+            recorder, token = start_http_recording(instance, is_async=False)
+            try:
+                response = wrapped(*args, **kwargs)
+            finally:
+                stop_http_recording(token)
+                recorder.set_span_attributes(span)
 
             if is_streaming:
-                # Hand span ownership to StreamWrapper — it will call span.end()
-                return StreamWrapper(response, span, start_time, request_model, capture_message_content)
+                # Hand span ownership to the stream wrapper — it will call span.end()
+                return stream_wrapper(
+                    response, span, start_time, request_model, capture_content, policy,
+                    max_tokens=(
+                        kwargs.get("max_completion_tokens") or kwargs.get("max_tokens") or kwargs.get("max_output_tokens")
+                    ),
+                )
+            if is_speech_stream:
+                return SpeechStreamWrapper(response, span, start_time)
+
+            response_arguments = dict(
+                response=response,
+                request_model=request_model,
+                pricing_info=pricing_info,
+                server_port=server_port,
+                server_address=server_address,
+                environment=environment,
+                application_name=application_name,
+                metrics=metrics,
+                start_time=start_time,
+                capture_message_content=capture_content,
+                disable_metrics=disable_metrics,
+                version=version,
+                policy=policy,
+            )
+            if _defer_response(span, operation_type, process_response_func, response_arguments):
+                span.end()
+                return response
 
             try:
-                process_response_func(
-                    response=response,
-                    request_model=request_model,
-                    pricing_info=pricing_info,
-                    server_port=server_port,
-                    server_address=server_address,
-                    environment=environment,
-                    application_name=application_name,
-                    metrics=metrics,
-                    start_time=start_time,
-                    span=span,
-                    capture_message_content=capture_message_content,
-                    disable_metrics=disable_metrics,
-                    version=version,
-                    **kwargs,
-                )
+                process_response_func(span=span, **response_arguments, **kwargs)
             except Exception as e:
                 handle_exception(span, e)
 
@@ -375,6 +943,8 @@ def create_async_wrapper(
     operation_type: str,
     process_response_func: Callable,
     default_model: str,
+    set_request_attributes: Callable = _set_request_attributes,
+    stream_wrapper: type = AsyncStreamWrapper,
 ) -> Callable:
     """Async equivalent of create_wrapper for AsyncOpenAI client methods."""
     tracer = config.get("tracer")
@@ -385,54 +955,94 @@ def create_async_wrapper(
     capture_message_content = config.get("capture_message_content", True)
     disable_metrics = config.get("disable_metrics", False)
     version = config.get("version", "unknown")
+    inject_usage_option = (
+        operation_type == SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT and stream_wrapper is AsyncStreamWrapper
+    )
 
     async def async_wrapper(wrapped, instance, args, kwargs):
-        server_address, server_port = set_server_address_and_port(instance, "api.openai.com", 443)
+        if not is_instrumentation_enabled():
+            return await wrapped(*args, **kwargs)
+
         request_model = kwargs.get("model", default_model)
-        span_name = f"{operation_type} {request_model}"
+        policy = get_policy().for_model(request_model, operation_type)
+        if not policy.sampled():
+            return await wrapped(*args, **kwargs)
+
+        span = tracer.start_span(
+            f"{operation_type} {request_model}",
+            kind=SpanKind.CLIENT,
+            # Set at start so samplers can key on them
+            attributes={
+                SemanticConventions.GEN_AI_SYSTEM: SemanticConventions.GEN_AI_SYSTEM_OPENAI,
+                SemanticConventions.GEN_AI_OPERATION_TYPE: operation_type,
+                SemanticConventions.GEN_AI_REQUEST_MODEL: request_model,
+            },
+        )
+        if not is_sampled(span):
+            # Dropped, or kept RECORD_ONLY over a rate cap: pass the call and its
+            # response through untouched, recording only a raised error
+            return await async_call_unsampled(span, wrapped, args, kwargs)
+
+        capture_content = policy.capture_content(capture_message_content, span)
+        server_address, server_port = set_server_address_and_port(instance, "api.openai.com", 443)
         is_streaming = kwargs.get("stream", False)
+        is_speech_stream = (
+            operation_type == SemanticConventions.GEN_AI_OPERATION_TYPE_AUDIO and _is_streamed_response(kwargs)
+        )
 
-        span = tracer.start_span(span_name, kind=SpanKind.CLIENT)
-
-        if span.is_recording():
-            span.set_attribute(SemanticConventions.GEN_AI_SYSTEM, SemanticConventions.GEN_AI_SYSTEM_OPENAI)
-            span.set_attribute(SemanticConventions.GEN_AI_OPERATION_TYPE, operation_type)
-            span.set_attribute(SemanticConventions.GEN_AI_REQUEST_MODEL, request_model)
-            span.set_attribute(SemanticConventions.SERVER_ADDRESS, server_address)
-            span.set_attribute(SemanticConventions.SERVER_PORT, server_port)
-            span.set_attribute(SemanticConventions.GEN_AI_ENDPOINT, f"{server_address}:{server_port}")
-            _set_request_attributes(span, kwargs, capture_message_content)
+        span.set_attribute(SemanticConventions.SERVER_ADDRESS, server_address)
+        span.set_attribute(SemanticConventions.SERVER_PORT, server_port)
+        span.set_attribute(SemanticConventions.GEN_AI_ENDPOINT, f"{server_address}:{server_port}")
+        set_request_attributes(span, kwargs, capture_content, policy)
+        if operation_type == SemanticConventions.GEN_AI_OPERATION_TYPE_AUDIO:
+            _set_speech_request_attributes(span, kwargs)
 
         start_time = time.time()
 
         try:
-            if is_streaming and operation_type == SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT:
+            if is_streaming and inject_usage_option:
                 stream_opts = kwargs.get("stream_options") or {}
                 if not stream_opts.get("include_usage"):
                     kwargs = {**kwargs, "stream_options": {**stream_opts, "include_usage": True}}
 
-            response = await wrapped(*args, **kwargs)
+            recorder, token = start_http_recording(instance, is_async=True)
+            try:
+                response = await wrapped(*args, **kwargs)
+            finally:
+                stop_http_recording(token)
+                recorder.set_span_attributes(span)
 
             if is_streaming:
-                return AsyncStreamWrapper(response, span, start_time, request_model, capture_message_content)
+                return stream_wrapper(
+                    response, span, start_time, request_model, capture_content, policy,
+                    max_tokens=(
+                        kwargs.get("max_completion_tokens") or kwargs.get("max_tokens") or kwargs.get("max_output_tokens")
+                    ),
+                )
+            if is_speech_stream:
+                return AsyncSpeechStreamWrapper(response, span, start_time)
+
+            response_arguments = dict(
+                response=response,
+                request_model=request_model,
+                pricing_info=pricing_info,
+                server_port=server_port,
+                server_address=server_address,
+                environment=environment,
+                application_name=application_name,
+                metrics=metrics,
+                start_time=start_time,
+                capture_message_content=capture_content,
+                disable_metrics=disable_metrics,
+                version=version,
+                policy=policy,
+            )
+            if _defer_response(span, operation_type, process_response_func, response_arguments):
+                span.end()
+                return response
 
             try:
-                process_response_func(
-                    response=response,
-                    request_model=request_model,
-                    pricing_info=pricing_info,
-                    server_port=server_port,
-                    server_address=server_address,
-                    environment=environment,
-                    application_name=application_name,
-                    metrics=metrics,
-                    start_time=start_time,
-                    span=span,
-                    capture_message_content=capture_message_content,
-                    disable_metrics=disable_metrics,
-                    version=version,
-                    **kwargs,
-                )
+                process_response_func(span=span, **response_arguments, **kwargs)
             except Exception as e:
                 handle_exception(span, e)
 
@@ -454,13 +1064,18 @@ def create_async_wrapper(
 def process_chat_response(
     response, request_model, pricing_info, server_port, server_address,
     environment, application_name, metrics, start_time, span,
-    capture_message_content, disable_metrics, version, **kwargs,
+    capture_message_content, disable_metrics, version, policy=None, end_time=None, **kwargs,
 ):
-    """Process non-streaming chat completion response and set span attributes."""
+    """
+    Process non-streaming chat completion response and set span attributes.
+
+    ``end_time`` is when the call returned, if processing runs later (see
+    ward.otel.enrichment).
+    """
     if not span.is_recording():
         return response
 
-    duration = time.time() - start_time
+    duration = (end_time or time.time()) - start_time
     span.set_attribute(SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, duration)
 
     response_dict = response_to_dict(response)
@@ -499,70 +1114,289 @@ def process_chat_response(
     if finish_reasons:
         span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_FINISH_REASON, ",".join(finish_reasons))
 
-    if capture_message_content and choices:
-        for i, choice in enumerate(choices):
-            if isinstance(choice, dict):
-                message = choice.get("message", {})
-                if isinstance(message, dict) and message.get("content"):
-                    span.set_attribute(
-                        f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.{i}",
-                        str(message["content"]),
-                    )
+    as_json = capture_message_content and use_json_content(policy)
+    output_messages = []
+    for i, choice in enumerate(choices):
+        if not isinstance(choice, dict):
+            continue
+        message = choice.get("message", {})
+        if not isinstance(message, dict):
+            continue
+        tool_calls = [
+            (call.get("id"), (call.get("function") or {}).get("name"), (call.get("function") or {}).get("arguments"))
+            for call in message.get("tool_calls") or ()
+            if isinstance(call, dict)
+        ]
+        if as_json:
+            output_messages.append(
+                _output_message(message.get("content"), choice.get("finish_reason"), tool_calls, policy)
+            )
+        elif capture_message_content and message.get("content"):
+            set_content_attribute(
+                span,
+                f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.{i}",
+                message["content"],
+                policy,
+            )
+        if tool_calls:
+            _set_tool_call_attributes(span, i, tool_calls, capture_message_content and not as_json, policy)
+    if as_json:
+        set_conversation_attribute(span, SemanticConventions.GEN_AI_OUTPUT_MESSAGES, output_messages, policy)
 
     span.set_status(trace.Status(trace.StatusCode.OK))
     return response
 
 
-def process_embedding_response(
+def process_responses_response(
     response, request_model, pricing_info, server_port, server_address,
     environment, application_name, metrics, start_time, span,
-    capture_message_content, disable_metrics, version, **kwargs,
+    capture_message_content, disable_metrics, version, policy=None, end_time=None, **kwargs,
 ):
-    """Process embedding response and set span attributes."""
+    """
+    Process a non-streaming Responses API response and set span attributes.
+
+    Fields are read by attribute (see _set_responses_attributes) instead of
+    dumping the response, which carries the whole input echo and every
+    output item.
+    """
     if not span.is_recording():
         return response
 
-    duration = time.time() - start_time
+    duration = (end_time or time.time()) - start_time
     span.set_attribute(SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, duration)
+    _set_responses_attributes(span, response, request_model, capture_message_content, policy)
 
-    response_dict = response_to_dict(response)
+    error = _responses_error(response)
+    if error is not None:
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+    else:
+        span.set_status(trace.Status(trace.StatusCode.OK))
+    return response
 
-    if response_dict.get("model"):
-        span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_MODEL, response_dict["model"])
 
-    usage = response_dict.get("usage")
-    if isinstance(usage, dict):
-        input_tokens = usage.get("prompt_tokens")
-        total_tokens = usage.get("total_tokens")
-        if input_tokens is not None:
-            span.set_attribute(SemanticConventions.GEN_AI_USAGE_INPUT_TOKENS, input_tokens)
-        if total_tokens is not None:
-            span.set_attribute(SemanticConventions.GEN_AI_CLIENT_TOKEN_USAGE, total_tokens)
+def _responses_error(response):
+    """Error message of a failed Responses API response, or None."""
+    if get_field(response, "status") != "failed":
+        return None
+    return get_field(get_field(response, "error"), "message") or "response failed"
 
-    data = response_dict.get("data")
-    if isinstance(data, list):
-        span.set_attribute("gen_ai.embedding.count", len(data))
+
+def _set_responses_attributes(span, response, request_model, capture_message_content, policy=None):
+    """
+    Record id, model, usage, finish reason and output of a Responses API response.
+
+    Works on the SDK ``Response`` and on its JSON dict alike. Usage includes
+    cached (and cache-write) input tokens and reasoning output tokens when
+    the API reports them.
+    """
+    response_id = get_field(response, "id")
+    if response_id:
+        span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_ID, response_id)
+    model = get_field(response, "model")
+    if model:
+        span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_MODEL, model)
+
+    usage = get_field(response, "usage")
+    input_tokens = get_field(usage, "input_tokens")
+    output_tokens = get_field(usage, "output_tokens")
+    total_tokens = get_field(usage, "total_tokens")
+    input_details = get_field(usage, "input_tokens_details")
+    cached_tokens = get_field(input_details, "cached_tokens")
+    cache_write_tokens = get_field(input_details, "cache_write_tokens")
+    reasoning_tokens = get_field(get_field(usage, "output_tokens_details"), "reasoning_tokens")
+    if input_tokens is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_INPUT_TOKENS, input_tokens)
+    if output_tokens is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_OUTPUT_TOKENS, output_tokens)
+    if total_tokens is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_CLIENT_TOKEN_USAGE, total_tokens)
+    if cached_tokens:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_PROMPT_TOKENS_DETAILS_CACHE_READ, cached_tokens)
+    if cache_write_tokens:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_PROMPT_TOKENS_DETAILS_CACHE_WRITE, cache_write_tokens)
+    if reasoning_tokens:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_REASONING_TOKENS, reasoning_tokens)
+    if usage is not None:
+        _set_cost_attribute(span, None, model or request_model, input_tokens, output_tokens)
+
+    # "completed", "failed", or why an incomplete response stopped (e.g. "max_output_tokens")
+    finish_reason = get_field(response, "status")
+    if finish_reason == "incomplete":
+        finish_reason = get_field(get_field(response, "incomplete_details"), "reason") or finish_reason
+    if finish_reason:
+        span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_FINISH_REASON, str(finish_reason))
+
+    text_parts = []
+    tool_calls = []
+    for item in get_field(response, "output") or ():
+        item_type = get_field(item, "type")
+        if item_type == "message":
+            for part in get_field(item, "content") or ():
+                if get_field(part, "type") == "output_text":
+                    text_parts.append(get_field(part, "text") or "")
+        elif item_type == "function_call":
+            tool_calls.append((get_field(item, "call_id"), get_field(item, "name"), get_field(item, "arguments")))
+    _set_responses_output(
+        span, "".join(text_parts) or None, tool_calls, finish_reason, capture_message_content, policy,
+    )
+
+
+def _set_responses_output(span, text, tool_calls, finish_reason, capture_message_content, policy=None):
+    """Record a response's output text and function calls as choice 0."""
+    as_json = capture_message_content and use_json_content(policy)
+    if as_json:
+        set_conversation_attribute(
+            span,
+            SemanticConventions.GEN_AI_OUTPUT_MESSAGES,
+            [_output_message(text, finish_reason, tool_calls, policy)],
+            policy,
+        )
+    elif capture_message_content and text:
+        set_content_attribute(span, f"{SemanticConventions.GEN_AI_ASSISTANT_MESSAGE}.0", text, policy)
+    if tool_calls:
+        _set_tool_call_attributes(span, 0, tool_calls, capture_message_content and not as_json, policy)
+
+
+def process_embedding_response(
+    response, request_model, pricing_info, server_port, server_address,
+    environment, application_name, metrics, start_time, span,
+    capture_message_content, disable_metrics, version, policy=None, **kwargs,
+):
+    """
+    Process embedding response and set span attributes.
+
+    Fields are read by attribute: dumping the response would copy every float
+    of every vector (hundreds of MB for large batches) only to throw it away.
+    """
+    if not span.is_recording():
+        return response
+
+    duration = time.time() - start_time
+    span.set_attribute(SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, duration)
+
+    model = get_field(response, "model")
+    if model:
+        span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_MODEL, model)
+
+    usage = get_field(response, "usage")
+    input_tokens = get_field(usage, "prompt_tokens")
+    total_tokens = get_field(usage, "total_tokens")
+    if input_tokens is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_INPUT_TOKENS, input_tokens)
+    if total_tokens is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_CLIENT_TOKEN_USAGE, total_tokens)
+    if input_tokens is not None:
+        _set_cost_attribute(span, pricing_info, model or request_model, input_tokens, 0)
+
+    input_count = _embedding_input_count(kwargs.get("input"))
+    if input_count is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_REQUEST_EMBEDDING_INPUT_COUNT, input_count)
+    if kwargs.get("dimensions") is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_REQUEST_EMBEDDING_DIMENSION, kwargs["dimensions"])
+    span.set_attribute(
+        SemanticConventions.GEN_AI_REQUEST_ENCODING_FORMATS,
+        [str(kwargs.get("encoding_format") or "float")],
+    )
+
+    data = get_field(response, "data")
+    if data is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_EMBEDDING_COUNT, len(data))
+        if len(data):
+            dimension = _embedding_dimension(get_field(data[0], "embedding"))
+            if dimension is not None:
+                span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_EMBEDDING_DIMENSION, dimension)
 
     span.set_status(trace.Status(trace.StatusCode.OK))
     return response
 
 
+def _embedding_input_count(embedding_input):
+    """Number of inputs in an embeddings request (str, [str], [int] or [[int]])."""
+    if embedding_input is None:
+        return None
+    if isinstance(embedding_input, str):
+        return 1
+    try:
+        count = len(embedding_input)
+    except TypeError:
+        return None
+    # A flat list of token ids is a single input
+    if count and isinstance(embedding_input[0], int):
+        return 1
+    return count
+
+
+def _embedding_dimension(embedding):
+    """Vector length from a float list or a base64 float32 string, without decoding."""
+    if isinstance(embedding, str):
+        return _base64_decoded_length(embedding) // 4
+    if isinstance(embedding, (list, tuple)):
+        return len(embedding)
+    return None
+
+
+def _base64_decoded_length(encoded):
+    """Number of bytes ``encoded`` decodes to, computed from its length alone."""
+    padding = len(encoded) - len(encoded.rstrip("="))
+    return len(encoded) * 3 // 4 - padding
+
+
 def process_image_response(
     response, request_model, pricing_info, server_port, server_address,
     environment, application_name, metrics, start_time, span,
-    capture_message_content, disable_metrics, version, **kwargs,
+    capture_message_content, disable_metrics, version, policy=None, **kwargs,
 ):
-    """Process image generation response and set span attributes."""
+    """
+    Process image generation response and set span attributes.
+
+    Only metadata is read: with ``response_format="b64_json"`` every image
+    carries megabytes of base64, so output size is derived from string
+    lengths and the payload itself is never copied or decoded.
+    """
     if not span.is_recording():
         return response
 
     duration = time.time() - start_time
     span.set_attribute(SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, duration)
 
-    response_dict = response_to_dict(response)
-    data = response_dict.get("data")
-    if isinstance(data, list):
-        span.set_attribute("gen_ai.image.count", len(data))
+    # gpt-image-1 echoes the effective size/quality; older models only have the request
+    size = get_field(response, "size") or kwargs.get("size") or "1024x1024"
+    quality = get_field(response, "quality") or kwargs.get("quality") or "standard"
+    span.set_attribute(SemanticConventions.GEN_AI_REQUEST_IMAGE_SIZE, str(size))
+    span.set_attribute(SemanticConventions.GEN_AI_REQUEST_IMAGE_QUALITY, str(quality))
+    if kwargs.get("style") is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_REQUEST_IMAGE_STYLE, str(kwargs["style"]))
+    if kwargs.get("n") is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_REQUEST_N, kwargs["n"])
+    if kwargs.get("response_format") is not None:
+        span.set_attribute(
+            SemanticConventions.GEN_AI_REQUEST_IMAGE_RESPONSE_FORMAT, str(kwargs["response_format"])
+        )
+
+    data = get_field(response, "data") or []
+    count = len(data)
+    span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_IMAGE_COUNT, count)
+    output_bytes = 0
+    for image in data:
+        encoded = get_field(image, "b64_json")
+        if isinstance(encoded, str):
+            output_bytes += _base64_decoded_length(encoded)
+    if output_bytes:
+        span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_IMAGE_BYTES, output_bytes)
+
+    usage = get_field(response, "usage")
+    input_tokens = get_field(usage, "input_tokens")
+    output_tokens = get_field(usage, "output_tokens")
+    if input_tokens is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_INPUT_TOKENS, input_tokens)
+    if output_tokens is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_OUTPUT_TOKENS, output_tokens)
+
+    from ward.pricing import calculate_image_cost
+
+    cost = calculate_image_cost(request_model, str(size), str(quality), count)
+    if cost is not None:
+        span.set_attribute(SemanticConventions.GEN_AI_USAGE_COST, cost)
 
     span.set_status(trace.Status(trace.StatusCode.OK))
     return response
@@ -571,14 +1405,23 @@ def process_image_response(
 def process_audio_response(
     response, request_model, pricing_info, server_port, server_address,
     environment, application_name, metrics, start_time, span,
-    capture_message_content, disable_metrics, version, **kwargs,
+    capture_message_content, disable_metrics, version, policy=None, **kwargs,
 ):
-    """Process audio response and set span attributes."""
+    """
+    Process a fully read speech response and set span attributes.
+
+    Streamed responses are handled by SpeechStreamWrapper instead, since their
+    body has not arrived when the call returns.
+    """
     if not span.is_recording():
         return response
 
     duration = time.time() - start_time
     span.set_attribute(SemanticConventions.GEN_AI_CLIENT_OPERATION_DURATION, duration)
+    # The non-streaming SDK path has already read the body, so this is not a copy
+    content = get_field(response, "content")
+    if isinstance(content, (bytes, bytearray)):
+        span.set_attribute(SemanticConventions.GEN_AI_RESPONSE_AUDIO_BYTES, len(content))
     span.set_status(trace.Status(trace.StatusCode.OK))
     return response
 
@@ -601,7 +1444,10 @@ def chat_completions(config: Dict[str, Any]) -> Callable:
 
 
 def responses(config: Dict[str, Any]) -> Callable:
-    return create_wrapper(config, SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT, process_chat_response, "gpt-4o")
+    return create_wrapper(
+        config, SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT, process_responses_response, "gpt-4o",
+        set_request_attributes=_set_responses_request_attributes, stream_wrapper=ResponsesStreamWrapper,
+    )
 
 
 def chat_completions_parse(config: Dict[str, Any]) -> Callable:
@@ -629,6 +1475,13 @@ def async_chat_completions(config: Dict[str, Any]) -> Callable:
     return create_async_wrapper(config, SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT, process_chat_response, "gpt-4o")
 
 
+def async_responses(config: Dict[str, Any]) -> Callable:
+    return create_async_wrapper(
+        config, SemanticConventions.GEN_AI_OPERATION_TYPE_CHAT, process_responses_response, "gpt-4o",
+        set_request_attributes=_set_responses_request_attributes, stream_wrapper=AsyncResponsesStreamWrapper,
+    )
+
+
 def async_embedding(config: Dict[str, Any]) -> Callable:
     return create_async_wrapper(config, SemanticConventions.GEN_AI_OPERATION_TYPE_EMBEDDING, process_embedding_response, "text-embedding-ada-002")
 
@@ -2,7 +2,175 @@
 Shared helpers for LLM instrumentation (used by both OpenAI and Anthropic).
 """
 
+import json
+import time
+import weakref
+
+from opentelemetry._logs import LogRecord
 from opentelemetry.trace import Span, Status, StatusCode
+from ward.conventions import SemanticConventions
+
+try:
+    import orjson
+except ImportError:  # optional: pip install ward-sdk[fast]
+    orjson = None
+
+# Kill switch flipped by ward.disable()/ward.enable(). Unwrapping removes the
+# wrappers from the client classes, but bound copies can outlive it (openai's
+# with_raw_response caches the method it wraps), so wrappers check this too.
+_INSTRUMENTATION_ENABLED = True
+
+
+def set_instrumentation_enabled(enabled: bool):
+    """Turn every Ward wrapper into a pass-through (False) or back on (True)."""
+    global _INSTRUMENTATION_ENABLED
+    _INSTRUMENTATION_ENABLED = enabled
+
+
+def is_instrumentation_enabled() -> bool:
+    return _INSTRUMENTATION_ENABLED
+
+
+class ContentLimits:
+    """
+    Size caps for captured content, set once by ward.init.
+
+    ``max_attribute_length`` caps each content attribute, in characters like
+    the OTel attribute limit; ``max_span_bytes`` caps the content recorded on
+    one span in total, in UTF-8 bytes, and never splits a character. Content
+    is sliced before it reaches the span, so an oversized prompt is never
+    copied in whole.
+    """
+
+    __slots__ = ("max_attribute_length", "max_span_bytes")
+
+    def __init__(self, max_attribute_length=None, max_span_bytes=None):
+        for name, value in (("max_attribute_length", max_attribute_length), ("max_span_bytes", max_span_bytes)):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be >= 0, got {value}")
+        self.max_attribute_length = max_attribute_length
+        self.max_span_bytes = max_span_bytes
+
+
+class _SpanContentBudget:
+    """Content bytes recorded on one span, and the characters cut."""
+
+    __slots__ = ("used", "truncated_keys", "truncated_length")
+
+    def __init__(self):
+        self.used = 0
+        self.truncated_keys = []
+        self.truncated_length = 0
+
+
+_CONTENT_LIMITS = None
+_SPAN_BUDGETS = weakref.WeakKeyDictionary()
+
+
+_REDACTOR = None
+_CONTENT_LOGGER = None
+
+
+def set_content_logger(logger):
+    """Send captured content to ``logger`` (ward.otel.logs) instead of span attributes; None to stop."""
+    global _CONTENT_LOGGER
+    _CONTENT_LOGGER = logger
+
+
+def emit_content(logger, span: Span, key: str, body):
+    """Emit captured content as a log record correlated with ``span``."""
+    context = span.get_span_context()
+    logger.emit(LogRecord(
+        timestamp=time.time_ns(),
+        trace_id=context.trace_id,
+        span_id=context.span_id,
+        trace_flags=context.trace_flags,
+        body=body,
+        attributes={SemanticConventions.WARD_CONTENT_ATTRIBUTE: key},
+    ))
+
+
+def set_redactor(redactor, deferred: bool = False):
+    """
+    Install (or clear, with None) the ward.redaction.Redactor for captured content.
+
+    ``deferred`` says a redacting exporter already handles it on the export
+    thread. Otherwise content is redacted inline, whatever ``redactor.defer``
+    asks for, so it never leaves the process unredacted.
+    """
+    global _REDACTOR
+    _REDACTOR = None if deferred else redactor
+
+
+def redact_content(text: str) -> str:
+    """Redact ``text`` inline, unless redaction is off or deferred to export."""
+    redactor = _REDACTOR
+    if redactor is None:
+        return text
+    return redactor.redact(text)
+
+
+def set_content_limits(limits):
+    """Install (or clear, with None) the ContentLimits applied to captured content."""
+    global _CONTENT_LIMITS
+    _CONTENT_LIMITS = limits
+
+
+def _utf8_length(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8", "surrogatepass"))
+
+
+def _fit(text: str, max_chars, max_bytes) -> str:
+    """Longest prefix of ``text`` within ``max_chars`` characters and ``max_bytes`` UTF-8 bytes."""
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars]
+    if max_bytes is not None and len(text) > max_bytes // 4:
+        text = text[:max_bytes]  # every character takes at least one byte
+        if not text.isascii():
+            encoded = text.encode("utf-8", "surrogatepass")
+            if len(encoded) > max_bytes:
+                end = max_bytes
+                while encoded[end] & 0xC0 == 0x80:  # continuation byte: back up to the character start
+                    end -= 1
+                text = encoded[:end].decode("utf-8", "surrogatepass")
+    return text
+
+
+def _content_allowance(span, limits):
+    """(characters one attribute may take, UTF-8 bytes ``span`` may still take, its budget)."""
+    # Deferred enrichment records through a stand-in; share the real span's budget
+    span = getattr(span, "ended_span", span)
+    budget = _SPAN_BUDGETS.get(span)
+    if budget is None:
+        budget = _SPAN_BUDGETS[span] = _SpanContentBudget()
+    remaining = None
+    if limits.max_span_bytes is not None:
+        remaining = max(0, limits.max_span_bytes - budget.used)
+    return limits.max_attribute_length, remaining, budget
+
+
+def _record_content(span, budget, key, text, original, max_bytes):
+    kept = len(text)
+    if max_bytes is not None:
+        budget.used += _utf8_length(text)
+    if kept < original:
+        if key not in budget.truncated_keys:  # list attributes are cut item by item
+            budget.truncated_keys.append(key)
+        budget.truncated_length += original - kept
+        span.set_attribute(SemanticConventions.WARD_TRUNCATED_ATTRIBUTES, budget.truncated_keys)
+        span.set_attribute(SemanticConventions.WARD_TRUNCATED_LENGTH, budget.truncated_length)
+
+
+def limit_content(span: Span, key: str, text: str) -> str:
+    """Cut ``text`` to the ContentLimits, marking the span when anything is cut."""
+    limits = _CONTENT_LIMITS
+    if limits is None:
+        return text
+    max_chars, max_bytes, budget = _content_allowance(span, limits)
+    original = len(text)
+    text = _fit(text, max_chars, max_bytes)
+    _record_content(span, budget, key, text, original, max_bytes)
+    return text
 
 
 def set_server_address_and_port(instance, default_address="api.openai.com", default_port=443):
@@ -35,6 +203,231 @@ def handle_exception(span: Span, exception: Exception):
         span.set_status(Status(StatusCode.ERROR, str(exception)))
 
 
+def is_sampled(span: Span) -> bool:
+    """Whether the span will be exported as it stands (sampled, not just recording)."""
+    return span.get_span_context().trace_flags.sampled
+
+
+def call_unsampled(span: Span, wrapped, args, kwargs):
+    """
+    Make a call whose span will not be exported unless it fails.
+
+    The span was either dropped by the sampler or kept RECORD_ONLY over a
+    RateLimitingSampler cap. Either way it gets none of the usual enrichment:
+    no request or response attributes, no content, no stream wrapping, and
+    the response is returned untouched. A raised exception is still recorded
+    so ErrorAdmittingSpanProcessor can export the span; errors inside a
+    stream that was already returned are not.
+    """
+    try:
+        return wrapped(*args, **kwargs)
+    except Exception as e:
+        handle_exception(span, e)
+        raise
+    finally:
+        span.end()
+
+
+async def async_call_unsampled(span: Span, wrapped, args, kwargs):
+    """Async counterpart of call_unsampled."""
+    try:
+        return await wrapped(*args, **kwargs)
+    except Exception as e:
+        handle_exception(span, e)
+        raise
+    finally:
+        span.end()
+
+
+def set_content_attribute(span: Span, key: str, content, policy=None):
+    """Record captured prompt/response text, redacted and within the size caps."""
+    text = redact_content(str(content))
+    if policy is not None:
+        text = policy.truncate(text)
+    logger = _CONTENT_LOGGER
+    if logger is not None:
+        emit_content(logger, span, key, text)
+        return
+    span.set_attribute(key, limit_content(span, key, text))
+
+
+def set_content_list_attribute(span: Span, key: str, texts):
+    """Record a list of captured texts (e.g. tool arguments) as one sequence attribute."""
+    logger = _CONTENT_LOGGER
+    if logger is not None:
+        emit_content(logger, span, key, texts)
+        return
+    span.set_attribute(key, [limit_content(span, key, text) for text in texts])
+
+
+def json_dumps(value) -> str:
+    """Compact JSON; orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def json_loads(data):
+    """Parse JSON text or bytes; orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def use_json_content(policy) -> bool:
+    """True when the policy asks for one JSON attribute per conversation side."""
+    return policy is not None and policy.content_format == "json"
+
+
+def message_to_dict(message) -> dict:
+    """Role, content and tool fields of a request message (dict or SDK object)."""
+    result = {}
+    for field in ("role", "content", "name", "tool_calls", "tool_call_id"):
+        value = message.get(field) if isinstance(message, dict) else getattr(message, field, None)
+        if value is not None:
+            result[field] = value
+    return result
+
+
+def set_conversation_attribute(span: Span, key: str, messages, policy=None):
+    """Record a list of message dicts as one JSON attribute, capping each text content."""
+    # Replacements contain no quotes or backslashes, so the JSON stays valid
+    encoded = redact_content(json_dumps(messages))
+    if policy is not None and policy.max_content_length is not None:
+        if _REDACTOR is not None:
+            # Redact before cutting so a cut cannot split a match; one pass over
+            # the encoded conversation covers tool calls and names as well
+            messages = json_loads(encoded)
+        for message in messages:
+            if isinstance(message.get("content"), str):
+                message["content"] = policy.truncate(message["content"])
+        encoded = json_dumps(messages)
+    logger = _CONTENT_LOGGER
+    if logger is not None:
+        emit_content(logger, span, key, encoded)
+        return
+    limits = _CONTENT_LIMITS
+    if limits is not None:
+        max_chars, max_bytes, budget = _content_allowance(span, limits)
+        original = len(encoded)
+        if len(_fit(encoded, max_chars, max_bytes)) < original:
+            encoded = _shrink_conversation(messages, encoded, max_chars, max_bytes)
+        _record_content(span, budget, key, encoded, original, max_bytes)
+    span.set_attribute(key, encoded)
+
+
+def _shrink_conversation(messages, encoded, max_chars, max_bytes):
+    """
+    Fit the JSON conversation into ``max_chars`` characters and ``max_bytes``
+    UTF-8 bytes while keeping it valid.
+
+    Every text content is cut to an equal share of the space left after the
+    JSON structure; if that still does not fit, the string is cut outright.
+    """
+    texts = [m["content"] for m in messages if isinstance(m.get("content"), str)]
+    if texts:
+        char_share = byte_share = None
+        if max_chars is not None:
+            structure = len(encoded) - sum(len(text) for text in texts)
+            char_share = max(0, max_chars - structure) // len(texts)
+        if max_bytes is not None:
+            structure = _utf8_length(encoded) - sum(_utf8_length(text) for text in texts)
+            byte_share = max(0, max_bytes - structure) // len(texts)
+        shrunk = [
+            {**m, "content": _fit(m["content"], char_share, byte_share)} if isinstance(m.get("content"), str) else m
+            for m in messages
+        ]
+        encoded = json_dumps(shrunk)
+    return _fit(encoded, max_chars, max_bytes)
+
+
+class StreamProgress:
+    """
+    Output a stream has delivered to the caller so far.
+
+    Shared between a stream wrapper and its reaper, so it must never hold a
+    reference back to the wrapper.
+    """
+
+    __slots__ = ("delivered_tokens", "max_tokens")
+
+    def __init__(self, max_tokens=None):
+        self.delivered_tokens = 0
+        self.max_tokens = max_tokens
+
+    def add_text(self, text):
+        # ~4 characters per token; OpenAI deltas are usually exactly one token
+        self.delivered_tokens += max(1, (len(text) + 3) // 4)
+
+
+# Outcomes where the model may have kept generating output nobody read
+_INTERRUPTED_OUTCOMES = (
+    SemanticConventions.GEN_AI_STREAM_OUTCOME_CLOSED_EARLY,
+    SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED,
+    SemanticConventions.GEN_AI_STREAM_OUTCOME_ABANDONED,
+)
+
+
+def end_stream_span(span: Span, outcome: str, progress: StreamProgress = None, output_tokens=None):
+    """
+    Record how a stream ended, then end its span.
+
+    Only completed streams are OK. Streams the caller closed early or
+    abandoned stay UNSET, and cancelled ones are ERROR. For all three, the
+    output the model was still allowed to generate (``max_tokens`` minus what
+    was delivered) is recorded as an upper bound on the waste; the model may
+    have stopped well short of it. ``output_tokens`` is
+    the provider-reported count, when the stream got far enough to send it.
+    """
+    if span.is_recording():
+        span.set_attribute(SemanticConventions.GEN_AI_STREAM_OUTCOME, outcome)
+        if progress is not None:
+            delivered = output_tokens if output_tokens is not None else progress.delivered_tokens
+            span.set_attribute(SemanticConventions.GEN_AI_USAGE_OUTPUT_TOKENS_DELIVERED, delivered)
+            if outcome in _INTERRUPTED_OUTCOMES and progress.max_tokens:
+                span.set_attribute(
+                    SemanticConventions.GEN_AI_USAGE_OUTPUT_TOKENS_WASTED_MAX,
+                    max(0, progress.max_tokens - delivered),
+                )
+    if outcome == SemanticConventions.GEN_AI_STREAM_OUTCOME_COMPLETED:
+        span.set_status(Status(StatusCode.OK))
+    elif outcome == SemanticConventions.GEN_AI_STREAM_OUTCOME_CANCELLED:
+        span.set_status(Status(StatusCode.ERROR, "stream cancelled"))
+    span.end()
+
+
+def reap_span(owner, span: Span, progress: StreamProgress = None) -> weakref.finalize:
+    """
+    End ``span`` as soon as ``owner`` is collected, unless it ended first.
+
+    Stream wrappers use this instead of ``__del__``: the finalizer holds only
+    the span and ``progress``, never the wrapper, so abandoned wrappers stay
+    cheap to collect (including in reference cycles) and their spans end,
+    marked abandoned, when the last reference goes away. Call ``detach()`` on
+    the returned finalizer when the span is ended normally; it returns a
+    falsy value if the span was already ended, which makes it double as the
+    "already finalized" check.
+    """
+    return weakref.finalize(
+        owner, end_stream_span, span, SemanticConventions.GEN_AI_STREAM_OUTCOME_ABANDONED, progress
+    )
+
+
+def get_field(obj, name, default=None):
+    """
+    Read one field from a response object or dict without copying anything.
+
+    Prefer this to response_to_dict() on large responses: model_dump() copies
+    the whole payload (every embedding float, every base64 image) just to
+    read a handful of scalars.
+    """
+    if obj is None:
+        return default
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
 def response_to_dict(response):
     """
     Normalize an LLM response object to a plain dict.
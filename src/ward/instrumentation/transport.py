@@ -0,0 +1,275 @@
+"""
+HTTP-level telemetry for instrumented LLM clients.
+
+The OpenAI and Anthropic SDKs both send requests through an httpx client
+held at ``resource._client._client``. Ward adds one request and one response
+event hook to that client (once per client). While an instrumented call is
+running, an HttpCallRecorder is bound to a context variable; the hooks find
+it there and attach httpx's ``trace`` request extension, which reports
+connection, TLS, header and body phases as they happen. Outside an
+instrumented call the hooks return immediately.
+
+The response hook also keeps a reference to the response headers, so the
+provider's request id, server processing time and rate-limit state are
+recorded without callers having to use ``with_raw_response``.
+
+The SDKs retry 429/5xx responses and connection errors internally; every
+retry goes through the same hooks, so the recorder sees each attempt. The
+span gets the attempt count, each attempt's status code and the time spent
+between attempts (the SDK's backoff sleep), so a slow span can be told
+apart from a rate-limited one.
+
+Usage in a wrapper:
+
+    recorder, token = start_http_recording(instance, is_async=False)
+    try:
+        response = wrapped(*args, **kwargs)
+    finally:
+        stop_http_recording(token)
+        recorder.set_span_attributes(span)
+
+For streamed responses the body is still unread when the call returns, so
+only the phases up to the response headers are recorded.
+"""
+
+import contextvars
+import logging
+import time
+
+from ward.conventions import SemanticConventions
+
+logger = logging.getLogger(__name__)
+
+_CURRENT_RECORDER = contextvars.ContextVar("ward_http_recorder", default=None)
+
+# httpcore trace events (without their "connection."/"http11." prefix) -> HttpAttempt field
+_TRACE_EVENTS = {
+    "connect_tcp.started": "connect_start",
+    "connect_tcp.complete": "connect_end",
+    "connect_unix_socket.started": "connect_start",
+    "connect_unix_socket.complete": "connect_end",
+    "start_tls.started": "tls_start",
+    "start_tls.complete": "tls_end",
+    "send_request_headers.started": "request_start",
+    "receive_response_headers.complete": "headers_end",
+    "receive_response_body.started": "body_start",
+    "receive_response_body.complete": "body_end",
+    "receive_response_body.failed": "body_end",
+}
+
+
+def _seconds_from_ms(value):
+    return float(value) / 1000.0
+
+
+# Response header -> (span attribute, parser). OpenAI sends x-ratelimit-*,
+# Anthropic sends anthropic-ratelimit-*; both map onto the same attributes.
+_RESPONSE_HEADERS = (
+    ("x-request-id", SemanticConventions.GEN_AI_RESPONSE_REQUEST_ID, str),
+    ("request-id", SemanticConventions.GEN_AI_RESPONSE_REQUEST_ID, str),
+    ("openai-processing-ms", SemanticConventions.GEN_AI_SERVER_PROCESSING_DURATION, _seconds_from_ms),
+    ("x-ratelimit-limit-requests", SemanticConventions.GEN_AI_RATELIMIT_REQUESTS_LIMIT, int),
+    ("x-ratelimit-remaining-requests", SemanticConventions.GEN_AI_RATELIMIT_REQUESTS_REMAINING, int),
+    ("x-ratelimit-reset-requests", SemanticConventions.GEN_AI_RATELIMIT_REQUESTS_RESET, str),
+    ("x-ratelimit-limit-tokens", SemanticConventions.GEN_AI_RATELIMIT_TOKENS_LIMIT, int),
+    ("x-ratelimit-remaining-tokens", SemanticConventions.GEN_AI_RATELIMIT_TOKENS_REMAINING, int),
+    ("x-ratelimit-reset-tokens", SemanticConventions.GEN_AI_RATELIMIT_TOKENS_RESET, str),
+    ("anthropic-ratelimit-requests-limit", SemanticConventions.GEN_AI_RATELIMIT_REQUESTS_LIMIT, int),
+    ("anthropic-ratelimit-requests-remaining", SemanticConventions.GEN_AI_RATELIMIT_REQUESTS_REMAINING, int),
+    ("anthropic-ratelimit-requests-reset", SemanticConventions.GEN_AI_RATELIMIT_REQUESTS_RESET, str),
+    ("anthropic-ratelimit-tokens-limit", SemanticConventions.GEN_AI_RATELIMIT_TOKENS_LIMIT, int),
+    ("anthropic-ratelimit-tokens-remaining", SemanticConventions.GEN_AI_RATELIMIT_TOKENS_REMAINING, int),
+    ("anthropic-ratelimit-tokens-reset", SemanticConventions.GEN_AI_RATELIMIT_TOKENS_RESET, str),
+    ("anthropic-ratelimit-input-tokens-remaining", SemanticConventions.GEN_AI_RATELIMIT_INPUT_TOKENS_REMAINING, int),
+    ("anthropic-ratelimit-output-tokens-remaining", SemanticConventions.GEN_AI_RATELIMIT_OUTPUT_TOKENS_REMAINING, int),
+)
+
+
+class HttpAttempt:
+    """Timestamps (perf_counter) for one HTTP request sent by the SDK."""
+
+    __slots__ = (
+        "start", "connect_start", "connect_end", "tls_start", "tls_end",
+        "request_start", "headers_end", "body_start", "body_end", "status_code", "headers", "end",
+    )
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.status_code = None
+        self.headers = None
+        self.end = None
+        self.connect_start = None
+        self.connect_end = None
+        self.tls_start = None
+        self.tls_end = None
+        self.request_start = None
+        self.headers_end = None
+        self.body_start = None
+        self.body_end = None
+
+    def on_trace(self, event, info):
+        field = _TRACE_EVENTS.get(event.partition(".")[2])
+        if field is not None:
+            setattr(self, field, time.perf_counter())
+
+    async def on_trace_async(self, event, info):
+        self.on_trace(event, info)
+
+    def finished_at(self):
+        """Latest timestamp seen for this attempt (response hook or trace event)."""
+        return max(
+            t for t in (
+                self.start, self.connect_end, self.tls_end, self.request_start,
+                self.headers_end, self.body_end, self.end,
+            ) if t is not None
+        )
+
+
+class HttpCallRecorder:
+    """HTTP attempts made during one instrumented LLM call."""
+
+    __slots__ = ("attempts",)
+
+    def __init__(self):
+        self.attempts = []
+
+    def start_attempt(self, request):
+        attempt = HttpAttempt()
+        self.attempts.append(attempt)
+        return attempt
+
+    def finish_attempt(self, response):
+        """Response headers are in; called from the response hook."""
+        if not self.attempts:
+            return
+        attempt = self.attempts[-1]
+        attempt.status_code = response.status_code
+        attempt.headers = response.headers
+        attempt.end = time.perf_counter()
+        if attempt.headers_end is None:
+            # Transports without httpcore tracing (e.g. mocks) only get this
+            attempt.headers_end = attempt.end
+
+    def set_span_attributes(self, span):
+        """
+        Record retries on ``span``, plus the phase timings and provider
+        headers of the last (final) attempt.
+        """
+        if not self.attempts or not span.is_recording():
+            return
+        attempt = self.attempts[-1]
+        first_activity = attempt.connect_start if attempt.connect_start is not None else attempt.request_start
+        _set_duration(span, SemanticConventions.HTTP_CLIENT_POOL_WAIT_DURATION, attempt.start, first_activity)
+        _set_duration(span, SemanticConventions.HTTP_CLIENT_CONNECT_DURATION, attempt.connect_start, attempt.connect_end)
+        _set_duration(span, SemanticConventions.HTTP_CLIENT_TLS_DURATION, attempt.tls_start, attempt.tls_end)
+        _set_duration(span, SemanticConventions.HTTP_CLIENT_TIME_TO_HEADERS, attempt.start, attempt.headers_end)
+        _set_duration(span, SemanticConventions.HTTP_CLIENT_BODY_READ_DURATION, attempt.body_start, attempt.body_end)
+        if attempt.request_start is not None:
+            span.set_attribute(SemanticConventions.HTTP_CLIENT_CONNECTION_REUSED, attempt.connect_start is None)
+        if attempt.headers is not None:
+            _set_header_attributes(span, attempt.headers)
+        self._set_retry_attributes(span)
+
+    def _set_retry_attributes(self, span):
+        attempts = self.attempts
+        span.set_attribute(SemanticConventions.HTTP_CLIENT_ATTEMPT_COUNT, len(attempts))
+        # 0 marks an attempt that failed before any response arrived
+        span.set_attribute(
+            SemanticConventions.HTTP_CLIENT_ATTEMPT_STATUS_CODES,
+            [attempt.status_code or 0 for attempt in attempts],
+        )
+        if len(attempts) < 2:
+            return
+        backoff = sum(
+            max(0.0, current.start - previous.finished_at())
+            for previous, current in zip(attempts, attempts[1:])
+        )
+        span.set_attribute(SemanticConventions.HTTP_REQUEST_RESEND_COUNT, len(attempts) - 1)
+        span.set_attribute(SemanticConventions.HTTP_CLIENT_RETRY_BACKOFF_DURATION, backoff)
+
+
+def _set_duration(span, key, start, end):
+    if start is not None and end is not None:
+        span.set_attribute(key, end - start)
+
+
+def _set_header_attributes(span, headers):
+    for name, key, parse in _RESPONSE_HEADERS:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            span.set_attribute(key, parse(value))
+        except ValueError:
+            logger.debug("Ward: unparseable %s header %r", name, value)
+
+
+def _on_request(request):
+    recorder = _CURRENT_RECORDER.get()
+    if recorder is not None:
+        attempt = recorder.start_attempt(request)
+        request.extensions.setdefault("trace", attempt.on_trace)
+
+
+async def _on_request_async(request):
+    recorder = _CURRENT_RECORDER.get()
+    if recorder is not None:
+        attempt = recorder.start_attempt(request)
+        request.extensions.setdefault("trace", attempt.on_trace_async)
+
+
+def _on_response(response):
+    recorder = _CURRENT_RECORDER.get()
+    if recorder is not None:
+        recorder.finish_attempt(response)
+
+
+async def _on_response_async(response):
+    _on_response(response)
+
+
+def _http_client(instance):
+    """The httpx client behind an SDK resource (``resource._client._client``)."""
+    client = getattr(instance, "_client", None)
+    http_client = getattr(client, "_client", None)
+    if http_client is None or not hasattr(http_client, "event_hooks"):
+        return None
+    return http_client
+
+
+def install_hooks(http_client, is_async):
+    """Add Ward's event hooks to an httpx client, once."""
+    on_request, on_response = (_on_request_async, _on_response_async) if is_async else (_on_request, _on_response)
+    hooks = http_client.event_hooks
+    if on_request in hooks.get("request", ()):
+        return
+    http_client.event_hooks = {
+        "request": [*hooks.get("request", ()), on_request],
+        "response": [*hooks.get("response", ()), on_response],
+    }
+
+
+def start_http_recording(instance, is_async):
+    """
+    Bind a fresh recorder to the current context for one instrumented call.
+
+    Returns ``(recorder, token)``; pass the token to stop_http_recording. The
+    recorder stays empty when the resource has no httpx client to hook.
+    """
+    recorder = HttpCallRecorder()
+    http_client = _http_client(instance)
+    if http_client is not None:
+        try:
+            install_hooks(http_client, is_async)
+        except Exception:
+            logger.debug("Ward: could not hook HTTP client %r", http_client, exc_info=True)
+    return recorder, _CURRENT_RECORDER.set(recorder)
+
+
+def stop_http_recording(token):
+    _CURRENT_RECORDER.reset(token)
+
+
+def http_recording_active() -> bool:
+    """True while an instrumented SDK call is running in this context."""
+    return _CURRENT_RECORDER.get() is not None
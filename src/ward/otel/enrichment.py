@@ -0,0 +1,165 @@
+"""
+Deferred span enrichment for Ward SDK.
+
+Turning a response into span attributes (dumping it, pricing it, copying
+its content) normally happens on the caller's thread before the response is
+returned. With ``ward.init(defer_enrichment=True)`` the chat wrappers skip
+that: they record timing, end the span and register the response processor
+here, keyed by span id. EnrichingSpanExporter runs the processor on the
+export thread, just before the span is encoded, against an EnrichmentSpan
+that collects what it records, and exports a copy of the span with those
+attributes merged in. The response object is kept alive until then.
+
+Only responses are deferred. Request attributes are still recorded inline:
+callers commonly append to the same ``messages`` list after the call.
+
+Deferral needs the exporter: it is only enabled when ward.init() installed
+an EnrichingSpanExporter, and only for sampled spans (others are never
+exported, so their enrichment would never run).
+"""
+
+import threading
+import time
+from typing import Optional
+
+from opentelemetry.attributes import BoundedAttributes
+from opentelemetry.sdk.trace import Event, ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter
+from opentelemetry.trace import Status, StatusCode
+
+# Bound on spans awaiting export. Spans dropped by a full export queue never
+# reach the exporter; the oldest entries are evicted to make room.
+_MAX_PENDING = 8192
+
+_PENDING = {}
+_PENDING_LOCK = threading.Lock()
+_EXPORTER_INSTALLED = False
+_ENABLED = False
+
+
+def set_enrichment_enabled(enabled: bool):
+    """Turn deferral on (only effective once an EnrichingSpanExporter exists) or off."""
+    global _ENABLED
+    _ENABLED = enabled and _EXPORTER_INSTALLED
+
+
+def enrichment_enabled() -> bool:
+    return _ENABLED
+
+
+def defer_enrichment(span, process, **arguments) -> bool:
+    """
+    Run ``process(span=..., **arguments)`` at export time instead of now.
+
+    Returns False when the span will not be exported, in which case the
+    caller processes inline as usual.
+    """
+    context = span.get_span_context()
+    if not context.trace_flags.sampled:
+        return False
+    with _PENDING_LOCK:
+        if len(_PENDING) >= _MAX_PENDING:
+            _PENDING.pop(next(iter(_PENDING)))
+        _PENDING[(context.trace_id, context.span_id)] = (span, process, arguments)
+    return True
+
+
+def pending_count() -> int:
+    return len(_PENDING)
+
+
+class EnrichmentSpan:
+    """
+    Stand-in for an ended span while its deferred processor runs.
+
+    Supports what response processors call on a span and collects the
+    result. ``ended_span`` is the span being enriched; content recorded here
+    shares its size budget (see ward.instrumentation.openai.utils).
+    """
+
+    def __init__(self, ended_span):
+        self.ended_span = ended_span
+        self._context = ended_span.get_span_context()
+        self.attributes = {}
+        self.events = []
+        self.status: Optional[Status] = None
+
+    def is_recording(self) -> bool:
+        return True
+
+    def get_span_context(self):
+        return self._context
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes):
+        self.attributes.update(attributes)
+
+    def set_status(self, status, description=None):
+        self.status = status if isinstance(status, Status) else Status(status, description)
+
+    def add_event(self, name, attributes=None, timestamp=None):
+        self.events.append(Event(name, attributes, timestamp or time.time_ns()))
+
+    def record_exception(self, exception, attributes=None, timestamp=None, escaped=False):
+        self.add_event("exception", {
+            "exception.type": type(exception).__qualname__,
+            "exception.message": str(exception),
+            "exception.escaped": str(escaped),
+            **(attributes or {}),
+        }, timestamp)
+
+
+class EnrichingSpanExporter(SpanExporter):
+    """Run deferred response processing for each span, then hand spans to ``exporter``."""
+
+    def __init__(self, exporter: SpanExporter):
+        global _EXPORTER_INSTALLED
+        self._exporter = exporter
+        _EXPORTER_INSTALLED = True
+
+    def export(self, spans):
+        return self._exporter.export([self._enrich(span) for span in spans])
+
+    def _enrich(self, span):
+        context = span.context
+        with _PENDING_LOCK:
+            entry = _PENDING.pop((context.trace_id, context.span_id), None)
+        if entry is None:
+            return span
+        ended_span, process, arguments = entry
+        stand_in = EnrichmentSpan(ended_span)
+        try:
+            process(span=stand_in, **arguments)
+        except Exception as e:
+            stand_in.record_exception(e)
+            stand_in.set_status(Status(StatusCode.ERROR, str(e)))
+
+        limits = getattr(ended_span, "_limits", None)
+        attributes = BoundedAttributes(
+            maxlen=limits.max_span_attributes if limits is not None else None,
+            attributes={**(span.attributes or {}), **stand_in.attributes},
+            immutable=True,
+            max_value_len=limits.max_span_attribute_length if limits is not None else None,
+        )
+        return ReadableSpan(
+            name=span.name,
+            context=context,
+            parent=span.parent,
+            resource=span.resource,
+            attributes=attributes,
+            events=tuple(span.events) + tuple(stand_in.events),
+            links=span.links,
+            kind=span.kind,
+            status=stand_in.status or span.status,
+            start_time=span.start_time,
+            end_time=span.end_time,
+            instrumentation_scope=span.instrumentation_scope,
+        )
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
+
+    def shutdown(self):
+        self._exporter.shutdown()
@@ -3,16 +3,27 @@ Standalone exporter/processor factories.
 
 Not used by ward.init() (which wires everything in tracer.py), but available
 for advanced users who want to compose their own TracerProvider.
+
+RedactingSpanExporter and RedactingLogExporter are the exception: ward.init()
+wraps its exporters in them when a Redactor is configured with ``defer=True``.
 """
 
 import os
 from typing import Optional
+from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import (
     BatchSpanProcessor,
-    SimpleSpanProcessor,
     ConsoleSpanExporter,
+    SpanExporter,
 )
 
+from ward.otel.processors import ImmediateSpanProcessor
+
+try:
+    from opentelemetry.sdk._logs.export import LogRecordExporter
+except ImportError:  # opentelemetry-sdk < 1.39
+    from opentelemetry.sdk._logs.export import LogExporter as LogRecordExporter
+
 if os.environ.get("OTEL_EXPORTER_OTLP_PROTOCOL") == "grpc":
     from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 else:
@@ -35,6 +46,89 @@ def create_console_exporter() -> ConsoleSpanExporter:
 
 
 def create_span_processor(exporter, use_batch: bool = True):
-    """Wrap an exporter in a Batch or Simple processor."""
-    return BatchSpanProcessor(exporter) if use_batch else SimpleSpanProcessor(exporter)
+    """Wrap an exporter in a Batch or Immediate processor (both export off-thread)."""
+    return BatchSpanProcessor(exporter) if use_batch else ImmediateSpanProcessor(exporter)
+
+
+
+class RedactingSpanExporter(SpanExporter):
+    """
+    Redact captured content on the export thread, then hand spans to ``exporter``.
+
+    Batch and Immediate processors call export() from their worker thread,
+    so redaction costs the application nothing. Spans without content pass
+    through as they are, as does everything once the redactor is cleared.
+    """
+
+    def __init__(self, exporter: SpanExporter, redactor):
+        self._exporter = exporter
+        self._redactor = redactor
+
+    def set_redactor(self, redactor):
+        """Redact with ``redactor`` from the next export on (None: pass spans through)."""
+        self._redactor = redactor
+
+    def export(self, spans):
+        if self._redactor is None:
+            return self._exporter.export(spans)
+        return self._exporter.export([self._redact(span) for span in spans])
+
+    def _redact(self, span):
+        attributes = self._redactor.redact_attributes(span.attributes or {})
+        if attributes is None:
+            return span
+        return ReadableSpan(
+            name=span.name,
+            context=span.context,
+            parent=span.parent,
+            resource=span.resource,
+            attributes=attributes,
+            events=span.events,
+            links=span.links,
+            kind=span.kind,
+            status=span.status,
+            start_time=span.start_time,
+            end_time=span.end_time,
+            instrumentation_scope=span.instrumentation_scope,
+        )
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
+
+    def shutdown(self):
+        self._exporter.shutdown()
+
+
+class RedactingLogExporter(LogRecordExporter):
+    """
+    Redact content-log record bodies on the export thread, then hand them to ``exporter``.
+
+    The log counterpart of RedactingSpanExporter, for ``content_logs=True``.
+    Bodies are redacted in place: exported records are not used afterwards.
+    """
+
+    def __init__(self, exporter, redactor):
+        self._exporter = exporter
+        self._redactor = redactor
+
+    def set_redactor(self, redactor):
+        """Redact with ``redactor`` from the next export on (None: pass records through)."""
+        self._redactor = redactor
+
+    def export(self, batch):
+        if self._redactor is None:
+            return self._exporter.export(batch)
+        for record in batch:
+            log_record = record.log_record
+            body = log_record.body
+            if isinstance(body, str):
+                log_record.body = self._redactor.redact(body)
+            elif isinstance(body, (list, tuple)):
+                log_record.body = [self._redactor.redact(item) if isinstance(item, str) else item for item in body]
+        return self._exporter.export(batch)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
 
+    def shutdown(self):
+        self._exporter.shutdown()
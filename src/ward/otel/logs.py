@@ -0,0 +1,82 @@
+"""
+Content-log pipeline for Ward SDK.
+
+Captured prompts and completions make spans large, and spans are the most
+expensive signal to store. With ``ward.init(content_logs=True)`` the
+wrappers send content as OTel log records instead, through a LoggerProvider
+of their own: separate batching and queue, and a separate instrumentation
+scope (``ward.content``) that the collector can route to a cheaper table
+with a shorter TTL. Spans keep only metadata.
+
+Every record carries the trace and span id of the LLM span it belongs to,
+and ``ward.content.attribute``: the span attribute the content would
+otherwise have been recorded under (``gen_ai.user.message.0``,
+``gen_ai.prompt``, ...).
+
+The exporter reads the usual OTLP settings, so ``OTEL_EXPORTER_OTLP_ENDPOINT``
+sends logs to ``/v1/logs`` on the same collector and
+``OTEL_EXPORTER_OTLP_LOGS_ENDPOINT`` can point them elsewhere.
+"""
+
+import os
+from typing import Optional
+
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+
+from ward.otel.exporters import RedactingLogExporter
+from ward.otel.tracer import _register_fork_handlers, build_resource
+
+try:
+    from opentelemetry.sdk._logs.export import ConsoleLogRecordExporter
+except ImportError:  # opentelemetry-sdk < 1.39
+    from opentelemetry.sdk._logs.export import ConsoleLogExporter as ConsoleLogRecordExporter
+
+if os.environ.get("OTEL_EXPORTER_OTLP_PROTOCOL") == "grpc":
+    from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+else:
+    from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
+
+CONTENT_LOGGER_NAME = "ward.content"
+
+_LOGGER_PROVIDER = None  # created at most once, like the TracerProvider
+_REDACTING_EXPORTER = None  # RedactingLogExporter installed with the provider, if any
+
+
+def setup_content_logs(
+    application_name: Optional[str] = None,
+    environment: Optional[str] = None,
+    redactor=None,
+):
+    """
+    Create the content LoggerProvider (once) and return its ``ward.content`` logger.
+
+    Call after setup_tracing(), which forwards the OTLP endpoint and headers
+    into the environment. Without an endpoint, records go to the console.
+    The provider is not installed globally, so the application's own
+    logging setup is left alone. A ``redactor`` with ``defer=True`` redacts
+    record bodies on the export thread.
+    """
+    global _LOGGER_PROVIDER, _REDACTING_EXPORTER
+
+    if _LOGGER_PROVIDER is None:
+        if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT") or os.getenv("OTEL_EXPORTER_OTLP_LOGS_ENDPOINT"):
+            exporter = OTLPLogExporter()
+            _register_fork_handlers(exporter)
+        else:
+            exporter = ConsoleLogRecordExporter()
+        if redactor is not None and redactor.defer:
+            exporter = _REDACTING_EXPORTER = RedactingLogExporter(exporter, redactor)
+        provider = LoggerProvider(resource=build_resource(application_name, environment))
+        provider.add_log_record_processor(BatchLogRecordProcessor(exporter))
+        _LOGGER_PROVIDER = provider
+
+    return _LOGGER_PROVIDER.get_logger(CONTENT_LOGGER_NAME)
+
+
+def set_export_redactor(redactor) -> bool:
+    """The content-log counterpart of ward.otel.tracer.set_export_redactor()."""
+    if _REDACTING_EXPORTER is None:
+        return False
+    _REDACTING_EXPORTER.set_redactor(redactor)
+    return True
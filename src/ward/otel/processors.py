@@ -0,0 +1,223 @@
+"""
+Span processors used by Ward SDK.
+
+ImmediateSpanProcessor is the low-latency alternative to SimpleSpanProcessor:
+spans are handed to a background worker that exports them as soon as they
+arrive, so the application thread never waits on the network.
+
+ErrorAdmittingSpanProcessor sits in front of an export processor and lets
+error spans through even when the sampler only recorded them (see
+ward.otel.sampling.RateLimitingSampler).
+"""
+
+import collections
+import logging
+import os
+import threading
+import time
+import weakref
+
+from opentelemetry.context import (
+    _SUPPRESS_INSTRUMENTATION_KEY,
+    attach,
+    detach,
+    set_value,
+)
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+from opentelemetry.trace import SpanContext, StatusCode, TraceFlags
+
+from ward.conventions import SemanticConventions
+
+logger = logging.getLogger(__name__)
+
+
+class ImmediateSpanProcessor(SpanProcessor):
+    """
+    Export each finished span within tens of milliseconds, off the application thread.
+
+    Unlike BatchSpanProcessor there is no schedule delay: the worker wakes as
+    soon as a span ends, waits ``coalesce_millis`` for the rest of the burst,
+    and exports whatever is queued in one request (up to
+    ``max_export_batch_size`` spans). Exporting span by span would have the
+    worker encoding and sending, and holding the GIL, on nearly every call
+    the application makes. Unlike SimpleSpanProcessor,
+    ``on_end`` only appends to a bounded queue — a slow or unreachable
+    collector costs the caller nothing. When the queue is full, new spans are
+    dropped and counted in ``dropped_spans``.
+
+    Fork-safe: in a forked child the worker thread, lock and queue are
+    re-created and spans queued by the parent are discarded (the parent still
+    exports them), so every span is exported exactly once.
+    """
+
+    def __init__(
+        self,
+        span_exporter,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 512,
+        export_timeout_millis: float = 30000,
+        coalesce_millis: float = 20,
+    ):
+        self._exporter = span_exporter
+        self._max_queue_size = max_queue_size
+        self._max_export_batch_size = max_export_batch_size
+        self._export_timeout_millis = export_timeout_millis
+        self._coalesce_delay = coalesce_millis / 1000
+        self._queue = collections.deque()
+        self._condition = threading.Condition(threading.Lock())
+        self._exporting = False
+        self._shutdown = False
+        self.dropped_spans = 0
+        self._worker = self._start_worker()
+        if hasattr(os, "register_at_fork"):
+            weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
+
+            def _after_in_child():
+                reinit = weak_reinit()
+                if reinit is not None:
+                    reinit()
+
+            os.register_at_fork(after_in_child=_after_in_child)
+
+    def _start_worker(self):
+        worker = threading.Thread(name="WardImmediateSpanProcessor", target=self._run, daemon=True)
+        worker.start()
+        return worker
+
+    def _at_fork_reinit(self):
+        # The parent's worker thread does not exist in the child and its lock
+        # may have been held mid-fork; queued spans belong to the parent.
+        self._condition = threading.Condition(threading.Lock())
+        self._queue = collections.deque()
+        self._exporting = False
+        if not self._shutdown:
+            self._worker = self._start_worker()
+
+    def on_start(self, span, parent_context=None):
+        pass
+
+    def on_end(self, span):
+        if self._shutdown or not span.context.trace_flags.sampled:
+            return
+        # The bound check, append and drop count must not interleave with
+        # other threads ending spans; the lock is held for nothing else
+        with self._condition:
+            if len(self._queue) >= self._max_queue_size:
+                self.dropped_spans += 1
+                return
+            self._queue.append(span)
+            # Wake the worker for the first span of a burst or a full batch;
+            # in between it is coalescing or exporting and will find the rest
+            queued = len(self._queue)
+            if queued == 1 or queued >= self._max_export_batch_size:
+                self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                if len(self._queue) < self._max_export_batch_size and not self._shutdown:
+                    # Cut short by a full batch, force_flush() or shutdown()
+                    self._condition.wait(self._coalesce_delay)
+                self._exporting = True
+            try:
+                self._export_batch()
+            finally:
+                with self._condition:
+                    self._exporting = False
+                    self._condition.notify_all()
+
+    def _export_batch(self):
+        batch = []
+        while self._queue and len(batch) < self._max_export_batch_size:
+            batch.append(self._queue.popleft())
+        # Keep instrumented HTTP clients from tracing the exporter's own requests
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        try:
+            self._exporter.export(batch)
+        except Exception:
+            logger.exception("Exception while exporting spans.")
+        finally:
+            detach(token)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Block until every queued span has been handed to the exporter."""
+        deadline = time.monotonic() + timeout_millis / 1000
+        with self._condition:
+            self._condition.notify_all()
+            while self._queue or self._exporting:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._worker.is_alive():
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def shutdown(self):
+        if self._shutdown:
+            return
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        self._worker.join(self._export_timeout_millis / 1000)
+        self._exporter.shutdown()
+
+
+class ErrorAdmittingSpanProcessor(SpanProcessor):
+    """
+    Forward spans to ``processor``, promoting unsampled error spans.
+
+    A span the sampler recorded but did not sample (RECORD_ONLY) is normally
+    never exported. If it ends with an ERROR status, a sampled copy is
+    forwarded instead, marked with ``ward.sampling.error_admitted`` and a
+    sampling probability of 1 (it was kept for its error, not by chance).
+    Everything else passes through unchanged.
+    """
+
+    def __init__(self, processor: SpanProcessor):
+        self._processor = processor
+
+    def on_start(self, span, parent_context=None):
+        self._processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span):
+        if not span.context.trace_flags.sampled:
+            if span.status.status_code is not StatusCode.ERROR:
+                return
+            span = _sampled_copy(span)
+        self._processor.on_end(span)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._processor.force_flush(timeout_millis)
+
+    def shutdown(self):
+        self._processor.shutdown()
+
+
+def _sampled_copy(span):
+    context = span.context
+    attributes = dict(span.attributes or {})
+    attributes[SemanticConventions.WARD_SAMPLING_PROBABILITY] = 1.0
+    attributes[SemanticConventions.WARD_SAMPLING_ERROR_ADMITTED] = True
+    return ReadableSpan(
+        name=span.name,
+        context=SpanContext(
+            context.trace_id,
+            context.span_id,
+            context.is_remote,
+            TraceFlags(context.trace_flags | TraceFlags.SAMPLED),
+            context.trace_state,
+        ),
+        parent=span.parent,
+        resource=span.resource,
+        attributes=attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
@@ -0,0 +1,173 @@
+"""
+Rate-limited sampling for Ward SDK.
+
+Percentage sampling scales with traffic: a retry storm at 10x traffic sends
+10x the spans. RateLimitingSampler caps recorded spans per second instead,
+globally and per ``(gen_ai.system, gen_ai.request.model,
+gen_ai.operation.type)`` key, using one token bucket per key.
+
+Admission is probabilistic rather than first-come: each bucket tracks how
+many spans were offered in the previous second and admits with probability
+``rate / offered_rate``, so kept spans are spread across the second and
+``1 / ward.sampling.probability`` is an unbiased weight for re-counting them
+downstream. The token bucket still enforces the hard cap while a sudden
+spike is being measured.
+
+Spans over the cap are not dropped outright: they are kept as RECORD_ONLY
+(recorded, not exported) so that ErrorAdmittingSpanProcessor can still
+export the ones that end with an error. The instrumentations treat them like
+dropped spans apart from that: no attributes, content, HTTP phases or stream
+wrapping, only the exception or error status, so a call over the cap costs
+about as much as a sampled-out one. Pass ``admit_errors=False`` to drop
+them instead and skip recording entirely.
+
+    from ward.otel.sampling import RateLimitingSampler
+
+    ward.init(sampler=RateLimitingSampler(spans_per_second=200, per_key_spans_per_second=20))
+"""
+
+import random
+import threading
+import time
+from typing import Optional
+
+from opentelemetry.sdk.trace.sampling import Decision, Sampler, SamplingResult
+from opentelemetry.trace import get_current_span
+
+from ward.conventions import SemanticConventions
+
+_MAX_KEYS = 1024  # bound per-key state against unbounded model names
+_WINDOW_SECONDS = 1.0
+
+
+class _Bucket:
+    """Token bucket plus the offered rate measured over the previous window."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated", "window_start", "offered", "offered_rate", "lock")
+
+    def __init__(self, rate: float, burst: float):
+        now = time.monotonic()
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = now
+        self.window_start = now
+        self.offered = 0
+        self.offered_rate = None
+        self.lock = threading.Lock()
+
+    def admit(self, draw: float):
+        """
+        Offer one span; return ``(admitted, probability)``.
+
+        ``draw`` is a uniform random number shared across the buckets a span
+        passes through, so probabilities multiply.
+        """
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.window_start
+            if elapsed >= _WINDOW_SECONDS:
+                self.offered_rate = self.offered / elapsed
+                self.window_start = now
+                self.offered = 0
+            self.offered += 1
+
+            offered_rate = self.offered_rate
+            probability = 1.0 if not offered_rate or offered_rate <= self.rate else self.rate / offered_rate
+            if draw >= probability:
+                return False, probability
+
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1.0:
+                return False, probability
+            self.tokens -= 1.0
+            return True, probability
+
+
+class RateLimitingSampler(Sampler):
+    """
+    Cap recorded spans per second, globally and per (system, model, operation).
+
+    Every span passes the global bucket; spans that carry ``gen_ai.system`` at
+    start (all Ward LLM spans) also pass the bucket for their key. Either
+    limit may be None to disable it. Kept spans get
+    ``ward.sampling.probability``.
+    """
+
+    def __init__(
+        self,
+        spans_per_second: Optional[float] = 100.0,
+        per_key_spans_per_second: Optional[float] = None,
+        burst_seconds: float = 1.0,
+        admit_errors: bool = True,
+    ):
+        for name, value in (("spans_per_second", spans_per_second),
+                            ("per_key_spans_per_second", per_key_spans_per_second)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be > 0, got {value}")
+        if burst_seconds <= 0:
+            raise ValueError(f"burst_seconds must be > 0, got {burst_seconds}")
+        self._per_key_rate = per_key_spans_per_second
+        self._burst_seconds = burst_seconds
+        self._global = self._new_bucket(spans_per_second) if spans_per_second is not None else None
+        self._keys = {}
+        self._keys_lock = threading.Lock()
+        self._dropped = Decision.RECORD_ONLY if admit_errors else Decision.DROP
+        self._description = (
+            f"RateLimitingSampler{{global={spans_per_second}/s, per_key={per_key_spans_per_second}/s}}"
+        )
+
+    def _new_bucket(self, rate):
+        return _Bucket(rate, max(1.0, rate * self._burst_seconds))
+
+    def _key_bucket(self, attributes):
+        system = attributes.get(SemanticConventions.GEN_AI_SYSTEM) if attributes else None
+        if system is None or self._per_key_rate is None:
+            return None
+        key = (
+            system,
+            attributes.get(SemanticConventions.GEN_AI_REQUEST_MODEL),
+            attributes.get(SemanticConventions.GEN_AI_OPERATION_TYPE),
+        )
+        bucket = self._keys.get(key)
+        if bucket is None:
+            with self._keys_lock:
+                bucket = self._keys.get(key)
+                if bucket is None:
+                    # Past the bound, unseen keys share one overflow bucket
+                    if len(self._keys) >= _MAX_KEYS:
+                        key = None
+                        bucket = self._keys.get(None)
+                    if bucket is None:
+                        bucket = self._keys[key] = self._new_bucket(self._per_key_rate)
+        return bucket
+
+    def should_sample(
+        self,
+        parent_context,
+        trace_id,
+        name,
+        kind=None,
+        attributes=None,
+        links=None,
+        trace_state=None,
+    ):
+        parent_trace_state = get_current_span(parent_context).get_span_context().trace_state
+        draw = random.random()
+        probability = 1.0
+        for bucket in (self._key_bucket(attributes), self._global):
+            if bucket is None:
+                continue
+            admitted, bucket_probability = bucket.admit(draw / probability)
+            probability *= bucket_probability
+            if not admitted:
+                return SamplingResult(self._dropped, None, parent_trace_state)
+        return SamplingResult(
+            Decision.RECORD_AND_SAMPLE,
+            {SemanticConventions.WARD_SAMPLING_PROBABILITY: probability},
+            parent_trace_state,
+        )
+
+    def get_description(self) -> str:
+        return self._description
@@ -2,10 +2,13 @@
 OpenTelemetry TracerProvider bootstrap for Ward SDK.
 
 Configures the global TracerProvider once, choosing between OTLP and console
-export based on whether an endpoint is provided.
+export based on whether an endpoint is provided. Export always happens off the
+application thread: BatchSpanProcessor by default, ImmediateSpanProcessor when
+batching is disabled or spans go to the console.
 """
 
 import os
+import weakref
 from typing import Optional
 from opentelemetry import trace
 from opentelemetry.sdk.resources import (
@@ -14,10 +17,14 @@ from opentelemetry.sdk.resources import (
     DEPLOYMENT_ENVIRONMENT,
     Resource,
 )
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+from opentelemetry.sdk.trace import SpanLimits, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.sdk.trace.export import ConsoleSpanExporter
 
+from ward.otel.enrichment import EnrichingSpanExporter
+from ward.otel.exporters import RedactingSpanExporter
+from ward.otel.processors import ErrorAdmittingSpanProcessor, ImmediateSpanProcessor
+
 # Protocol-aware import — must happen at module load so the exporter class is ready
 if os.environ.get("OTEL_EXPORTER_OTLP_PROTOCOL") == "grpc":
     from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
@@ -25,6 +32,63 @@ else:
     from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
 _TRACER_SET = False  # ensures TracerProvider is configured at most once
+_REDACTING_EXPORTER = None  # RedactingSpanExporter installed with the provider, if any
+
+
+def _reset_exporter_session(exporter):
+    """
+    Give an OTLP/HTTP exporter a fresh requests.Session.
+
+    A session inherited across fork() shares pooled sockets with the parent.
+    The old session is abandoned rather than closed: its pool lock may have
+    been held by the parent's export thread at fork time.
+    """
+    try:
+        import requests
+    except ImportError:  # gRPC-only installs have no HTTP session to reset
+        return
+
+    # Older exporters hold the session directly; newer ones behind a transport
+    client = getattr(exporter, "_client", None)
+    for holder in (exporter, getattr(client, "_transport", None)):
+        session = getattr(holder, "_session", None)
+        if isinstance(session, requests.Session):
+            fresh = requests.Session()
+            fresh.headers.update(session.headers)
+            fresh.verify = session.verify
+            fresh.cert = session.cert
+            fresh.proxies = dict(session.proxies)
+            fresh.auth = session.auth
+            holder._session = fresh
+
+
+def _register_fork_handlers(exporter):
+    """
+    Make ``exporter`` usable in prefork children (gunicorn, uwsgi).
+
+    Batch/Immediate processors re-create their worker thread and queue on
+    their own; this covers the exporter's HTTP connection pool.
+    """
+    if not hasattr(os, "register_at_fork"):
+        return
+    weak_exporter = weakref.ref(exporter)
+
+    def _after_in_child():
+        exporter = weak_exporter()
+        if exporter is not None:
+            _reset_exporter_session(exporter)
+
+    os.register_at_fork(after_in_child=_after_in_child)
+
+
+def build_resource(application_name: Optional[str] = None, environment: Optional[str] = None) -> Resource:
+    """Resource shared by Ward's tracer and content-log providers."""
+    resource_attributes = {TELEMETRY_SDK_NAME: "ward"}
+    if application_name:
+        resource_attributes[SERVICE_NAME] = application_name
+    if environment:
+        resource_attributes[DEPLOYMENT_ENVIRONMENT] = environment
+    return Resource.create(attributes=resource_attributes)
 
 
 def setup_tracing(
@@ -34,6 +98,10 @@ def setup_tracing(
     otlp_endpoint: Optional[str] = None,
     otlp_headers: Optional[dict] = None,
     disable_batch: bool = False,
+    sampler=None,
+    span_limits: Optional[SpanLimits] = None,
+    redactor=None,
+    defer_enrichment: bool = False,
 ) -> Optional[trace.Tracer]:
     """
     Bootstrap the OTel TracerProvider and return a tracer.
@@ -41,25 +109,32 @@ def setup_tracing(
     Pass an existing ``tracer`` to skip setup entirely (useful for testing).
     If no OTLP endpoint is provided, falls back to ConsoleSpanExporter so
     spans are still visible during local development.
+
+    ``disable_batch`` trades batching for freshness: each span is exported
+    within tens of milliseconds by a background worker instead of waiting for
+    the next batch; spans that end together share one request.
+
+    ``sampler`` replaces the SDK's default sampler. Spans it records without
+    sampling are still exported when they end with an error. ``span_limits``
+    caps attribute count and length for every span the provider creates.
+
+    A ``redactor`` with ``defer=True`` redacts captured content in the
+    exporter, on the export thread. ``defer_enrichment`` installs an
+    EnrichingSpanExporter in front of everything else, which runs deferred
+    response processing before spans are redacted and encoded.
     """
     if tracer is not None:
         return tracer
 
-    global _TRACER_SET
+    global _TRACER_SET, _REDACTING_EXPORTER
 
     try:
         # Prevent Haystack's auto-tracer from conflicting
         os.environ["HAYSTACK_AUTO_TRACE_ENABLED"] = "false"
 
         if not _TRACER_SET:
-            resource_attributes = {TELEMETRY_SDK_NAME: "ward"}
-            if application_name:
-                resource_attributes[SERVICE_NAME] = application_name
-            if environment:
-                resource_attributes[DEPLOYMENT_ENVIRONMENT] = environment
-
-            resource = Resource.create(attributes=resource_attributes)
-            trace.set_tracer_provider(TracerProvider(resource=resource))
+            resource = build_resource(application_name, environment)
+            trace.set_tracer_provider(TracerProvider(resource=resource, sampler=sampler, span_limits=span_limits))
 
             # Forward caller-supplied endpoint/headers into env for OTLPSpanExporter
             if otlp_endpoint is not None:
@@ -73,10 +148,18 @@ def setup_tracing(
 
             if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
                 exporter = OTLPSpanExporter()
-                processor = BatchSpanProcessor(exporter) if not disable_batch else SimpleSpanProcessor(exporter)
+                _register_fork_handlers(exporter)
             else:
                 # No endpoint → print spans to stdout (useful for debugging)
-                processor = SimpleSpanProcessor(ConsoleSpanExporter())
+                exporter = ConsoleSpanExporter()
+                disable_batch = True
+            if redactor is not None and redactor.defer:
+                exporter = _REDACTING_EXPORTER = RedactingSpanExporter(exporter, redactor)
+            if defer_enrichment:
+                exporter = EnrichingSpanExporter(exporter)
+            processor = BatchSpanProcessor(exporter) if not disable_batch else ImmediateSpanProcessor(exporter)
+            if sampler is not None:
+                processor = ErrorAdmittingSpanProcessor(processor)
 
             trace.get_tracer_provider().add_span_processor(processor)
             _TRACER_SET = True
@@ -87,6 +170,19 @@ def setup_tracing(
         return None
 
 
+def set_export_redactor(redactor) -> bool:
+    """
+    Point the span exporter's deferred redaction at ``redactor`` (None: off).
+
+    Returns False when setup_tracing() installed no RedactingSpanExporter;
+    the provider is only built once, so content must then be redacted inline.
+    """
+    if _REDACTING_EXPORTER is None:
+        return False
+    _REDACTING_EXPORTER.set_redactor(redactor)
+    return True
+
+
 def get_tracer(name: Optional[str] = None) -> trace.Tracer:
     """Convenience accessor for a named tracer (defaults to this module)."""
     return trace.get_tracer(name or __name__)
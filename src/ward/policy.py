@@ -0,0 +1,335 @@
+"""
+Runtime sampling and content-capture policy.
+
+Wrappers read the current policy on every call, so sample rates and content
+capture can change without a redeploy: load the policy from a JSON file that
+is watched for changes, and re-read on SIGHUP too (unless the application
+already handles SIGHUP; see install_reload_signal). A new policy is swapped in
+with a single reference assignment, so the hot path never takes a lock.
+
+Policy file format (every key optional):
+
+    {
+      "sample_rate": 1.0,
+      "capture_message_content": true,
+      "content_sample_rate": 0.02,
+      "max_content_length": 4096,
+      "content_format": "attributes",
+      "operations": {
+        "embeddings": {"content_sample_rate": 0.0}
+      },
+      "models": {
+        "gpt-4o-mini": {"sample_rate": 0.1},
+        "claude-*": {"capture_message_content": false}
+      }
+    }
+
+Model keys are exact names or fnmatch patterns; an exact match wins.
+Operation keys are operation types ("chat", "embeddings", "image", ...).
+When both apply, model overrides win over operation overrides. Every
+override is validated when the file is loaded; one bad value rejects the
+whole file.
+
+``sample_rate`` decides whether a call gets a span at all.
+``content_sample_rate`` decides, among spans that capture content, which
+ones keep the prompt and response text. It is derived from the upper half
+of the trace id, so every span of a trace makes the same decision, and it is
+independent of TraceIdRatioBased sampling, which reads the lower half.
+
+``content_format`` chooses how captured text is laid out: "attributes" (one
+attribute per message, ``gen_ai.user.message.0`` ...) or "json" (the whole
+input conversation in ``gen_ai.prompt`` and the output in
+``gen_ai.output_messages``, one JSON string each).
+"""
+
+import json
+import logging
+import os
+import random
+import signal
+import threading
+import weakref
+from fnmatch import fnmatchcase
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_POLICY_FIELDS = (
+    "sample_rate", "capture_message_content", "content_sample_rate", "max_content_length", "content_format",
+)
+_CONTENT_FORMATS = ("attributes", "json")
+_MAX_RESOLVED_MODELS = 256  # bound the per-policy model cache against unbounded model names
+# Content sampling reads the high 64 bits of the trace id: TraceIdRatioBased
+# decides on the low 64, and the two decisions must be independent.
+_TRACE_ID_HIGH_RANGE = 1 << 64
+
+
+class Policy:
+    """
+    Immutable sampling and capture settings.
+
+    ``capture_message_content=None`` defers to the instrumentor's own setting
+    (the ``capture_message_content`` argument of ``ward.init``).
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        capture_message_content: Optional[bool] = None,
+        content_sample_rate: float = 1.0,
+        max_content_length: Optional[int] = None,
+        models: Optional[dict] = None,
+        operations: Optional[dict] = None,
+        content_format: str = "attributes",
+    ):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        if not 0.0 <= content_sample_rate <= 1.0:
+            raise ValueError(f"content_sample_rate must be between 0 and 1, got {content_sample_rate}")
+        if content_format not in _CONTENT_FORMATS:
+            raise ValueError(f"content_format must be one of {_CONTENT_FORMATS}, got {content_format!r}")
+        if max_content_length is not None and max_content_length < 0:
+            raise ValueError(f"max_content_length must be >= 0, got {max_content_length}")
+        self.sample_rate = sample_rate
+        self.capture_message_content = capture_message_content
+        self.content_sample_rate = content_sample_rate
+        # Traces whose upper 64 bits fall below this bound keep their content
+        self._content_bound = round(content_sample_rate * _TRACE_ID_HIGH_RANGE)
+        self.max_content_length = max_content_length
+        self.content_format = content_format
+        self.models = _validated_overrides("model", models, self)
+        self.operations = _validated_overrides("operation", operations, self)
+        self._resolved = {}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Policy":
+        if not isinstance(data, dict):
+            raise ValueError(f"Policy must be a JSON object, got {type(data).__name__}")
+        unknown = set(data) - set(_POLICY_FIELDS) - {"models", "operations"}
+        if unknown:
+            raise ValueError(f"Unknown policy keys: {sorted(unknown)}")
+        return cls(**data)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Policy":
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def for_model(self, model, operation=None) -> "Policy":
+        """Policy with the overrides for ``operation`` and ``model`` applied (cached)."""
+        if not self.models and not self.operations:
+            return self
+        key = (model, operation)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            try:
+                resolved = self._resolve(model, operation)
+            except Exception as e:
+                # Overrides are validated on load; never let a policy problem fail the call
+                logger.warning("Ward: using base policy for %s %s: %s", operation, model, e)
+                resolved = self
+            if len(self._resolved) < _MAX_RESOLVED_MODELS:
+                self._resolved[key] = resolved
+        return resolved
+
+    def _resolve(self, model, operation):
+        overrides = self.models.get(model)
+        if overrides is None:
+            overrides = next(
+                (o for pattern, o in self.models.items() if fnmatchcase(str(model), pattern)),
+                None,
+            )
+        operation_overrides = self.operations.get(operation)
+        if not overrides and not operation_overrides:
+            return self
+        fields = {name: getattr(self, name) for name in _POLICY_FIELDS}
+        fields.update(operation_overrides or {})
+        fields.update(overrides or {})
+        return Policy(**fields)
+
+    def sampled(self) -> bool:
+        """Decide whether to instrument this call at all."""
+        rate = self.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def capture_content(self, default: bool, span=None) -> bool:
+        """
+        Whether this call records prompt and response text.
+
+        With a ``span``, ``content_sample_rate`` applies too; the decision
+        comes from the span's trace id, so all spans of a trace agree.
+        """
+        capture = default if self.capture_message_content is None else self.capture_message_content
+        if not capture or self.content_sample_rate >= 1.0 or span is None:
+            return capture
+        trace_id = span.get_span_context().trace_id
+        return (trace_id >> 64) < self._content_bound
+
+    def truncate(self, text: str) -> str:
+        limit = self.max_content_length
+        if limit is not None and len(text) > limit:
+            return text[:limit]
+        return text
+
+
+def _validated_overrides(kind, overrides, base):
+    """Check each override by building it over ``base``, so a bad value fails the whole policy up front."""
+    if overrides is None:
+        return {}
+    if not isinstance(overrides, dict):
+        raise ValueError(f"{kind} overrides must be an object mapping names to settings, got {overrides!r}")
+    validated = {}
+    for name, fields in overrides.items():
+        if not isinstance(fields, dict):
+            raise ValueError(f"Policy for {kind} '{name}' must be an object, got {fields!r}")
+        unknown = set(fields) - set(_POLICY_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown policy keys for {kind} '{name}': {sorted(unknown)}")
+        merged = {field: getattr(base, field) for field in _POLICY_FIELDS}
+        merged.update(fields)
+        try:
+            Policy(**merged)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid policy for {kind} '{name}': {e}") from None
+        validated[name] = dict(fields)
+    return validated
+
+
+_POLICY = Policy()
+
+
+def get_policy() -> Policy:
+    """Current policy; safe to call on every instrumented request."""
+    return _POLICY
+
+
+def set_policy(policy: Policy):
+    """Atomically replace the current policy."""
+    global _POLICY
+    _POLICY = policy
+
+
+def load_policy(path: str) -> bool:
+    """
+    Load ``path`` and make it the current policy.
+
+    An unreadable or invalid file is logged and the current policy kept, so a
+    bad edit never takes telemetry down. Returns True if the policy changed.
+    """
+    try:
+        policy = Policy.from_file(path)
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("Ward: keeping current policy, failed to load %s: %s", path, e)
+        return False
+    set_policy(policy)
+    return True
+
+
+class PolicyFileWatcher:
+    """
+    Reloads a policy file whenever its modification time changes.
+
+    request_reload() asks for a reload on the next check even if the file
+    looks unchanged; it only sets a flag, so it is safe in a signal handler.
+    """
+
+    def __init__(self, path: str, interval: float = 1.0):
+        self.path = path
+        self.interval = interval
+        self._mtime = None
+        self._reload_requested = False
+        self._stop = threading.Event()
+        self._thread = None
+        if hasattr(os, "register_at_fork"):
+            weak_restart = weakref.WeakMethod(self._at_fork_restart)
+
+            def _after_in_child():
+                restart = weak_restart()
+                if restart is not None:
+                    restart()
+
+            os.register_at_fork(after_in_child=_after_in_child)
+
+    def start(self):
+        self.check()
+        self._thread = threading.Thread(name="WardPolicyWatcher", target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def request_reload(self):
+        self._reload_requested = True
+
+    def check(self) -> bool:
+        """Reload now if the file changed since the last check, or a reload was requested."""
+        requested, self._reload_requested = self._reload_requested, False
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self._mtime and not requested:
+            return False
+        self._mtime = mtime
+        return load_policy(self.path)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def _at_fork_restart(self):
+        # Threads do not survive fork(); prefork children need their own watcher
+        if self._thread is not None and not self._stop.is_set():
+            self._stop = threading.Event()
+            self._thread = threading.Thread(name="WardPolicyWatcher", target=self._run, daemon=True)
+            self._thread.start()
+
+
+class _ReloadSignalHandler:
+    """Flags a reload on ``watcher``, then calls the handler it was installed over."""
+
+    def __init__(self, watcher, previous):
+        self.watcher = watcher
+        self.previous = previous
+
+    def __call__(self, signum, frame):
+        self.watcher.request_reload()
+        if callable(self.previous):
+            self.previous(signum, frame)
+
+
+def install_reload_signal(
+    watcher: PolicyFileWatcher, signum: Optional[int] = None, chain: bool = False,
+) -> bool:
+    """
+    Have ``watcher`` reload its file when the process receives ``signum`` (SIGHUP by default).
+
+    The handler only flags the request; the watcher thread reads the file on
+    its next check. File IO and logging in the handler itself could deadlock
+    on locks held by the interrupted code.
+
+    Servers such as gunicorn use SIGHUP themselves, so an existing handler is
+    left in place and nothing is installed, unless ``chain=True``: then the
+    reload handler is installed over it and calls it after flagging the
+    reload. A handler installed outside Python cannot be chained and is
+    always kept. Installing again (re-init) only points the handler at the
+    new watcher.
+
+    Signal handlers can only be installed from the main thread; returns False
+    when that is not possible or another handler was kept.
+    """
+    if signum is None:
+        signum = getattr(signal, "SIGHUP", None)
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        return False
+    previous = signal.getsignal(signum)
+    if isinstance(previous, _ReloadSignalHandler):
+        previous.watcher = watcher
+        return True
+    # None is a handler installed outside Python, which cannot be chained
+    if previous is None or (previous not in (signal.SIG_DFL, signal.SIG_IGN) and not chain):
+        logger.info("Ward: signal %s already has a handler; not installing policy reload", signum)
+        return False
+    signal.signal(signum, _ReloadSignalHandler(watcher, previous))
+    return True
@@ -1,6 +1,7 @@
 """
 LLM pricing data for cost tracking.
-Prices are per 1M tokens as (input_cost, output_cost).
+Prices are per 1M tokens as (input_cost, output_cost), except image
+generation which is priced per image by quality and size.
 """
 
 OPENAI_PRICING = {
@@ -35,21 +36,60 @@ ANTHROPIC_PRICING = {
     "claude-3-5-haiku-20241022": (1.00, 5.00),
 }
 
+# USD per image: {model: {quality: {size: price}}}
+OPENAI_IMAGE_PRICING = {
+    "dall-e-2": {
+        "standard": {"256x256": 0.016, "512x512": 0.018, "1024x1024": 0.020},
+    },
+    "dall-e-3": {
+        "standard": {"1024x1024": 0.040, "1024x1792": 0.080, "1792x1024": 0.080},
+        "hd": {"1024x1024": 0.080, "1024x1792": 0.120, "1792x1024": 0.120},
+    },
+    "gpt-image-1": {
+        "low": {"1024x1024": 0.011, "1024x1536": 0.016, "1536x1024": 0.016},
+        "medium": {"1024x1024": 0.042, "1024x1536": 0.063, "1536x1024": 0.063},
+        "high": {"1024x1024": 0.167, "1024x1536": 0.250, "1536x1024": 0.250},
+    },
+}
+
 _ALL_PRICING = {
     "openai": OPENAI_PRICING,
     "anthropic": ANTHROPIC_PRICING,
 }
 
+# Discount on both input and output tokens for requests sent through the
+# provider's batch API (OpenAI Batch API, Anthropic Message Batches)
+BATCH_DISCOUNT = {
+    "openai": 0.50,
+    "anthropic": 0.50,
+}
 
-def calculate_cost(model, input_tokens, output_tokens, provider="openai"):
+
+def calculate_cost(model, input_tokens, output_tokens, provider="openai", batch=False):
     """
     Calculate the cost of an LLM API call.
 
-    Returns the cost in USD, or None if the model isn't in the pricing table.
+    With ``batch=True`` the provider's batch discount is applied. Returns the
+    cost in USD, or None if the model isn't in the pricing table.
     """
     pricing = _ALL_PRICING.get(provider, {})
     if model not in pricing:
         return None
     input_rate, output_rate = pricing[model]
     cost = (input_tokens * input_rate + output_tokens * output_rate) / 1_000_000
+    if batch:
+        cost *= 1 - BATCH_DISCOUNT.get(provider, 0.0)
     return round(cost, 6)
+
+
+def calculate_image_cost(model, size, quality, count):
+    """
+    Calculate the cost of an image generation request.
+
+    Returns the cost in USD, or None if the model, quality or size isn't in
+    the pricing table.
+    """
+    price = OPENAI_IMAGE_PRICING.get(model, {}).get(quality, {}).get(size)
+    if price is None:
+        return None
+    return round(price * count, 6)
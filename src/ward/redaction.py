@@ -0,0 +1,249 @@
+"""
+Redaction of captured prompt and response content.
+
+A Redactor replaces personal data and secrets in captured text before it
+leaves the host. Built-in rules cover email addresses, phone numbers, API
+keys and card numbers (Luhn-checked); custom rules add more.
+
+Built-in rules are compiled into one combined matcher, but it is not run
+over the whole text: Python's regex engine would try every rule at every
+word. Each built-in rule has an anchor that is cheap to find (an ``@``, a
+key prefix such as ``sk-``, a run of digits), and the matcher only runs in
+a small window around each anchor. Text with nothing to redact costs a few
+substring searches. Custom rules have no anchors; they are compiled into a
+second combined matcher that scans the whole text once.
+
+    from ward.redaction import RedactionRule, Redactor
+
+    ward.init(redactor=Redactor(rules=[RedactionRule("ticket", r"\\bTCK-\\d{6}\\b")]))
+
+By default redaction runs inline, where content is captured. With
+``defer=True`` it runs on the export thread instead (see
+ward.otel.exporters.RedactingSpanExporter), so application threads never
+pay for it; raw content then lives in process memory until the span is
+exported. The redacting exporter is built with the provider by the first
+ward.init(); when a later init() asks for deferral and none exists,
+redaction runs inline instead. Deferred redaction sees content after size limits are applied, so
+a match cut in half by a limit may no longer be recognised.
+
+Rule patterns are joined with ``|`` and must not use numbered back
+references or global inline flags (use scoped flags like ``(?i:...)``).
+"""
+
+import re
+from typing import Iterable, Optional
+
+from ward.conventions import SemanticConventions
+
+
+def _luhn_valid(number: str) -> bool:
+    digits = [int(c) for c in number if c.isdigit()]
+    checksum = 0
+    for i, digit in enumerate(reversed(digits)):
+        if i % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        checksum += digit
+    return checksum % 10 == 0
+
+
+class RedactionRule:
+    """
+    One named pattern to redact.
+
+    ``replacement`` defaults to ``[REDACTED:<name>]``. ``validate``, if
+    given, is called with the matched text; matches it rejects are kept.
+    """
+
+    __slots__ = ("name", "pattern", "replacement", "validate")
+
+    def __init__(self, name: str, pattern, replacement: Optional[str] = None, validate=None):
+        self.name = name
+        self.pattern = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+        self.replacement = replacement if replacement is not None else f"[REDACTED:{name}]"
+        self.validate = validate
+
+
+# Each pattern is anchored with a look-behind so a failed match is not retried
+# at every character of a long token (which would be quadratic).
+BUILTIN_RULES = {
+    "email": RedactionRule(
+        "email",
+        r"(?<![\w.%+-])[\w.%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}",
+    ),
+    "api_key": RedactionRule(
+        "api_key",
+        r"(?<![\w-])(?:sk-(?:proj-|ant-)?[\w-]{20,}|(?:sk|pk|rk)_(?:live|test)_[A-Za-z0-9]{16,}"
+        r"|AKIA[0-9A-Z]{16}|gh[pousr]_[A-Za-z0-9]{36,}|xox[abprs]-[A-Za-z0-9-]{10,}|AIza[\w-]{35})",
+    ),
+    "card_number": RedactionRule(
+        "card_number",
+        r"(?<![0-9-])(?:[0-9][ -]?){12,18}[0-9](?![0-9-])",
+        validate=_luhn_valid,
+    ),
+    "phone": RedactionRule(
+        "phone",
+        r"(?<![\w+])(?:\+[0-9]{1,3}(?:[ .-]?[0-9]{2,4}){2,5}"
+        r"|(?:\([0-9]{3}\)[ .-]?|[0-9]{3}[ .-])[0-9]{3}[ .-][0-9]{4})(?!\w)",
+    ),
+}
+
+# Anchors: every built-in match contains one, and they are cheap to find.
+# API keys: (literal, offset of the key start). "k_" covers sk_, pk_ and rk_;
+# fewer, shorter literals mean fewer passes over the text.
+_KEY_ANCHORS = (("sk-", 0), ("k_", -1), ("AKIA", 0), ("AIza", 0), ("gh", 0), ("xox", 0))
+# 5+ ASCII digits; phone and card numbers have more. [0-9] scans twice as fast as \d.
+_DIGIT_RUN = re.compile(r"[0-9](?:[ ().-]{0,2}[0-9]){4,}")
+_MAX_LOCAL_PART = 256
+
+# Attribute keys (or key prefixes) that hold captured content
+CONTENT_ATTRIBUTE_PREFIXES = (
+    SemanticConventions.GEN_AI_USER_MESSAGE,
+    SemanticConventions.GEN_AI_SYSTEM_MESSAGE,
+    SemanticConventions.GEN_AI_ASSISTANT_MESSAGE,
+    SemanticConventions.GEN_AI_TOOL_MESSAGE,
+    SemanticConventions.GEN_AI_TOOL_ARGS,
+    SemanticConventions.GEN_AI_CONTENT_PROMPT,
+    SemanticConventions.GEN_AI_CONTENT_COMPLETION,
+    SemanticConventions.GEN_AI_OUTPUT_MESSAGES,
+)
+
+
+class Redactor:
+    """
+    Replace matches of the enabled rules in captured content.
+
+    ``rules`` are custom RedactionRules, applied before the built-in ones.
+    ``builtin`` names the built-in rules to enable (all by default; pass
+    ``()`` for none).
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[RedactionRule] = (),
+        builtin: Iterable[str] = tuple(BUILTIN_RULES),
+        defer: bool = False,
+    ):
+        custom = list(rules)
+        names = list(builtin)
+        for name in names:
+            if name not in BUILTIN_RULES:
+                raise ValueError(f"Unknown built-in redaction rule {name!r}; expected one of {sorted(BUILTIN_RULES)}")
+        self.rules = tuple(custom + [BUILTIN_RULES[name] for name in names])
+        self.defer = defer
+        self._custom = _Matcher(custom) if custom else None
+        self._builtin = _Matcher([BUILTIN_RULES[name] for name in names]) if names else None
+
+        self._email = "email" in names
+        self._key_anchors = _KEY_ANCHORS if "api_key" in names else ()
+        self._digit_runs = "card_number" in names or "phone" in names
+
+    def redact(self, text: str) -> str:
+        """Return ``text`` with every match replaced."""
+        if not text:
+            return text
+        if self._custom is not None:
+            text = self._custom.pattern.sub(self._custom.replace, text)
+        if self._builtin is not None:
+            candidates = self._candidates(text)
+            if candidates:
+                text = self._builtin.redact_candidates(text, candidates)
+        return text
+
+    def _candidates(self, text):
+        """
+        (start, stop) regions where a built-in match can begin, in text order.
+
+        ``stop=None`` means a match can only begin exactly at ``start``.
+        """
+        candidates = []
+        if self._email:
+            index = text.find("@")
+            while index != -1:
+                # An address starts where the run of local-part characters does
+                start = index
+                floor = max(0, index - _MAX_LOCAL_PART)
+                while start > floor and (text[start - 1].isalnum() or text[start - 1] in "._%+-"):
+                    start -= 1
+                if start < index:
+                    candidates.append((start, None))
+                index = text.find("@", index + 1)
+        for literal, offset in self._key_anchors:
+            index = text.find(literal)
+            while index != -1:
+                if index + offset >= 0:
+                    candidates.append((index + offset, None))
+                index = text.find(literal, index + 1)
+        if self._digit_runs:
+            # One character either side: a leading "+" or "(", a trailing look-ahead
+            for match in _DIGIT_RUN.finditer(text):
+                candidates.append((max(0, match.start() - 1), match.end() + 1))
+        candidates.sort(key=lambda candidate: candidate[0])
+        return candidates
+
+    def redact_attributes(self, attributes) -> Optional[dict]:
+        """
+        Redact the content attributes in ``attributes``.
+
+        Returns a new dict when anything changed, None otherwise.
+        """
+        redacted = None
+        for key, value in attributes.items():
+            if not key.startswith(CONTENT_ATTRIBUTE_PREFIXES):
+                continue
+            if isinstance(value, str):
+                new_value = self.redact(value)
+                changed = new_value != value
+            elif isinstance(value, (list, tuple)) and value and isinstance(value[0], str):
+                new_value = tuple(self.redact(item) for item in value)
+                changed = new_value != tuple(value)
+            else:
+                continue
+            if changed:
+                if redacted is None:
+                    redacted = dict(attributes)
+                redacted[key] = new_value
+        return redacted
+
+
+class _Matcher:
+    """Several rules compiled into one alternation."""
+
+    def __init__(self, rules):
+        # Map the outer group of each rule to the rule: match.lastindex is
+        # the outermost group that closed, whatever groups a rule nests.
+        self._by_group = {}
+        parts = []
+        group = 1
+        for rule in rules:
+            self._by_group[group] = rule
+            parts.append(f"({rule.pattern})")
+            group += 1 + re.compile(rule.pattern).groups
+        self.pattern = re.compile("|".join(parts))
+
+    def replace(self, match) -> str:
+        rule = self._by_group[match.lastindex]
+        if rule.validate is not None and not rule.validate(match.group()):
+            return match.group()
+        return rule.replacement
+
+    def redact_candidates(self, text, candidates):
+        """Replace matches beginning in ``candidates``; text in between is copied once."""
+        pattern = self.pattern
+        parts = []
+        last = 0
+        for start, stop in candidates:
+            if stop is None:
+                match = pattern.match(text, start) if start >= last else None
+                matches = (match,) if match is not None else ()
+            else:
+                matches = pattern.finditer(text, max(start, last), stop)
+            for match in matches:
+                parts.append(text[last:match.start()])
+                parts.append(self.replace(match))
+                last = match.end()
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return "".join(parts)